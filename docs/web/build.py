@@ -2,14 +2,18 @@
 Build script for DreamWeb documentation website
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Tell the app it's being built statically (the navbar links pages instead of using events)
+os.environ.setdefault('DREAMWEB_BUILD', '1')
+
 from dreamweb.builder_module.builder import Builder
-from docs_app_static import DocsApp  # Use static version for production build
+from docs_app import DocsApp  # Every page is pre-rendered to its own HTML file
 
 
 def main():
@@ -28,7 +32,7 @@ def main():
     print("📦 Output directory: docs/web/build/")
     print("\n🚀 To deploy:")
     print("   - Upload the build/ directory to your hosting service")
-    print("   - Or serve locally: python -m http.server 8080 --directory build")
+    print("   - Or serve locally: dreamweb serve build --port 8080")
 
 
 if __name__ == "__main__":
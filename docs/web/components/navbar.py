@@ -9,13 +9,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from dreamweb.common import *
 
 
-def create_navbar(current_page, on_navigate):
+def create_navbar(current_page, on_navigate, page_url=None):
     """
     Create navigation bar component
     
     Args:
         current_page: Currently active page name
         on_navigate: Callback function for navigation (receives page name)
+        page_url: Optional function returning a page's URL; renders links instead of buttons
     """
     
     pages = [
@@ -31,6 +32,23 @@ def create_navbar(current_page, on_navigate):
     for page_id, page_name in pages:
         is_active = page_id == current_page
         
+        if page_url:
+            nav_links.append(
+                Link(
+                    text=page_name,
+                    to=page_url(page_id),
+                    color="white" if is_active else "#cbd5e1",
+                    underline=False,
+                    style=f"""
+                        margin: 0 5px;
+                        font-weight: {'bold' if is_active else 'normal'};
+                        border-bottom: {'2px solid #3b82f6' if is_active else '2px solid transparent'};
+                        padding: 10px 15px;
+                    """
+                )
+            )
+            continue
+        
         nav_links.append(
             Button(
                 text=page_name,
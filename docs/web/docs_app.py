@@ -3,6 +3,7 @@ DreamWeb Documentation Website
 Built with DreamWeb itself!
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -22,6 +23,9 @@ from pages.getting_started import create_getting_started_page
 from pages.widgets import create_widgets_page
 
 
+PAGES = ["home", "getting_started", "core_concepts", "widgets", "api_reference", "examples"]
+
+
 class DocsApp(App):
     """DreamWeb Documentation Website Application"""
     
@@ -39,6 +43,17 @@ class DocsApp(App):
         # State for current page
         self.current_page = State("home")
     
+    def static_pages(self):
+        """Pre-render every page to its own HTML file; home is index.html"""
+        return {
+            "index" if page == "home" else page: {"current_page": page}
+            for page in PAGES
+        }
+    
+    def page_url(self, page):
+        """URL of a page in the static build"""
+        return "index.html" if page == "home" else f"{page}.html"
+    
     def navigate_to(self, page):
         """Navigate to a different page"""
         self.current_page.set(page)
@@ -137,7 +152,12 @@ class DocsApp(App):
                 '''),
                 
                 # Navigation Bar
-                create_navbar(self.current_page.value, self.navigate_to),
+                # Static builds have no server to handle clicks, so link between pages
+                create_navbar(
+                    self.current_page.value,
+                    self.navigate_to,
+                    page_url=self.page_url if os.environ.get('DREAMWEB_BUILD') else None,
+                ),
                 
                 # Page Content
                 self.get_page_content(),
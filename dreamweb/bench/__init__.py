@@ -0,0 +1,9 @@
+"""Benchmark suite for DreamWeb"""
+
+from dreamweb.bench.runner import (
+    SUITES, Benchmark, compare, format_results, import_failures, import_times, load_results, write_results,
+)
+from dreamweb.bench.trees import SyntheticApp
+
+__all__ = ["Benchmark", "SUITES", "SyntheticApp", "compare", "format_results", "import_failures",
+           "import_times", "load_results", "write_results"]
@@ -0,0 +1,261 @@
+"""
+Benchmark runner for DreamWeb
+
+Micro benchmarks time the pieces of a render: building widgets,
+converting them to dicts, JSON encoding and event dispatch. Macro
+benchmarks time whole production builds, cold and incremental. The
+imports suite measures `python -X importtime` for cold processes.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from dreamweb.bench.trees import SyntheticApp
+
+
+SUITES = ('micro', 'macro', 'imports')
+
+# Statements timed by the imports suite, each in a fresh interpreter
+IMPORT_SCENARIOS = {
+    'import_dreamweb': 'import dreamweb',
+    'import_common': 'from dreamweb.common import *',
+    'import_build': ('from dreamweb import App\n'
+                     'from dreamweb.common import *\n'
+                     'from dreamweb.builder_module import Builder'),
+}
+
+# Modules only the dev server needs; a build-only process must not import them
+SERVER_STACK = ('asyncio', 'websockets', 'watchdog')
+
+
+def _measure(fn: Callable[[], Any], repeat: int, warmup: int = 1,
+             setup: Optional[Callable[[], None]] = None) -> List[float]:
+    """Wall times in seconds of repeat calls to fn, after warmup calls"""
+    times = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            times.append(elapsed)
+    return times
+
+
+def _summary(times: List[float], per: int = 1) -> Dict[str, Any]:
+    """Timing statistics in milliseconds, per operation when a run does `per` of them"""
+    scaled = [t * 1000 / per for t in times]
+    return {
+        'repeat': len(times),
+        'ops_per_run': per,
+        'min_ms': round(min(scaled), 6),
+        'median_ms': round(statistics.median(scaled), 6),
+        'mean_ms': round(statistics.fmean(scaled), 6),
+        'stdev_ms': round(statistics.stdev(scaled), 6) if len(scaled) > 1 else 0.0,
+    }
+
+
+class Benchmark:
+    """Run the benchmark suites against one synthetic app"""
+
+    def __init__(self, nodes: int = 1000, depth: int = 8, handler_density: float = 0.2,
+                 seed: int = 0, repeat: int = 10, suites=SUITES):
+        unknown = set(suites) - set(SUITES)
+        if unknown:
+            raise ValueError(f"Unknown suites {', '.join(sorted(unknown))}; expected {', '.join(SUITES)}")
+        self.params = {
+            'nodes': nodes,
+            'depth': depth,
+            'handler_density': handler_density,
+            'seed': seed,
+            'repeat': repeat,
+        }
+        self.repeat = repeat
+        self.suites = tuple(suites)
+        self.app = SyntheticApp(nodes=nodes, depth=depth, handler_density=handler_density, seed=seed)
+
+    def run(self, progress: Callable[[str], None] = lambda name: None) -> Dict[str, Any]:
+        results: Dict[str, Dict[str, Any]] = {}
+        for suite in self.suites:
+            for name, bench in getattr(self, f"_{suite}")():
+                progress(name)
+                results[name] = bench()
+        return {'meta': self.metadata(), 'results': results}
+
+    def metadata(self) -> Dict[str, Any]:
+        from dreamweb import __version__
+
+        widget = self.app.build()
+        tree = self.app._widget_to_dict(widget)
+        return {
+            'dreamweb': __version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'params': self.params,
+            'tree': {
+                'nodes': _count(tree),
+                'handlers': len(self.app._event_handlers),
+                'json_bytes': len(json.dumps(tree, separators=(',', ':'))),
+            },
+        }
+
+    def _micro(self):
+        app = self.app
+        widget = app.build()
+        tree = app._widget_to_dict(widget)
+        handlers = list(app._event_handlers)
+
+        def widget_to_dict():
+            app._event_handlers = {}
+            app._widget_to_dict(widget)
+
+        def dispatch():
+            for handler_id in handlers:
+                app._handle_event(handler_id, None)
+
+        yield 'widget_construction', lambda: _summary(_measure(app.build, self.repeat))
+        yield 'widget_to_dict', lambda: _summary(_measure(widget_to_dict, self.repeat))
+        yield 'json_encode', lambda: _summary(_measure(
+            lambda: json.dumps(tree, separators=(',', ':')), self.repeat))
+        # Re-register the handlers widget_to_dict cleared, then time dispatch per event
+        app._event_handlers = {}
+        app._widget_to_dict(widget)
+        if handlers:
+            yield 'handle_event', lambda: _summary(_measure(dispatch, self.repeat), per=len(handlers))
+
+    def _macro(self):
+        from dreamweb.builder_module import Builder
+        from dreamweb.builder_module.budgets import BUDGET_KEYS
+
+        # Size budgets from the surrounding project's pyproject.toml don't apply here
+        no_budgets = dict.fromkeys(BUDGET_KEYS)
+        output = tempfile.mkdtemp(prefix='dreamweb-bench-')
+
+        def build():
+            # Keep the builder's progress lines out of the results
+            with contextlib.redirect_stdout(io.StringIO()):
+                Builder(self.app, output_dir=output, workers=1, budgets=no_budgets).build()
+
+        def clean():
+            shutil.rmtree(output, ignore_errors=True)
+
+        try:
+            yield 'build_cold', lambda: _summary(_measure(build, self.repeat, setup=clean))
+            # Every artifact is cached, so this is the floor for a rebuild
+            yield 'build_incremental', lambda: _summary(_measure(build, self.repeat))
+        finally:
+            clean()
+
+    def _imports(self):
+        # Modules the interpreter imports at startup aren't DreamWeb's cost
+        startup = set(import_times('pass'))
+
+        def bench(statement):
+            runs = []
+            for i in range(self.repeat + 1):
+                times = import_times(statement)
+                if i:
+                    runs.append(times)
+            added = [{name: t for name, t in times.items() if name not in startup} for times in runs]
+            result = _summary([sum(times.values()) / 1e6 for times in added])
+            result['modules'] = len(added[-1])
+            result['server_stack'] = sorted(name for name in added[-1] if name.split('.')[0] in SERVER_STACK)
+            return result
+
+        for name, statement in IMPORT_SCENARIOS.items():
+            yield name, lambda statement=statement: bench(statement)
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Self import time in microseconds of every module a statement imports"""
+    import dreamweb
+
+    env = os.environ.copy()
+    # The child must import this copy of DreamWeb, installed or not
+    package_root = os.path.dirname(os.path.dirname(dreamweb.__file__))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        own, _, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(own)
+    return times
+
+
+def _count(tree: Dict[str, Any]) -> int:
+    return 1 + sum(_count(child) for child in tree.get('children') or [] if isinstance(child, dict))
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Lines comparing the median times of two result files"""
+    lines = []
+    for name, result in current['results'].items():
+        before = baseline.get('results', {}).get(name)
+        if not before:
+            continue
+        ratio = result['median_ms'] / before['median_ms'] if before['median_ms'] else float('inf')
+        marker = '🔺' if ratio > 1.05 else '🔻' if ratio < 0.95 else '  '
+        lines.append(f"   {marker} {name:<22} {before['median_ms']:10.4f} ms → "
+                     f"{result['median_ms']:10.4f} ms  ({ratio:.2f}x)")
+    return lines
+
+
+def format_results(data: Dict[str, Any]) -> str:
+    meta = data['meta']
+    tree = meta['tree']
+    lines = [
+        f"📊 DreamWeb {meta['dreamweb']} on Python {meta['python']} ({meta['platform']})",
+        f"   Tree: {tree['nodes']} nodes, {tree['handlers']} handlers, {tree['json_bytes'] / 1024:.1f} KB JSON",
+    ]
+    for name, result in data['results'].items():
+        per = ' per event' if result['ops_per_run'] > 1 else ''
+        lines.append(f"   {name:<22} median {result['median_ms']:10.4f} ms  "
+                     f"min {result['min_ms']:10.4f} ms  ±{result['stdev_ms']:.3f}{per}")
+        if result.get('server_stack'):
+            lines.append(f"   ⚠️  {name} imports the dev server stack: {', '.join(result['server_stack'])}")
+    return '\n'.join(lines)
+
+
+def import_failures(data: Dict[str, Any], max_import_ms: Optional[float] = None) -> List[str]:
+    """Ways the build-only import missed its budget"""
+    result = data['results'].get('import_build')
+    if not result:
+        return []
+    failures = []
+    if result['server_stack']:
+        failures.append(f"A build-only process imports {', '.join(result['server_stack'])}")
+    if max_import_ms is not None and result['median_ms'] > max_import_ms:
+        failures.append(f"Build-only imports take {result['median_ms']:.1f} ms, "
+                        f"budget {max_import_ms:g} ms")
+    return failures
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_results(data: Dict[str, Any], path: str):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
@@ -0,0 +1,71 @@
+"""
+Synthetic widget trees for benchmarking
+
+Trees are generated from a seed, so the same parameters always give the
+same tree on every machine and version.
+"""
+
+import random
+from typing import List
+
+from dreamweb.core import App, State, Widget
+from dreamweb.widgets import Button, Checkbox, Column, Container, Heading, Row, Text, TextField
+
+
+class SyntheticApp(App):
+    """An app whose build() returns a generated tree
+
+    Parameters:
+        nodes: Approximate number of widgets in the tree
+        depth: Maximum nesting depth of layout widgets
+        handler_density: Fraction of leaves that are interactive widgets with handlers
+        seed: Seed for the tree's shape and content
+    """
+
+    def __init__(self, nodes: int = 1000, depth: int = 8, handler_density: float = 0.2, seed: int = 0):
+        super().__init__(title="DreamWeb Benchmark")
+        self.nodes = nodes
+        self.depth = depth
+        self.handler_density = handler_density
+        self.seed = seed
+        self.clicks = State(0)
+
+    def build(self) -> Widget:
+        rng = random.Random(self.seed)
+        budget = [max(self.nodes - 1, 0)]
+        return Container(padding=16, children=self._children(rng, 1, budget))
+
+    def _children(self, rng: random.Random, level: int, budget: List[int]) -> List[Widget]:
+        children = []
+        width = rng.randint(2, 6)
+        while budget[0] > 0 and len(children) < width:
+            budget[0] -= 1
+            if level < self.depth and rng.random() < 0.35:
+                layout = rng.choice((Column, Row, Container))
+                children.append(layout(children=self._children(rng, level + 1, budget)))
+            else:
+                children.append(self._leaf(rng))
+        # Spend what's left at the top level so trees reach the requested size
+        while level == 1 and budget[0] > 0:
+            budget[0] -= 1
+            children.append(Column(children=self._children(rng, level + 1, budget)))
+        return children
+
+    def _leaf(self, rng: random.Random) -> Widget:
+        n = rng.randrange(1_000_000)
+        if rng.random() < self.handler_density:
+            kind = rng.randrange(3)
+            if kind == 0:
+                return Button(text=f"Button {n}", on_click=self.increment)
+            if kind == 1:
+                return TextField(placeholder=f"Field {n}", on_change=self.changed)
+            return Checkbox(label=f"Option {n}", on_change=self.changed)
+        if rng.random() < 0.1:
+            return Heading(f"Section {n}", level=rng.randint(1, 4))
+        return Text(f"Item {n} " + "lorem ipsum " * rng.randint(0, 4), size=rng.choice(("sm", "md", "lg")))
+
+    def increment(self):
+        self.clicks.set(self.clicks.value + 1)
+
+    def changed(self, value):
+        pass
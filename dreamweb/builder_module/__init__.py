@@ -1,5 +1,6 @@
 """Builder module for DreamWeb"""
 
+from dreamweb.builder_module.budgets import BudgetExceededError
 from dreamweb.builder_module.builder import Builder
 
-__all__ = ["Builder"]
+__all__ = ["Builder", "BudgetExceededError"]
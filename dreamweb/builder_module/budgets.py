@@ -0,0 +1,152 @@
+"""
+Bundle size budgets for DreamWeb builds
+
+Budgets come from the project's pyproject.toml:
+
+    [tool.dreamweb.budgets]
+    html = "50 KB"      # largest HTML page
+    js = "30 KB"        # runtime bundle
+    tree = "100 KB"     # largest page's tree JSON
+    gzip = "40 KB"      # gzipped HTML + runtime + tree data of a page
+
+or from Builder(budgets={...}), which takes precedence. Sizes are bytes
+or strings with a B/KB/MB suffix.
+"""
+
+import gzip
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from dreamweb.builder_module.pages import data_name
+from dreamweb.builder_module.profile import SizeBreakdown
+
+
+BUDGET_KEYS = ('html', 'js', 'tree', 'gzip')
+
+_UNITS = {'': 1, 'b': 1, 'kb': 1024, 'k': 1024, 'mb': 1024 * 1024, 'm': 1024 * 1024}
+_SIZE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([a-z]*)\s*$', re.I)
+
+
+class BudgetExceededError(Exception):
+    """Raised when a build's output is larger than its size budgets allow"""
+
+    def __init__(self, failures: List[str]):
+        self.failures = failures
+        super().__init__("Bundle size budget exceeded:\n" + '\n'.join(failures))
+
+
+def parse_size(value: Union[int, float, str]) -> int:
+    """50000, "50 KB" or "1.5MB" -> bytes"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _SIZE.match(value)
+    if not match or match.group(2).lower() not in _UNITS:
+        raise ValueError(f"Invalid size {value!r}; use bytes or a number with B, KB or MB")
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+def _load_toml(path: Path) -> Dict[str, Any]:
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            print(f"⚠️  Install tomli to read size budgets from {path}")
+            return {}
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+def find_pyproject(start: Optional[Path] = None) -> Optional[Path]:
+    """The nearest pyproject.toml at or above start (default: the working directory)"""
+    directory = (start or Path.cwd()).resolve()
+    for candidate in (directory, *directory.parents):
+        path = candidate / 'pyproject.toml'
+        if path.is_file():
+            return path
+    return None
+
+
+def load_budgets(overrides: Optional[Dict[str, Any]] = None,
+                 start: Optional[Path] = None) -> Dict[str, int]:
+    """Merge pyproject.toml budgets with constructor overrides, in bytes"""
+    budgets: Dict[str, Any] = {}
+    path = find_pyproject(start)
+    if path:
+        config = _load_toml(path).get('tool', {}).get('dreamweb', {})
+        budgets.update(config.get('budgets', {}))
+    budgets.update(overrides or {})
+
+    unknown = set(budgets) - set(BUDGET_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown size budgets {', '.join(sorted(unknown))}; "
+                         f"expected {', '.join(BUDGET_KEYS)}")
+    return {key: parse_size(value) for key, value in budgets.items() if value is not None}
+
+
+def gzip_size(path: Path) -> int:
+    """Transfer size of a file, using its .gz sibling when the build wrote one"""
+    compressed = path.with_name(path.name + '.gz')
+    if compressed.exists():
+        return compressed.stat().st_size
+    return len(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def _subtrees(breakdown: SizeBreakdown, limit: int = 5) -> List[str]:
+    lines = []
+    for subtree in breakdown.largest_subtrees(limit):
+        lines.append(f"      {_kb(subtree.size):>10}  {subtree.path}")
+    for name, size, count in breakdown.largest_types(3):
+        lines.append(f"      {_kb(size):>10}  all {name} widgets (x{count})")
+    return lines
+
+
+def check_budgets(budgets: Dict[str, int], output_dir: Path, pages: List[Any],
+                  files: Dict[str, str], types: List[str]):
+    """Raise BudgetExceededError listing every budget the build went over
+
+    pages are the builder's rendered pages; files maps logical artifact
+    names (index.html, dreamweb.js, tree.json, ...) to the files written.
+    """
+    failures = []
+    js_file = output_dir / files['dreamweb.js']
+    js_size = js_file.stat().st_size
+
+    if 'js' in budgets and js_size > budgets['js']:
+        failures.append(f"  js: {files['dreamweb.js']} is {_kb(js_size)}, budget {_kb(budgets['js'])}")
+        failures.append(f"      bundles renderers for {', '.join(sorted(types))}")
+
+    js_gzip = gzip_size(js_file) if 'gzip' in budgets else 0
+    for page in pages:
+        breakdown = SizeBreakdown()
+        breakdown.add_tree(page.tree)
+        html_size = (output_dir / files[page.file]).stat().st_size
+
+        if 'html' in budgets and html_size > budgets['html']:
+            failures.append(f"  html: {page.file} is {_kb(html_size)}, budget {_kb(budgets['html'])}")
+            failures.extend(_subtrees(breakdown))
+
+        if 'tree' in budgets and breakdown.total > budgets['tree']:
+            failures.append(f"  tree: {page.file} has {_kb(breakdown.total)} of tree JSON, "
+                            f"budget {_kb(budgets['tree'])}")
+            failures.extend(_subtrees(breakdown))
+
+        if 'gzip' in budgets:
+            total = gzip_size(output_dir / files[page.file]) + js_gzip
+            data = files.get(data_name(page.file))
+            if data:
+                total += gzip_size(output_dir / data)
+            if total > budgets['gzip']:
+                failures.append(f"  gzip: {page.file} transfers {_kb(total)} gzipped "
+                                f"(runtime {_kb(js_gzip)}), budget {_kb(budgets['gzip'])}")
+                failures.extend(_subtrees(breakdown))
+
+    if failures:
+        raise BudgetExceededError(failures)
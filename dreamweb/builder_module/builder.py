@@ -5,43 +5,319 @@ Compiles Python app to optimized HTML/JS
 
 import os
 import json
-import shutil
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from dreamweb.builder_module.budgets import BudgetExceededError, check_budgets, load_budgets
+from dreamweb.builder_module.cache import (
+    AtomicStream, BuildCache, cache_path, hash_bytes, hash_chunks, hash_json,
+)
+from dreamweb.builder_module.compress import compressible, gzip_file
+from dreamweb.builder_module.pages import Page, data_name, render_pages
+from dreamweb.builder_module.profile import BuildProfiler
+from dreamweb.builder_module.service_worker import REGISTRATION_SNIPPET, SERVICE_WORKER, render_service_worker
+from dreamweb.builder_module.treeshake import (
+    bundle_modules, declared_features, read_module, shake, used_features,
+)
+from dreamweb.core.state import State
 
 if TYPE_CHECKING:
     from dreamweb.core import App
 
 
+RUNTIME_PATH = Path(__file__).parent.parent / 'runtime' / 'runtime.js'
+
+# Page data ships apart from the runtime so content changes don't invalidate it
+TREE_DATA_MODES = ('inline', 'external')
+TREE_DATA_ID = 'dreamweb-data'
+
+# Maps logical asset names to their content-hashed files
+ASSET_MANIFEST = 'manifest.json'
+HASH_LENGTH = 8
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def _app_dir(app: 'App') -> Optional[Path]:
+    """Directory of the file defining the app's class"""
+    module = sys.modules.get(type(app).__module__)
+    file = getattr(module, '__file__', None)
+    return Path(file).resolve().parent if file else None
+
+
+def hashed_name(name: str, output_hash: str) -> str:
+    """dreamweb.js -> dreamweb.3f9a1c2e.js"""
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        return f"{name}.{output_hash[:HASH_LENGTH]}"
+    return f"{stem}.{output_hash[:HASH_LENGTH]}.{ext}"
+
+
+_TREE_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+def encode_tree(tree) -> Iterator[str]:
+    """Compact tree JSON in chunks, so it never exists as a single string"""
+    return _TREE_ENCODER.iterencode(tree)
+
+
+def inline_json(chunks: Iterable[str]) -> Iterator[str]:
+    """Make JSON safe inside a <script> element; '<' can't start a tag there"""
+    for chunk in chunks:
+        yield chunk.replace('<', '\\u003c')
+
+
+@lru_cache(maxsize=None)
+def _builder_fingerprint() -> str:
+    """Hash of the builder's own code, so template changes invalidate the cache"""
+    sources = sorted(Path(__file__).parent.glob('*.py'))
+    return hash_bytes(b''.join(path.read_bytes() for path in sources))
+
+
 class Builder:
     """Build production-ready output"""
     
-    def __init__(self, app: 'App', output_dir: str = "build"):
+    def __init__(self, app: 'App', output_dir: str = "build", minify: bool = True,
+                 tree_shake: bool = True, hash_filenames: bool = True,
+                 precompress: bool = True, gzip_threshold: int = 1024,
+                 tree_data: str = "inline", workers: Optional[int] = None,
+                 profile: Optional[bool] = None, service_worker: bool = False,
+                 budgets: Optional[Dict[str, Any]] = None):
+        if tree_data not in TREE_DATA_MODES:
+            raise ValueError(f"tree_data must be one of {', '.join(TREE_DATA_MODES)}, not {tree_data!r}")
         self.app = app
         self.output_dir = Path(output_dir)
+        self.minify = minify
+        self.tree_shake = tree_shake
+        self.hash_filenames = hash_filenames
+        self.precompress = precompress
+        self.gzip_threshold = gzip_threshold
+        self.tree_data = tree_data
+        self.workers = workers
+        self.service_worker = service_worker
+        # Size limits from [tool.dreamweb.budgets] in the app's pyproject.toml, overridden per key
+        self.budgets = load_budgets(budgets, _app_dir(app))
+        # `dreamweb build --profile` runs the app's script, so it arrives via the environment
+        self.profile = bool(os.environ.get('DREAMWEB_PROFILE')) if profile is None else profile
+        self.profiler = None
+        self.cache = None
+        self.assets = {}
+        self.written = []
+        self.skipped = []
     
     def build(self):
         """Build the application for production"""
         print("🔨 Building DreamWeb app...")
         
-        # Create output directory
-        if self.output_dir.exists():
-            shutil.rmtree(self.output_dir)
-        self.output_dir.mkdir(parents=True)
+        # Reuse the output directory; unchanged artifacts are left untouched
+        self.profiler = BuildProfiler()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = BuildCache(self.output_dir, cache_path(self.output_dir, _app_dir(self.app)))
+        self.assets = {}
+        self.written = []
+        self.skipped = []
+        
+        # Generate component trees; apps without static pages get a single index.html
+        variants = self.app.static_pages()
+        with self.profiler.phase('render pages (wall)'):
+            if variants:
+                pages = render_pages(self, variants, self.workers)
+                print(f"📄 Rendered {len(pages)} pages")
+            else:
+                pages = [self.render_page('index.html')]
+        for page in pages:
+            self.profiler.merge(page.timings)
+        
+        # Create dreamweb.js (minified runtime) first; the HTML references its hashed name.
+        # All pages share one runtime covering every widget type they use
+        self.create_js(
+            frozenset().union(*(page.types for page in pages)),
+            frozenset().union(*(page.modules for page in pages)),
+        )
+        
+        for page in pages:
+            # Page data as its own file, unless it's inlined into the HTML
+            if self.tree_data == 'external':
+                self.create_data(page)
+            
+            # Create the page's HTML file
+            self.create_html(page)
         
-        # Generate component tree
-        tree = self.app._widget_to_dict(self.app.build())
+        # Record which hashed file each logical asset name points to
+        if self.hash_filenames:
+            self.create_manifest()
         
-        # Create index.html
-        self.create_html(tree)
+        # Offline support: precache this build's assets and pages
+        if self.service_worker:
+            self.create_service_worker([page.file for page in pages])
         
-        # Create dreamweb.js (minified runtime)
-        self.create_js(tree)
+        # Write .gz siblings so servers never compress on the fly
+        if self.precompress:
+            with self.profiler.phase('compression'):
+                self.compress_outputs()
+        
+        # Fail the build if its output outgrew the size budgets, without
+        # leaving that output behind or recording it in the cache
+        if self.budgets:
+            files = {name: entry['file'] for name, entry in self.cache.entries.items()}
+            types = frozenset().union(*(page.types for page in pages))
+            try:
+                check_budgets(self.budgets, self.output_dir, pages, files, types)
+            except BudgetExceededError:
+                self.cache.discard(self.written)
+                self.cache.save()
+                raise
+            print(f"📏 Within size budgets ({', '.join(sorted(self.budgets))})")
+        
+        # Drop outputs of earlier builds that are no longer produced
+        with self.profiler.phase('disk writes'):
+            self.cache.prune()
+            self.cache.save()
         
         print(f"✅ Build complete!")
         print(f"📦 Output: {self.output_dir.absolute()}")
-        print(f"   - index.html")
-        print(f"   - dreamweb.js")
+        for name in self.written:
+            print(f"   - {name}")
+        for name in self.skipped:
+            print(f"   - {name} (unchanged)")
+        
+        if self.profile:
+            for page in pages:
+                self.profiler.sizes.add_tree(page.tree, page.file if len(pages) > 1 else '')
+            self.profiler.finish(self.cache.entries)
+            print(self.profiler.format())
+    
+    def emit(self, name: str, inputs, render: Callable[[], Union[str, Iterable[str]]],
+             hashed: bool = False, phase: Optional[str] = None) -> str:
+        """Write an artifact unless the cache shows it's already up to date
+        
+        render returns the content as a string or as an iterable of chunks,
+        which are streamed to a temp file and hashed on the way. With
+        hashed=True the file is named after its content hash and added to
+        the asset manifest. Returns the file name written.
+        """
+        input_hash = hash_json([_builder_fingerprint(), inputs])
+        
+        entry = self.cache.lookup(name, input_hash)
+        if entry:
+            self.cache.keep(name, entry)
+            self.skipped.append(entry['file'])
+        else:
+            started = time.perf_counter()
+            with AtomicStream(self.output_dir) as stream:
+                content = render()
+                stream.write_chunks((content,) if isinstance(content, str) else content)
+                output_hash = stream.hash
+                file = hashed_name(name, output_hash) if hashed else name
+                if self.cache.unchanged(name, output_hash) and self.cache.previous[name]['file'] == file:
+                    # Same bytes as last time; keep the file (and its mtime) as is
+                    stream.discard()
+                    self.skipped.append(file)
+                else:
+                    stream.commit(self.output_dir / file)
+                    self.written.append(file)
+            if phase:
+                self.profiler.add(phase, time.perf_counter() - started - stream.write_time)
+            self.profiler.add('disk writes', stream.write_time)
+            self.cache.record(name, input_hash, output_hash, file, stream.size)
+            entry = self.cache.entries[name]
+        
+        if hashed:
+            self.assets[name] = entry['file']
+        return entry['file']
+    
+    def state_value(self, attr: str) -> Any:
+        return self._state(attr).value
+    
+    def _state(self, attr: str) -> State:
+        state = getattr(self.app, attr, None)
+        if not isinstance(state, State):
+            raise ValueError(f"static_pages() sets {attr!r}, which is not a State of {type(self.app).__name__}")
+        return state
+    
+    def render_page(self, file: str, state: Optional[Dict[str, Any]] = None) -> Page:
+        """Build the component tree for one page, after setting its State values"""
+        timings = {}
+        
+        def timed(phase, fn, *args):
+            started = time.perf_counter()
+            result = fn(*args)
+            timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - started
+            return result
+        
+        for attr, value in (state or {}).items():
+            self._state(attr).set(value)
+        
+        # Handlers and bindings only matter to the dev server; don't pile them up across pages
+        self.app._event_handlers = {}
+        self.app._bindings = {}
+        widget = timed('app.build()', self.app.build)
+        tree = timed('_widget_to_dict', self.app._widget_to_dict, widget)
+        self._stabilize_handler_ids(tree)
+        
+        html_parts, css_parts = timed('_extract_html_css', self._extract_html_css, tree)
+        types, modules = used_features(tree)
+        data_hash = timed('tree JSON', hash_chunks, encode_tree(tree))
+        return Page(file, tree, data_hash, html_parts, css_parts, frozenset(types), frozenset(modules), timings)
+    
+    def compress_outputs(self):
+        """Gzip every text artifact above the size threshold, in parallel
+        
+        A .gz sibling is cached against the hash of its source, so it's
+        only recompressed when the source content changes.
+        """
+        jobs = []
+        for name, entry in list(self.cache.entries.items()):
+            if not compressible(entry['file']) or entry['size'] < self.gzip_threshold:
+                continue
+            gz_name = name + '.gz'
+            previous = self.cache.lookup(gz_name, entry['output'])
+            if previous and previous['file'] == entry['file'] + '.gz':
+                self.cache.keep(gz_name, previous)
+                self.skipped.append(previous['file'])
+            else:
+                jobs.append((gz_name, entry))
+        
+        if not jobs:
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # zlib releases the GIL, so threads compress files concurrently
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            results = pool.map(lambda job: gzip_file(self.output_dir / job[1]['file']), jobs)
+            for (gz_name, entry), (size, output_hash) in zip(jobs, results):
+                file = entry['file'] + '.gz'
+                self.cache.record(gz_name, entry['output'], output_hash, file, size)
+                self.written.append(file)
+    
+    def _stabilize_handler_ids(self, tree, mapping=None):
+        """Replace id()-based handler IDs with ones that are the same every build
+        
+        Handler IDs come from id() of the callbacks, so they differ between
+        runs and would otherwise invalidate every cached artifact.
+        """
+        if mapping is None:
+            mapping = {}
+        
+        events = tree.get('events')
+        if events:
+            for name, ref in events.items():
+                key = ref.rsplit('_', 1)[-1]
+                events[name] = mapping.setdefault(key, f"h{len(mapping)}")
+
+        # Bound inputs are named after id() of their State
+        if tree.get('bind'):
+            tree['bind'] = mapping.setdefault(tree['bind'], f"b{len(mapping)}")
+        
+        for child in tree.get('children') or []:
+            if isinstance(child, dict):
+                self._stabilize_handler_ids(child, mapping)
     
     def _extract_html_css(self, tree, html_parts=None, css_parts=None):
         """Recursively extract Html and Css widgets from component tree"""
@@ -77,18 +353,73 @@ class Builder:
         
         return html_parts, css_parts
     
-    def create_html(self, tree):
+    def create_html(self, page: Page):
         """Create production HTML file"""
-        # Extract Html and Css widgets
-        html_parts, css_parts = self._extract_html_css(tree)
-        
+        inputs = {
+            'title': self.app.title,
+            'description': self.app.description,
+            'head_tags': self.app.head_tags,
+            'html': page.html_parts,
+            'css': page.css_parts,
+            'assets': self.assets,
+            'tree': page.data_hash if self.tree_data == 'inline' else None,
+            'service_worker': self.service_worker,
+        }
+        self.emit(page.file, inputs, lambda: self.render_html(page), phase='HTML generation')
+    
+    def asset_url(self, name: str) -> str:
+        """The file a logical asset name resolves to in this build"""
+        return self.assets.get(name, name)
+    
+    def create_manifest(self):
+        """Create manifest.json mapping logical asset names to hashed files"""
+        assets = dict(sorted(self.assets.items()))
+        self.emit(ASSET_MANIFEST, assets, lambda: json.dumps(assets, indent=2) + '\n')
+    
+    def create_data(self, page: Page):
+        """Create the page data file the runtime fetches at startup"""
+        self.emit(data_name(page.file), page.data_hash, lambda: encode_tree(page.tree),
+                  hashed=self.hash_filenames, phase='tree JSON')
+    
+    def create_service_worker(self, page_files):
+        """Create sw.js; its URL stays fixed so browsers notice new deploys"""
+        pages = list(page_files)
+        immutable = list(self.assets.values())
+        if not self.hash_filenames:
+            # Unhashed assets can change in place, so they're revalidated like pages
+            pages.append('dreamweb.js')
+            if self.tree_data == 'external':
+                # Offline loads need each page's tree along with the runtime
+                pages.extend(data_name(file) for file in page_files)
+        self.emit(SERVICE_WORKER, [immutable, pages], lambda: render_service_worker(immutable, pages))
+    
+    def render_data_head(self, page: Page) -> str:
+        if self.tree_data == 'external':
+            # Start fetching the data alongside the runtime instead of after it
+            return f'<link rel="preload" href="{self.asset_url(data_name(page.file))}" as="fetch" crossorigin>'
+        return ''
+    
+    def render_data_body(self, page: Page) -> Iterator[str]:
+        """The script element that hands the tree to the runtime"""
+        if self.tree_data == 'external':
+            url = self.asset_url(data_name(page.file))
+            yield f'<script type="application/json" id="{TREE_DATA_ID}" data-src="{url}"></script>'
+            return
+        yield f'<script type="application/json" id="{TREE_DATA_ID}">'
+        yield from inline_json(encode_tree(page.tree))
+        yield '</script>'
+    
+    def render_html(self, page: Page) -> Iterator[str]:
+        """Render the HTML document, streaming the inline tree data"""
         # Combine extracted CSS
-        custom_css = '\n'.join(css_parts)
+        custom_css = '\n'.join(page.css_parts)
         
         # Combine extracted HTML (will be injected into body)
-        custom_html = '\n'.join(html_parts)
+        custom_html = '\n'.join(page.html_parts)
         
-        html = f"""<!DOCTYPE html>
+        data_head = self.render_data_head(page)
+        
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -96,6 +427,7 @@ class Builder:
     <meta name="description" content="{self.app.description}">
     <title>{self.app.title}</title>
     {chr(10).join(self.app.head_tags)}
+    {data_head}
     <style>
         * {{
             margin: 0;
@@ -117,39 +449,65 @@ class Builder:
 <body>
     {custom_html}
     <div id="app"></div>
-    <script src="dreamweb.js"></script>
+    """
+        yield from self.render_data_body(page)
+        registration = f"\n    {REGISTRATION_SNIPPET}" if self.service_worker else ''
+        yield f"""
+    <script src="{self.asset_url('dreamweb.js')}"></script>{registration}
 </body>
 </html>"""
-        
-        output_file = self.output_dir / "index.html"
-        with open(output_file, 'w') as f:
-            f.write(html)
     
-    def create_js(self, tree):
-        """Create production JavaScript file"""
+    def create_js(self, types: Iterable[str], modules: Iterable[str]):
+        """Create production JavaScript file with the renderers and modules the pages use"""
         # Read runtime.js from new location
-        runtime_path = Path(__file__).parent.parent / 'runtime' / 'runtime.js'
-        with open(runtime_path, 'r') as f:
+        with open(RUNTIME_PATH, 'r') as f:
             runtime_code = f.read()
         
-        # Remove hot reload code for production
-        runtime_code = runtime_code.replace('this.setupHotReload();', '// Hot reload disabled in production')
+        inputs = {
+            'runtime': hash_bytes(runtime_code.encode()),
+            'minify': self.minify,
+            'tree_shake': self.tree_shake,
+            'features': sorted(types),
+            'modules': {module: hash_bytes(read_module(module).encode()) for module in sorted(modules)},
+        }
+        self.emit("dreamweb.js", inputs, lambda: self.render_js(runtime_code, types, modules),
+                  hashed=self.hash_filenames, phase='JS generation')
+    
+    def render_js(self, runtime_code: str, types=(), modules=()) -> str:
+        """Render the runtime bundle; the tree is read from the page at startup"""
+        # Hot reload is never part of a production bundle
+        if self.tree_shake:
+            full_size = len(runtime_code)
+            runtime_code = shake(runtime_code, types)
+            print(f"🌳 Tree-shaken runtime: {_kb(full_size)} → {_kb(len(runtime_code))} "
+                  f"({len(types)} widget types, {len(modules)} modules)")
+        else:
+            runtime_code = shake(runtime_code, declared_features(runtime_code) - {'hot-reload'})
         
-        # Embed component tree
-        tree_json = json.dumps(tree)
+        module_code = bundle_modules(modules)
         
         js_code = f"""{runtime_code}
-
-// Initialize app
+{module_code}
+// Initialize app with the page data from index.html
 (function() {{
-    const componentTree = {tree_json};
+    const data = document.getElementById('{TREE_DATA_ID}');
     const runtime = new DreamWebRuntime(document.getElementById('app'));
-    runtime.init(componentTree);
+    if (data.dataset.src) {{
+        fetch(data.dataset.src)
+            .then(response => response.json())
+            .then(tree => runtime.init(tree));
+    }} else {{
+        runtime.init(JSON.parse(data.textContent));
+    }}
 }})();
 """
         
-        # TODO: Minify JS in production
-        # For now, just write the code
-        output_file = self.output_dir / "dreamweb.js"
-        with open(output_file, 'w') as f:
-            f.write(js_code)
+        if self.minify:
+            # Only needed when the bundle isn't cached; its regexes are slow to compile
+            from dreamweb.builder_module.minify import minify_js
+            minified = minify_js(js_code)
+            print(f"📉 Minified runtime: {_kb(len(js_code))} → {_kb(len(minified))} "
+                  f"(-{100 - len(minified) * 100 // max(len(js_code), 1)}%)")
+            js_code = minified + '\n'
+        
+        return js_code
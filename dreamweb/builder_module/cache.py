@@ -0,0 +1,228 @@
+"""
+Build cache for incremental DreamWeb builds
+Records the input and output hashes of every artifact in the output directory
+
+The manifest lives in the project's .dreamweb-cache directory, not in the
+output directory, so it never ships with a deploy.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+CACHE_DIR = ".dreamweb-cache"
+# Earlier builds kept the manifest in the output directory
+LEGACY_MANIFEST = ".dreamweb-cache.json"
+CACHE_VERSION = 1
+
+# Small chunks (e.g. from JSONEncoder.iterencode) are batched up to this size
+STREAM_BUFFER = 64 * 1024
+
+
+def hash_bytes(data: bytes) -> str:
+    """Content hash used for cache keys and outputs"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_path(output_dir: Path, project_dir: Optional[Path] = None) -> Path:
+    """The manifest file for an output directory, under project_dir (default: the working directory)"""
+    output_dir = Path(output_dir).resolve()
+    # Output directories with the same name in different places get their own manifests
+    key = hashlib.sha256(str(output_dir).encode()).hexdigest()[:12]
+    return (project_dir or Path.cwd()) / CACHE_DIR / f"{output_dir.name}-{key}.json"
+
+
+def hash_json(value: Any) -> str:
+    """Hash a JSON-serializable value independent of dict ordering"""
+    return hash_bytes(json.dumps(value, sort_keys=True, separators=(',', ':')).encode())
+
+
+def hash_chunks(chunks: Iterable[str]) -> str:
+    """Hash streamed text without joining it into one string"""
+    digest = hashlib.sha256()
+    for batch in _batched(chunks):
+        digest.update(batch)
+    return digest.hexdigest()
+
+
+def _batched(chunks: Iterable[str]) -> Iterator[bytes]:
+    pending: List[str] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_BUFFER:
+            yield ''.join(pending).encode('utf-8')
+            pending, size = [], 0
+    if pending:
+        yield ''.join(pending).encode('utf-8')
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = 'wb') -> Iterator:
+    """Open a temp file next to path; it replaces path only if the block succeeds"""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; built sites must be readable by web servers
+        os.chmod(tmp, 0o644)
+        with os.fdopen(fd, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class AtomicStream:
+    """A temp file that's hashed while it's written
+
+    Since the hash is known only once writing is done, the destination is
+    chosen then: commit() renames the file into place and discard() drops
+    it. A stream that's neither committed nor discarded is removed on exit.
+    """
+
+    def __init__(self, directory: Path):
+        fd, self.tmp = tempfile.mkstemp(dir=directory, prefix=".dreamweb-", suffix=".tmp")
+        # mkstemp creates 0600 files; built sites must be readable by web servers
+        os.chmod(self.tmp, 0o644)
+        self.file = os.fdopen(fd, 'wb')
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.write_time = 0.0
+        self.done = False
+
+    def write_chunks(self, chunks: Iterable[str]):
+        for batch in _batched(chunks):
+            self.digest.update(batch)
+            self.size += len(batch)
+            started = time.perf_counter()
+            self.file.write(batch)
+            self.write_time += time.perf_counter() - started
+
+    @property
+    def hash(self) -> str:
+        return self.digest.hexdigest()
+
+    def commit(self, path: Path):
+        started = time.perf_counter()
+        self.file.close()
+        os.replace(self.tmp, path)
+        self.write_time += time.perf_counter() - started
+        self.done = True
+
+    def discard(self):
+        self.file.close()
+        try:
+            os.unlink(self.tmp)
+        except OSError:
+            pass
+        self.done = True
+
+    def __enter__(self) -> 'AtomicStream':
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.done:
+            self.discard()
+
+
+def atomic_write(path: Path, data: bytes):
+    """Write data to path so readers never see a partial file"""
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+class BuildCache:
+    """Manifest of the artifacts in a build output directory"""
+
+    def __init__(self, output_dir: Path, path: Optional[Path] = None):
+        self.output_dir = Path(output_dir)
+        self.path = Path(path) if path else cache_path(self.output_dir)
+        try:
+            (self.output_dir / LEGACY_MANIFEST).unlink()
+        except OSError:
+            pass
+        self.previous: Dict[str, Dict[str, Any]] = self._load()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('artifacts', {})
+
+    def _on_disk(self, entry: Dict[str, Any]) -> bool:
+        try:
+            return (self.output_dir / entry['file']).stat().st_size == entry['size']
+        except (OSError, KeyError):
+            return False
+
+    def lookup(self, name: str, input_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the previous entry if its inputs match and its file is intact"""
+        entry = self.previous.get(name)
+        if entry and entry.get('input') == input_hash and self._on_disk(entry):
+            return entry
+        return None
+
+    def unchanged(self, name: str, output_hash: str) -> bool:
+        """Whether freshly rendered output is identical to what's on disk"""
+        entry = self.previous.get(name)
+        return bool(entry) and entry.get('output') == output_hash and self._on_disk(entry)
+
+    def keep(self, name: str, entry: Dict[str, Any]):
+        """Carry an unchanged artifact over to this build"""
+        self.entries[name] = entry
+
+    def record(self, name: str, input_hash: str, output_hash: str, file: str, size: int):
+        self.entries[name] = {
+            'input': input_hash,
+            'output': output_hash,
+            'file': file,
+            'size': size,
+        }
+
+    def prune(self) -> List[str]:
+        """Delete files written by earlier builds that this build no longer produces"""
+        current = {entry['file'] for entry in self.entries.values()}
+        removed = []
+        for entry in self.previous.values():
+            file = entry.get('file')
+            if file and file not in current:
+                try:
+                    (self.output_dir / file).unlink()
+                    removed.append(file)
+                except OSError:
+                    pass
+        return removed
+
+    def discard(self, files: Iterable[str]):
+        """Delete files this build wrote; the cache falls back to the earlier build's other files"""
+        files = set(files)
+        for file in files:
+            try:
+                (self.output_dir / file).unlink()
+            except OSError:
+                pass
+        self.entries = {name: entry for name, entry in self.previous.items()
+                        if entry.get('file') not in files}
+
+    def save(self):
+        if self.entries == self.previous and self.path.exists():
+            return
+        data = {'version': CACHE_VERSION, 'artifacts': self.entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, json.dumps(data, indent=2, sort_keys=True).encode())
@@ -0,0 +1,29 @@
+"""
+Precompression for DreamWeb build artifacts
+Writes .gz siblings that servers can send as is (nginx gzip_static, etc.)
+"""
+
+import gzip
+from pathlib import Path
+from typing import Tuple
+
+from dreamweb.builder_module.cache import atomic_open, hash_bytes
+
+
+# Text formats worth compressing; images and fonts are already compressed
+COMPRESSIBLE_SUFFIXES = {'.html', '.js', '.mjs', '.css', '.json', '.svg', '.txt', '.xml', '.map'}
+
+
+def compressible(file: str) -> bool:
+    return Path(file).suffix.lower() in COMPRESSIBLE_SUFFIXES
+
+
+def gzip_file(source: Path, level: int = 9) -> Tuple[int, str]:
+    """Write source + '.gz' atomically and return its size and hash"""
+    destination = source.with_name(source.name + '.gz')
+    data = source.read_bytes()
+    # mtime=0 and no file name keep the output identical across builds
+    compressed = gzip.compress(data, compresslevel=level, mtime=0)
+    with atomic_open(destination) as f:
+        f.write(compressed)
+    return len(compressed), hash_bytes(compressed)
@@ -0,0 +1,656 @@
+"""
+Pure-Python JavaScript minifier for DreamWeb production bundles
+
+Strips comments and whitespace and shortens local variable and parameter
+names inside functions. It's written for the DreamWeb runtime rather
+than arbitrary JavaScript, so it stays conservative:
+
+- Property names, object keys, class members and top-level declarations
+  are never renamed, since other scripts and the DOM can reference them.
+- Each reference is resolved to the function, block, loop or catch scope
+  that declares it, and every local declaration gets its own short name,
+  so shadowed names keep pointing where they did. Nothing is renamed in
+  a function that uses eval or with.
+- Line breaks are kept wherever automatic semicolon insertion could
+  depend on them.
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+
+KEYWORDS = {
+    'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger',
+    'default', 'delete', 'do', 'else', 'enum', 'export', 'extends', 'false',
+    'finally', 'for', 'function', 'if', 'implements', 'import', 'in',
+    'instanceof', 'interface', 'let', 'new', 'null', 'of', 'package', 'private',
+    'protected', 'public', 'return', 'static', 'super', 'switch', 'this',
+    'throw', 'true', 'try', 'typeof', 'undefined', 'var', 'void', 'while',
+    'with', 'yield', 'arguments', 'eval', 'async', 'get', 'set', 'NaN',
+    'Infinity',
+}
+
+# Keywords after which a '/' starts a regex rather than a division
+_REGEX_AFTER = {
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+}
+
+# `(` after these opens a condition, not a parameter list
+_CONTROL = {'if', 'for', 'while', 'switch', 'with'}
+
+# Globals a local should never be renamed over, even if declared
+_GLOBALS = {
+    'window', 'document', 'console', 'JSON', 'Math', 'Object', 'Array',
+    'Promise', 'fetch', 'setTimeout', 'clearTimeout', 'Error', 'Map', 'Set',
+    'WebSocket', 'module', 'require', 'exports',
+}
+
+_PUNCTUATORS = sorted([
+    '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>', '&&=', '||=', '??=',
+    '=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--', '+=', '-=',
+    '*=', '/=', '%=', '&=', '|=', '^=', '**', '<<', '>>',
+    '{', '}', '(', ')', '[', ']', ';', ',', '<', '>', '+', '-', '*', '/', '%',
+    '&', '|', '^', '!', '~', '?', ':', '=', '.', '@', '#',
+], key=len, reverse=True)
+
+_NAME = re.compile(r'[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*')
+_NUMBER = re.compile(r'0[xXbBoO][0-9a-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?')
+_WORD_CHARS = re.compile(r'[\w$\u0080-\uffff]')
+
+# Tokens that can end / begin a statement; a line break between the two
+# may be a semicolon in disguise, so it's kept
+_END_TYPES = {'name', 'num', 'str', 'regex', 'template'}
+_END_PUNCT = {')', ']', '}', '++', '--'}
+_START_TYPES = {'name', 'num', 'str', 'regex', 'template', 'template_start'}
+_START_PUNCT = {'(', '[', '{', '+', '-', '++', '--', '!', '~'}
+
+# Name roles that refer to a variable
+_RESOLVED_ROLES = {'ref', 'binding', 'shorthand', 'shorthand-ref'}
+
+
+class Token:
+    __slots__ = ('type', 'value', 'nl', 'role', 'unit', 'closes', 'scope', 'binding')
+
+    def __init__(self, type: str, value: str, nl: bool):
+        self.type = type
+        self.value = value
+        # Whether a line break preceded the token in the source
+        self.nl = nl
+        # For names: 'prop', 'key', 'shorthand', 'member', 'ref' or 'binding'
+        self.role = None
+        # Index of the renaming unit (outermost function) the name is in
+        self.unit = None
+        # For '}': the kind of context it closes
+        self.closes = None
+        # For names: the innermost scope around the token, and the scope
+        # declaring the variable it refers to (None for globals)
+        self.scope = None
+        self.binding = None
+
+    def __repr__(self):
+        return f"Token({self.type}, {self.value!r})"
+
+
+class _Tokenizer:
+    def __init__(self, source: str):
+        self.src = source
+        self.pos = 0
+        self.tokens: List[Token] = []
+        # 'brace' for `{`, 'template' for `${`
+        self.braces: List[str] = []
+
+    def _prev(self) -> Optional[Token]:
+        return self.tokens[-1] if self.tokens else None
+
+    def _regex_allowed(self) -> bool:
+        prev = self._prev()
+        if prev is None:
+            return True
+        if prev.type == 'name':
+            return prev.value in _REGEX_AFTER
+        if prev.type == 'punct':
+            return prev.value not in (')', ']', '}')
+        return prev.type in ('template_start', 'template_middle')
+
+    def _scan_string(self, quote: str) -> str:
+        src, i = self.src, self.pos + 1
+        while i < len(src):
+            c = src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == quote:
+                return src[self.pos:i + 1]
+            if c == '\n':
+                break
+            i += 1
+        raise SyntaxError(f"Unterminated string at offset {self.pos}")
+
+    def _scan_template(self, start: int) -> (str, bool):
+        # Returns the raw chunk (including the delimiters) and whether it
+        # ends in a substitution `${`
+        src, i = self.src, start + 1
+        while i < len(src):
+            c = src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '`':
+                return src[start:i + 1], False
+            if c == '$' and src[i + 1:i + 2] == '{':
+                return src[start:i + 2], True
+            i += 1
+        raise SyntaxError(f"Unterminated template literal at offset {start}")
+
+    def _scan_regex(self) -> str:
+        src, i = self.src, self.pos + 1
+        in_class = False
+        while i < len(src):
+            c = src[i]
+            if c == '\\':
+                i += 2
+                continue
+            if c == '\n':
+                break
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                i += 1
+                flags = _NAME.match(src, i)
+                return src[self.pos:flags.end() if flags else i]
+            i += 1
+        raise SyntaxError(f"Unterminated regex at offset {self.pos}")
+
+    def tokenize(self) -> List[Token]:
+        src = self.src
+        nl = False
+        while self.pos < len(src):
+            c = src[self.pos]
+
+            if c in ' \t\r\ufeff\xa0':
+                self.pos += 1
+                continue
+            if c == '\n' or c in '\u2028\u2029':
+                nl = True
+                self.pos += 1
+                continue
+
+            if src.startswith('//', self.pos):
+                end = src.find('\n', self.pos)
+                self.pos = len(src) if end == -1 else end
+                continue
+            if src.startswith('/*', self.pos):
+                end = src.find('*/', self.pos + 2)
+                if end == -1:
+                    raise SyntaxError(f"Unterminated comment at offset {self.pos}")
+                nl = nl or '\n' in src[self.pos:end]
+                self.pos = end + 2
+                continue
+
+            if c in '"\'':
+                token = Token('str', self._scan_string(c), nl)
+            elif c == '`':
+                raw, open_sub = self._scan_template(self.pos)
+                token = Token('template_start' if open_sub else 'template', raw, nl)
+                if open_sub:
+                    self.braces.append('template')
+            elif c == '}' and self.braces and self.braces[-1] == 'template':
+                self.braces.pop()
+                raw, open_sub = self._scan_template(self.pos)
+                token = Token('template_middle' if open_sub else 'template_end', raw, nl)
+                if open_sub:
+                    self.braces.append('template')
+            elif c == '/' and self._regex_allowed():
+                token = Token('regex', self._scan_regex(), nl)
+            else:
+                match = _NAME.match(src, self.pos)
+                if match:
+                    token = Token('name', match.group(), nl)
+                else:
+                    match = _NUMBER.match(src, self.pos)
+                    if match and (c.isdigit() or c == '.' and match.end() > self.pos + 1):
+                        token = Token('num', match.group(), nl)
+                    else:
+                        token = self._punctuator(nl)
+
+            self.pos += len(token.value)
+            self.tokens.append(token)
+            nl = False
+
+        return self.tokens
+
+    def _punctuator(self, nl: bool) -> Token:
+        src = self.src
+        for p in _PUNCTUATORS:
+            if src.startswith(p, self.pos):
+                # `a?.5:b` is a conditional, not optional chaining
+                if p == '?.' and src[self.pos + 2:self.pos + 3].isdigit():
+                    p = '?'
+                if p == '{':
+                    self.braces.append('brace')
+                elif p == '}' and self.braces:
+                    self.braces.pop()
+                return Token('punct', p, nl)
+        raise SyntaxError(f"Unexpected character {src[self.pos]!r} at offset {self.pos}")
+
+
+class _Context:
+    __slots__ = ('kind', 'ternary', 'pattern', 'decl')
+
+    def __init__(self, kind: str, pattern: bool = False, decl: Optional[str] = None):
+        # 'object', 'block', 'class', 'fn', 'method', 'paren', 'params',
+        # 'bracket' or 'template'
+        self.kind = kind
+        self.ternary = 0
+        self.pattern = pattern
+        # For patterns: 'var', 'let', 'const' or 'param'
+        self.decl = decl
+
+
+class _Scope:
+    __slots__ = ('parent', 'function', 'unit', 'end', 'names', 'uncertain')
+
+    def __init__(self, parent: Optional['_Scope'], function: bool, unit: Optional[int], end: int):
+        self.parent = parent
+        # Function scopes hold var declarations; the others are blocks
+        self.function = function
+        self.unit = unit
+        # Index of the scope's last token
+        self.end = end
+        self.names: Set[str] = set()
+        # Set when the scope's extent couldn't be found; its names are
+        # then left alone in the whole unit
+        self.uncertain = False
+
+    def declare(self, tok: Token):
+        self.names.add(tok.value)
+        tok.binding = self
+
+    def function_scope(self) -> '_Scope':
+        scope = self
+        while not scope.function:
+            scope = scope.parent
+        return scope
+
+
+def _match_brackets(tokens: List[Token]) -> Dict[int, int]:
+    """Map each opening bracket's index to its closing bracket's index"""
+    pairs, stack = {}, []
+    for i, tok in enumerate(tokens):
+        if tok.type == 'punct' and tok.value in '([{':
+            stack.append(i)
+        elif tok.type == 'template_start':
+            stack.append(i)
+        elif tok.type == 'template_middle':
+            if stack:
+                pairs[stack.pop()] = i
+            stack.append(i)
+        elif (tok.type == 'punct' and tok.value in ')]}') or tok.type == 'template_end':
+            if stack:
+                pairs[stack.pop()] = i
+    return pairs
+
+
+def _is(tok: Optional[Token], *values: str) -> bool:
+    return tok is not None and tok.type == 'punct' and tok.value in values
+
+
+def _expression_end(tokens: List[Token], pairs: Dict[int, int], start: int) -> int:
+    """Index of the last token of the expression starting at start"""
+    ternary = 0
+    i = start
+    while i < len(tokens):
+        tok = tokens[i]
+        if i > start and tok.nl and _asi_between(tokens[i - 1], tok):
+            break
+        if tok.type in ('template_middle', 'template_end'):
+            break
+        if tok.type == 'template_start':
+            while i in pairs and tokens[i].type != 'template_end':
+                i = pairs[i]
+        elif tok.type == 'punct':
+            if tok.value in (',', ';', ')', ']', '}'):
+                break
+            if tok.value == '?':
+                ternary += 1
+            elif tok.value == ':':
+                if not ternary:
+                    break
+                ternary -= 1
+            elif tok.value in '([{' and i in pairs:
+                i = pairs[i]
+        i += 1
+    return i - 1
+
+
+def _asi_between(a: Token, b: Token) -> bool:
+    """Whether a line break between a and b ends the statement"""
+    if not _may_end(a) or (a.type == 'name' and a.value in _REGEX_AFTER):
+        return False
+    if b.type == 'name':
+        return b.value not in ('in', 'instanceof')
+    return b.type in ('num', 'str') or _is(b, '{', '!', '~', '++', '--')
+
+
+def _analyze(tokens: List[Token]) -> int:
+    """Classify name tokens, assign them to renaming units and resolve scopes
+
+    Returns the number of units found.
+    """
+    pairs = _match_brackets(tokens)
+    stack = [_Context('block')]
+    scopes = [_Scope(None, True, None, len(tokens))]
+    units = 0
+    unit: Optional[int] = None
+    unit_close: Optional[int] = None
+    pending_class = False
+    declaring = False
+    # A named function expression's name, bound inside the function itself
+    pending_name: Optional[Token] = None
+    openers = {close: open_index for open_index, close in pairs.items()}
+    last_closed_paren: Optional[int] = None
+
+    def at(i: int) -> Optional[Token]:
+        return tokens[i] if 0 <= i < len(tokens) else None
+
+    def params_follow(open_index: int) -> Optional[str]:
+        """If the group at open_index is a parameter list, say what follows it"""
+        close = pairs.get(open_index)
+        if close is None:
+            return None
+        after = at(close + 1)
+        if _is(after, '=>'):
+            return 'arrow'
+        opener = at(open_index - 1)
+        if opener is not None and opener.type == 'name' and opener.value == 'catch':
+            return 'catch'
+        if _is(after, '{'):
+            if opener is not None and opener.type == 'name' and opener.value in _CONTROL:
+                return None
+            if stack[-1].kind in ('class', 'object') or opener is not None and (
+                    opener.type == 'name' or _is(opener, ')')):
+                return 'function'
+        return None
+
+    def body_end(body: int) -> int:
+        """Last token of a function body starting at body"""
+        if _is(at(body), '{'):
+            return pairs.get(body, len(tokens))
+        return _expression_end(tokens, pairs, body)
+
+    def open_scope(function: bool, end: int) -> _Scope:
+        scope = _Scope(scopes[-1], function, unit, end)
+        scopes.append(scope)
+        return scope
+
+    for i, tok in enumerate(tokens):
+        while i > scopes[-1].end:
+            scopes.pop()
+        top = stack[-1]
+        prev = at(i - 1)
+        nxt = at(i + 1)
+
+        if tok.type == 'name':
+            decl = None
+            if _is(prev, '.', '?.'):
+                tok.role = 'prop'
+            elif top.kind == 'class':
+                tok.role = 'member'
+            elif top.kind == 'object' and _is(prev, '{', ',') and _is(nxt, ':', '('):
+                tok.role = 'key'
+            elif top.kind == 'object' and _is(prev, '{', ',') and _is(nxt, ',', '}', '='):
+                tok.role = 'shorthand'
+                decl = top.decl
+            elif declaring and prev is not None and prev.type == 'name' and prev.value in ('const', 'let', 'var'):
+                tok.role = 'binding'
+                decl = prev.value
+            elif _is(nxt, '=>') and not _is(prev, '.', '?.'):
+                tok.role = 'binding'
+                decl = 'arrow'
+            elif (top.pattern or top.kind == 'params') and _is(prev, '(', ',', '[', ':', '...', '{') \
+                    and _is(nxt, ',', ')', ']', '}', '='):
+                tok.role = 'binding'
+                decl = top.decl
+            elif prev is not None and prev.type == 'name' and prev.value == 'function':
+                tok.role = 'binding'
+                before = at(i - 3) if getattr(at(i - 2), 'value', None) == 'async' else at(i - 2)
+                decl = 'function' if before is None or _is(before, ';', '{', '}') else 'expression'
+            else:
+                tok.role = 'ref'
+
+            if tok.role == 'shorthand' and not top.pattern:
+                # Object literal shorthand refers to a variable, it doesn't bind one
+                tok.role = 'shorthand-ref'
+                decl = None
+
+            if tok.value == 'class':
+                pending_class = True
+            declaring = tok.value in ('const', 'let', 'var')
+
+            # A single-parameter arrow function opens a unit at its parameter
+            if unit is None and _is(nxt, '=>') and _is(at(i + 2), '{'):
+                unit = units
+                units += 1
+                unit_close = pairs.get(i + 2)
+
+            if decl == 'arrow':
+                open_scope(True, body_end(i + 2)).declare(tok)
+            elif decl == 'var':
+                scopes[-1].function_scope().declare(tok)
+            elif decl in ('let', 'const', 'param', 'function'):
+                scopes[-1].declare(tok)
+            elif decl == 'expression':
+                pending_name = tok
+            tok.scope = scopes[-1]
+            tok.unit = unit
+            continue
+
+        declaring_pattern = declaring and _is(tok, '{', '[')
+        pattern_decl = prev.value if declaring_pattern else top.decl
+        declaring = False
+
+        if tok.type == 'template_start':
+            stack.append(_Context('template'))
+        elif tok.type == 'template_middle':
+            stack.pop()
+            stack.append(_Context('template'))
+        elif tok.type == 'template_end':
+            stack.pop()
+        elif tok.type != 'punct':
+            pass
+        elif tok.value == '(':
+            kind = params_follow(i)
+            if kind is not None:
+                if unit is None and kind != 'arrow' or unit is None and _is(at(pairs[i] + 2), '{'):
+                    unit = units
+                    units += 1
+                    body = pairs[i] + (2 if kind == 'arrow' else 1)
+                    unit_close = pairs.get(body)
+                scope = open_scope(kind != 'catch', body_end(pairs[i] + (2 if kind == 'arrow' else 1)))
+                if pending_name is not None:
+                    scope.declare(pending_name)
+                    pending_name = None
+                stack.append(_Context('params', pattern=True, decl='param'))
+            else:
+                if getattr(prev, 'value', None) == 'for':
+                    # `for (let ...)` bindings belong to the loop
+                    body = pairs.get(i, len(tokens)) + 1
+                    if _is(at(body), '{'):
+                        open_scope(False, pairs.get(body, len(tokens)))
+                    else:
+                        open_scope(False, pairs.get(i, len(tokens))).uncertain = True
+                stack.append(_Context('paren'))
+        elif tok.value == ')':
+            if len(stack) > 1:
+                stack.pop()
+            last_closed_paren = i
+        elif tok.value == '[':
+            pattern = declaring_pattern or (top.pattern and _is(prev, '(', ',', ':', '[', '{', '...'))
+            stack.append(_Context('bracket', pattern=pattern, decl=pattern_decl if pattern else None))
+        elif tok.value == ']':
+            if len(stack) > 1:
+                stack.pop()
+        elif tok.value == '{':
+            if pending_class:
+                kind = 'class'
+                pending_class = False
+            elif top.kind == 'class':
+                kind = 'method'
+            elif _is(prev, '=>'):
+                kind = 'fn'
+            elif _is(prev, ')'):
+                opener = at(openers.get(last_closed_paren, -1) - 1)
+                if opener is not None and opener.type == 'name' and opener.value in _CONTROL | {'catch'}:
+                    kind = 'block'
+                else:
+                    kind = 'fn'
+            elif prev is None or _is(prev, ';', '{', '}'):
+                kind = 'block'
+            elif prev.type == 'name' and prev.value in ('else', 'try', 'finally', 'do'):
+                kind = 'block'
+            elif _is(prev, ':') and getattr(prev, 'role', None) == 'label':
+                kind = 'block'
+            else:
+                kind = 'object'
+            pattern = kind == 'object' and (
+                declaring_pattern or (top.pattern and _is(prev, '(', ',', ':', '[', '{', '...')))
+            stack.append(_Context(kind, pattern=pattern, decl=pattern_decl if pattern else None))
+            end = pairs.get(i, len(tokens))
+            if kind == 'block':
+                open_scope(False, end)
+            elif kind in ('fn', 'method') and scopes[-1].end != end:
+                open_scope(True, end)
+        elif tok.value == '}':
+            if len(stack) > 1:
+                tok.closes = stack.pop().kind
+            if unit is not None and i == unit_close:
+                unit = None
+                unit_close = None
+        elif tok.value == '?':
+            top.ternary += 1
+        elif tok.value == ':':
+            if top.ternary:
+                top.ternary -= 1
+            elif top.kind != 'object':
+                # case / default / label colon; a following `{` is a block
+                tok.role = 'label'
+
+        tok.unit = unit
+
+    # Declarations are hoisted, so references resolve once all are known
+    for tok in tokens:
+        if tok.type == 'name' and tok.binding is None and tok.role in _RESOLVED_ROLES:
+            scope = tok.scope
+            while scope is not None and tok.value not in scope.names:
+                scope = scope.parent
+            tok.binding = scope
+
+    return units
+
+
+def _short_names(reserved: Set[str]):
+    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    rest = alphabet + '0123456789_$'
+    length = 1
+    while True:
+        for name in _names_of_length(length, alphabet, rest):
+            if name not in reserved and name not in KEYWORDS:
+                yield name
+        length += 1
+
+
+def _names_of_length(length: int, first: str, rest: str):
+    if length == 1:
+        yield from first
+        return
+    for head in _names_of_length(length - 1, first, rest):
+        for c in rest:
+            yield head + c
+
+
+def _rename(tokens: List[Token], units: int):
+    reserved = {tok.value for tok in tokens if tok.type == 'name'}
+
+    skipped = {tok.unit for tok in tokens
+               if tok.type == 'name' and tok.unit is not None and tok.value in ('eval', 'with')}
+    uncertain: Dict[int, Set[str]] = {}
+    # Tokens of each unit, grouped by the declaration they refer to
+    by_unit: List[Dict[Tuple[int, str], List[Token]]] = [{} for _ in range(units)]
+    for tok in tokens:
+        scope = tok.binding if tok.type == 'name' else None
+        if scope is None or scope.unit is None or scope.unit in skipped:
+            continue
+        if tok.value in KEYWORDS or tok.value in _GLOBALS:
+            continue
+        if scope.uncertain:
+            uncertain.setdefault(scope.unit, set()).add(tok.value)
+        by_unit[scope.unit].setdefault((id(scope), tok.value), []).append(tok)
+
+    for index, bindings in enumerate(by_unit):
+        left_alone = uncertain.get(index, set())
+        # Every declaration gets its own name, so no shadowing can change
+        # what a reference points to; the most-used get the shortest
+        declared = sorted((key for key in bindings if key[1] not in left_alone),
+                          key=lambda key: -len(bindings[key]))
+        generator = _short_names(reserved)
+        for key in declared:
+            short = next(generator)
+            # Never lengthen a name
+            if len(short) >= len(key[1]):
+                continue
+            for tok in bindings[key]:
+                if tok.role in ('ref', 'binding'):
+                    tok.value = short
+                elif tok.role in ('shorthand', 'shorthand-ref'):
+                    # `{ url }` becomes `{ url: a }`
+                    tok.value = f"{tok.value}:{short}"
+
+
+def _emit(tokens: List[Token]) -> str:
+    out: List[str] = []
+    prev: Optional[Token] = None
+    for tok in tokens:
+        if prev is not None:
+            out.append(_separator(prev, tok))
+        out.append(tok.value)
+        prev = tok
+    return ''.join(out)
+
+
+def _separator(a: Token, b: Token) -> str:
+    if b.nl and _may_end(a) and _may_start(b):
+        return '\n'
+    if _WORD_CHARS.match(a.value[-1]) and _WORD_CHARS.match(b.value[0]):
+        return ' '
+    if a.type == 'regex' and _WORD_CHARS.match(b.value[0]):
+        return ' '
+    if a.type == 'num' and b.value[0] == '.':
+        return ' '
+    if a.value[-1] in '+-/' and b.value[0] == a.value[-1]:
+        return ' '
+    return ''
+
+
+def _may_end(tok: Token) -> bool:
+    if tok.type in _END_TYPES or tok.type == 'template_end':
+        return True
+    if tok.type == 'punct' and tok.value in _END_PUNCT:
+        # A closed block, method or class body never needs a semicolon
+        return not (tok.value == '}' and tok.closes in ('block', 'method', 'class'))
+    return False
+
+
+def _may_start(tok: Token) -> bool:
+    return tok.type in _START_TYPES or (tok.type == 'punct' and tok.value in _START_PUNCT)
+
+
+def minify_js(source: str, rename: bool = True) -> str:
+    """Minify JavaScript source"""
+    tokens = _Tokenizer(source).tokenize()
+    if rename:
+        units = _analyze(tokens)
+        _rename(tokens, units)
+    return _emit(tokens)
@@ -0,0 +1,88 @@
+"""
+Static page generation for DreamWeb
+Renders each declared page variant of an app, in parallel across processes
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from dreamweb.builder_module.builder import Builder
+
+
+class Page(NamedTuple):
+    """A rendered page, ready to be written by the builder"""
+    file: str
+    tree: Dict[str, Any]
+    data_hash: str
+    html_parts: List[str]
+    css_parts: List[str]
+    types: FrozenSet[str]
+    modules: FrozenSet[str]
+    timings: Dict[str, float]
+
+
+def page_file(name: str) -> str:
+    """'index' -> 'index.html', 'widgets' -> 'widgets.html'"""
+    return name if name.endswith('.html') else f"{name}.html"
+
+
+def data_name(file: str) -> str:
+    """Logical name of a page's external tree data file"""
+    stem = file[:-len('.html')]
+    return 'tree.json' if stem == 'index' else f"{stem}.tree.json"
+
+
+# Set in the parent right before forking; workers inherit the app through it
+_worker_builder: Optional['Builder'] = None
+
+
+def _render_in_worker(job: Tuple[str, Dict[str, Any]]) -> Page:
+    return _worker_builder.render_page(*job)
+
+
+def _fork_context():
+    # Imported here so single-page builds never load multiprocessing
+    import multiprocessing
+
+    # Workers need the live app object, which only fork can hand over
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def render_pages(builder: 'Builder', variants: Dict[str, Dict[str, Any]],
+                 workers: Optional[int] = None) -> List[Page]:
+    """Render every page variant, in worker processes when there's more than one"""
+    global _worker_builder
+
+    for name in variants:
+        # Pages link the runtime and their data relative to the output root
+        if '/' in name or '\\' in name:
+            raise ValueError(f"static_pages() names page {name!r}; page names can't contain directories")
+
+    # Every page starts from the app's initial state plus its own overrides
+    defaults = {}
+    for state in variants.values():
+        for attr in state:
+            defaults.setdefault(attr, builder.state_value(attr))
+    jobs = [(page_file(name), {**defaults, **state}) for name, state in variants.items()]
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    context = _fork_context() if workers > 1 else None
+    if context is None:
+        try:
+            return [builder.render_page(*job) for job in jobs]
+        finally:
+            # Rendering here sets the app's own States; leave them as they were
+            for attr, value in defaults.items():
+                builder._state(attr).set(value)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    _worker_builder = builder
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            return list(pool.map(_render_in_worker, jobs))
+    finally:
+        _worker_builder = None
@@ -0,0 +1,139 @@
+"""
+Build profiling for DreamWeb
+Times each build phase and breaks output size down by widget type and subtree
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Subtree(NamedTuple):
+    path: str
+    type: str
+    size: int
+
+
+class SizeBreakdown:
+    """Serialized size of a component tree, by widget type and by subtree
+
+    Sizes are bytes of the compact JSON the runtime receives. A node's own
+    size excludes its children; subtree sizes include them.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.by_type: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self.subtrees: List[Subtree] = []
+
+    def add_tree(self, tree: Dict[str, Any], page: str = ''):
+        root = tree.get('type', '?')
+        self.total += self._walk(tree, f"{page}:{root}" if page else root)
+
+    def _walk(self, node: Dict[str, Any], path: str) -> int:
+        children = node.get('children')
+        own = {key: value for key, value in node.items() if key != 'children'}
+        size = len(_compact(own))
+        if children is not None:
+            # ,"children":[ ... ] with a comma between each child
+            size += len('"children":[]') + (1 if own else 0) + max(len(children) - 1, 0)
+
+        node_type = node.get('type', '?')
+        self.by_type[node_type] = self.by_type.get(node_type, 0) + size
+        self.counts[node_type] = self.counts.get(node_type, 0) + 1
+
+        for index, child in enumerate(children or []):
+            if isinstance(child, dict):
+                size += self._walk(child, f"{path} > {child.get('type', '?')}[{index}]")
+            else:
+                size += len(_compact(child))
+
+        self.subtrees.append(Subtree(path, node_type, size))
+        return size
+
+    def largest_types(self, limit: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """(type, bytes, count) from the largest contributor down"""
+        ranked = sorted(self.by_type.items(), key=lambda item: -item[1])[:limit]
+        return [(name, size, self.counts[name]) for name, size in ranked]
+
+    def largest_subtrees(self, limit: int = 10, min_depth: int = 1) -> List[Subtree]:
+        """Largest subtrees below the page roots"""
+        nested = [s for s in self.subtrees if s.path.count(' > ') >= min_depth]
+        return sorted(nested, key=lambda s: -s.size)[:limit]
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _kb(size: int) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def _pct(part: float, whole: float) -> str:
+    return f"{part * 100 / whole:5.1f}%" if whole else "    -"
+
+
+class BuildProfiler:
+    """Collects phase timings and sizes during a build"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.phases: Dict[str, float] = {}
+        self.sizes = SizeBreakdown()
+        self.artifacts: List[Tuple[str, int]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def merge(self, timings: Dict[str, float]):
+        """Fold in timings recorded elsewhere, e.g. in page worker processes"""
+        for name, seconds in timings.items():
+            self.add(name, seconds)
+
+    def finish(self, artifacts: Dict[str, Dict[str, Any]]):
+        self.elapsed = time.perf_counter() - self.started
+        self.artifacts = sorted(((e['file'], e['size']) for e in artifacts.values()),
+                                key=lambda item: -item[1])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'elapsed_s': round(self.elapsed, 4),
+            'phases_s': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            'artifacts': dict(self.artifacts),
+            'tree_bytes': self.sizes.total,
+            'by_type': {name: {'bytes': size, 'count': count}
+                        for name, size, count in self.sizes.largest_types()},
+            'largest_subtrees': [s._asdict() for s in self.sizes.largest_subtrees()],
+        }
+
+    def format(self, limit: int = 10) -> str:
+        lines = [f"⏱️  Build profile ({self.elapsed * 1000:.0f} ms wall)", "   Phases"]
+        for name, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"     {name:<20} {seconds * 1000:9.1f} ms  {_pct(seconds, self.elapsed)}")
+
+        output = sum(size for _, size in self.artifacts)
+        lines.append(f"   Output ({_kb(output)})")
+        for file, size in self.artifacts[:limit]:
+            lines.append(f"     {file:<32} {_kb(size):>10}  {_pct(size, output)}")
+
+        total = self.sizes.total
+        lines.append(f"   Tree data by widget type ({_kb(total)})")
+        for name, size, count in self.sizes.largest_types(limit):
+            lines.append(f"     {name:<20} {_kb(size):>10}  {_pct(size, total)}  x{count}")
+
+        lines.append("   Largest subtrees")
+        for subtree in self.sizes.largest_subtrees(limit):
+            lines.append(f"     {_kb(subtree.size):>10}  {_pct(subtree.size, total)}  {subtree.path}")
+        return '\n'.join(lines)
@@ -0,0 +1,107 @@
+"""
+Service worker generation for DreamWeb builds
+Precaches the build so repeat visits render from the local cache
+"""
+
+import json
+from typing import Iterable
+
+from dreamweb.builder_module.cache import hash_json
+
+
+SERVICE_WORKER = 'sw.js'
+
+REGISTRATION_SNIPPET = f"""<script>
+        if ('serviceWorker' in navigator) {{
+            window.addEventListener('load', () => navigator.serviceWorker.register('{SERVICE_WORKER}'));
+        }}
+    </script>"""
+
+# Hashed assets never change, so they're served cache-first. Pages are
+# served from cache too, but refreshed in the background so the next
+# visit picks up a new deploy (stale-while-revalidate). Every other
+# request, API calls included, goes straight to the network, which keeps
+# the cache to one entry per precached file.
+_TEMPLATE = """// Generated by DreamWeb; do not edit
+const CACHE = 'dreamweb-__VERSION__';
+const IMMUTABLE = __IMMUTABLE__;
+const PAGES = __PAGES__;
+
+const scoped = path => new URL(path, self.registration.scope).href;
+const immutable = new Set(IMMUTABLE.map(scoped));
+const revalidated = new Set(PAGES.map(scoped));
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE)
+            .then(cache => cache.addAll([...IMMUTABLE, ...PAGES]))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    // Drop the caches of earlier deploys
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys
+                .filter(key => key.startsWith('dreamweb-') && key !== CACHE)
+                .map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || new URL(request.url).origin !== self.location.origin) {
+        return;
+    }
+
+    if (immutable.has(request.url)) {
+        event.respondWith(
+            caches.match(request).then(cached => cached || fetch(request))
+        );
+        return;
+    }
+
+    // A page is the same page whatever its query string
+    const url = new URL(request.url);
+    if (request.mode === 'navigate') {
+        url.search = '';
+    }
+    if (!revalidated.has(url.href)) {
+        return;
+    }
+
+    event.respondWith(caches.open(CACHE).then(cache =>
+        cache.match(url.href).then(cached => {
+            const network = fetch(request).then(response => {
+                if (response.ok) {
+                    cache.put(url.href, response.clone());
+                }
+                return response;
+            });
+            if (cached) {
+                // Keep the worker alive until the background refresh lands
+                event.waitUntil(network.catch(() => {}));
+                return cached;
+            }
+            return network;
+        })
+    ));
+});
+"""
+
+
+def render_service_worker(immutable: Iterable[str], pages: Iterable[str]) -> str:
+    """Render sw.js for a build's hashed assets and pages"""
+    immutable = sorted(immutable)
+    pages = set(pages)
+    # index.html is also reachable as the directory URL
+    if 'index.html' in pages:
+        pages.add('./')
+    pages = sorted(pages)
+    version = hash_json([immutable, pages])[:12]
+    return (_TEMPLATE
+            .replace('__VERSION__', version)
+            .replace('__IMMUTABLE__', json.dumps(immutable))
+            .replace('__PAGES__', json.dumps(pages)))
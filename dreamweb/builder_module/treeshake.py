@@ -0,0 +1,93 @@
+"""
+Tree shaking for the DreamWeb runtime
+Drops renderers, style helpers and widget modules the component tree doesn't use
+
+Optional regions of runtime.js are fenced with marker comments naming the
+features that need them:
+
+    // @feature Container Image
+    parseSize(value) { ... }
+    // @end
+
+A region is kept if any of its features is in use. Features are widget
+types plus a few named capabilities such as ``hot-reload``. Regions don't nest.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+RUNTIME_DIR = Path(__file__).parent.parent / 'runtime'
+
+_MARKER = re.compile(r'^[ \t]*// @(feature[ \t]+(?P<features>[^\n]*?)|end)[ \t]*$')
+
+
+def used_features(tree: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+    """Collect the widget types and js_modules present in a component tree"""
+    types: Set[str] = set()
+    modules: Set[str] = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        if 'type' in node:
+            types.add(node['type'])
+        if node.get('js_module'):
+            modules.add(node['js_module'])
+        stack.extend(node.get('children') or [])
+    return types, modules
+
+
+def declared_features(source: str) -> Set[str]:
+    """Every feature named by a region marker in source"""
+    features: Set[str] = set()
+    for line in source.splitlines():
+        marker = _MARKER.match(line)
+        if marker and marker.group('features'):
+            features.update(marker.group('features').split())
+    return features
+
+
+def shake(source: str, keep: Iterable[str]) -> str:
+    """Strip the feature regions of source that none of keep enables"""
+    keep = set(keep)
+    out: List[str] = []
+    active = None
+    for number, line in enumerate(source.splitlines(keepends=True), 1):
+        marker = _MARKER.match(line)
+        if not marker:
+            if active is None or active:
+                out.append(line)
+            continue
+        if marker.group('features') is not None:
+            if active is not None:
+                raise ValueError(f"runtime line {number}: nested @feature region")
+            active = not keep.isdisjoint(marker.group('features').split())
+        else:
+            if active is None:
+                raise ValueError(f"runtime line {number}: @end without @feature")
+            active = None
+    if active is not None:
+        raise ValueError("runtime: unterminated @feature region")
+    return ''.join(out)
+
+
+def read_module(module: str) -> str:
+    """Read a widget module such as 'widgets/api.js' from the runtime directory"""
+    path = (RUNTIME_DIR / module).resolve()
+    if RUNTIME_DIR.resolve() not in path.parents:
+        raise ValueError(f"js_module {module!r} is outside the runtime directory")
+    return path.read_text(encoding='utf-8')
+
+
+def bundle_modules(modules: Iterable[str]) -> str:
+    """Concatenate widget modules, each in its own scope"""
+    parts = []
+    for module in sorted(modules):
+        parts.append(f"// {module}\n(function() {{\n{read_module(module)}\n}})();\n")
+    return '\n'.join(parts)
@@ -0,0 +1,161 @@
+"""
+Watch mode for DreamWeb builds
+Keeps the interpreter warm and rebuilds when the project's sources change
+"""
+
+import importlib
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Optional, Set
+
+from dreamweb.builder_module.budgets import BudgetExceededError
+from dreamweb.builder_module.builder import Builder
+from dreamweb.cli.loader import find_app_class, load_module
+
+
+class _ChangeCollector:
+    """Watchdog handler that records changed .py files for the watcher"""
+
+    WRITE_EVENTS = ('created', 'modified', 'moved')
+
+    def __init__(self, watcher: 'BuildWatcher'):
+        self.watcher = watcher
+
+    def dispatch(self, event):
+        # Reloading opens the sources too; only writes count as changes
+        if event.is_directory or event.event_type not in self.WRITE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if path and path.endswith('.py'):
+                self.watcher.notify(Path(path).resolve())
+
+
+class BuildWatcher:
+    """Rebuild an app whenever its Python sources change
+
+    Only modules whose files changed are reloaded, along with the project
+    modules that imported names from them. The builder's artifact cache
+    then skips every output whose inputs are unchanged.
+    """
+
+    def __init__(self, app_path: str = "main.py", output_dir: str = "build",
+                 debounce: float = 0.2, profile: bool = False):
+        self.app_path = Path(app_path).resolve()
+        self.project_dir = self.app_path.parent
+        self.output_dir = Path(output_dir).resolve()
+        self.debounce = debounce
+        self.profile = profile
+        self.module: Optional[ModuleType] = None
+        self._changed: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def notify(self, path: Path):
+        if self.output_dir in path.parents:
+            return
+        with self._lock:
+            self._changed.add(path)
+        self._wake.set()
+
+    def run(self):
+        """Build once, then rebuild on every change until interrupted"""
+        from watchdog.observers import Observer
+
+        self.module = load_module(str(self.app_path))
+        self.build()
+
+        observer = Observer()
+        observer.schedule(_ChangeCollector(self), str(self.project_dir), recursive=True)
+        observer.start()
+        print(f"👀 Watching for changes in: {self.project_dir}")
+
+        try:
+            while True:
+                self._wake.wait()
+                # Editors often write a file several times; wait for them to settle
+                while self._wake.wait(self.debounce):
+                    self._wake.clear()
+                with self._lock:
+                    changed, self._changed = self._changed, set()
+                if changed:
+                    self.rebuild(changed)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
+        finally:
+            observer.stop()
+            observer.join()
+
+    def build(self) -> bool:
+        started = time.perf_counter()
+        try:
+            app = find_app_class(self.module)()
+            Builder(app, output_dir=str(self.output_dir), profile=self.profile).build()
+        except BudgetExceededError as e:
+            print(f"❌ {e}")
+            return False
+        except Exception:
+            traceback.print_exc()
+            print("❌ Build failed; waiting for changes...")
+            return False
+        print(f"⚡ Built in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+
+    def rebuild(self, changed: Set[Path]):
+        names = ', '.join(sorted(path.name for path in changed))
+        print(f"🔄 Changed: {names}")
+        try:
+            self.reload(changed)
+        except Exception:
+            traceback.print_exc()
+            print("❌ Reload failed; waiting for changes...")
+            return
+        self.build()
+
+    def _project_modules(self) -> Dict[str, ModuleType]:
+        """Loaded modules that live in the project directory, in import order"""
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            file = getattr(module, '__file__', None)
+            if file and self.project_dir in Path(file).resolve().parents:
+                modules[name] = module
+        return modules
+
+    def reload(self, changed: Set[Path]) -> List[str]:
+        """Reload changed modules and the project modules importing from them"""
+        project = self._project_modules()
+        stale = {name for name, module in project.items() if Path(module.__file__).resolve() in changed}
+
+        # `from pages.home import create_home_page` keeps the old function alive
+        # in the importer, so importers of stale modules are stale too
+        grew = True
+        while grew:
+            grew = False
+            for name, module in project.items():
+                if name not in stale and self._imports_from(module, stale):
+                    stale.add(name)
+                    grew = True
+
+        # Modules are registered before they import their dependencies, so
+        # reverse import order reloads dependencies before their importers
+        main = self.module.__name__
+        for name in reversed(list(project)):
+            if name in stale and name != main:
+                importlib.reload(project[name])
+        # The app file is re-executed last so it picks up the reloaded modules
+        if main in stale or self.app_path in changed:
+            self.module = load_module(str(self.app_path))
+        return sorted(stale)
+
+    @staticmethod
+    def _imports_from(module: ModuleType, names: Set[str]) -> bool:
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                if value.__name__ in names:
+                    return True
+            elif getattr(value, '__module__', None) in names:
+                return True
+        return False
@@ -3,6 +3,7 @@ Command-line interface for DreamWeb
 """
 
 import sys
+import json
 import argparse
 from pathlib import Path
 
@@ -84,10 +85,10 @@ class {name.capitalize()}App(App):
 
 if __name__ == "__main__":
     {name.capitalize()}App().run(dev=True)
-"""
+'''
     
     with open(project_dir / "main.py", 'w') as f:
-        f.write(main_py)
+        f.write(main_content)
     
     print(f"""
 ✅ Created project '{name}'!
@@ -103,34 +104,149 @@ This will start the dev server at http://localhost:8000
 import os
 import subprocess
 
-def run_dev(port: int, host: str):
+def run_dev(port: int, host: str, reload: bool = True):
     """Run dev server"""
     if not Path("main.py").exists():
         print("❌ main.py not found! Are you in a DreamWeb project directory?")
         return
     
     print(f"🚀 Starting dev server on {host}:{port}...")
-    # Pass port/host via env vars or args if supported, but for now just run main.py
-    # main.py usually calls run(dev=True)
-    try:
-        subprocess.run([sys.executable, "main.py"])
-    except KeyboardInterrupt:
-        pass
+    if reload and hasattr(os, 'fork'):
+        # Restart a forked server child on changes, keeping imports warm
+        from dreamweb.server.reloader import Reloader
+        Reloader("main.py", port=port, host=host).run()
+        return
+    
+    # Serve in this process; main.py's `app.run()` guard is skipped by the import
+    from dreamweb.cli.loader import load_app
+    from dreamweb.server import DevServer
+    DevServer(load_app("main.py"), port=port, host=host, watch=reload).start()
 
-def run_build(output: str):
+def run_build(output: str, profile: bool = False, watch: bool = False):
     """Build for production"""
     if not Path("main.py").exists():
         print("❌ main.py not found! Are you in a DreamWeb project directory?")
         return
     
+    if watch:
+        # Build in this process so imports stay warm between rebuilds
+        from dreamweb.builder_module.watch import BuildWatcher
+        os.environ['DREAMWEB_BUILD'] = '1'
+        print(f"📦 Building project to {output} in watch mode...")
+        BuildWatcher("main.py", output, profile=profile).run()
+        return
+    
     print(f"📦 Building project to {output}...")
     env = os.environ.copy()
     env['DREAMWEB_BUILD'] = '1'
+    env['DREAMWEB_OUTPUT'] = output
+    if profile:
+        env['DREAMWEB_PROFILE'] = '1'
     
     try:
-        subprocess.run([sys.executable, "main.py"], env=env)
+        result = subprocess.run([sys.executable, "main.py"], env=env)
     except Exception as e:
         print(f"❌ Build failed: {e}")
+        sys.exit(1)
+    if result.returncode:
+        sys.exit(result.returncode)
+
+def run_serve(directory: str, port: int, host: str):
+    """Serve a production build"""
+    from dreamweb.server.production import serve
+
+    try:
+        serve(directory, port=port, host=host)
+    except (FileNotFoundError, OSError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+def run_loadtest(app: str, clients: int, events: int, duration: float, script: str,
+                 target: str, timeout: float, think: float, json_output: str, max_p95: float):
+    """Load test a dev server over WebSocket"""
+    from dreamweb.loadtest import LoadTest, load_script, local_server
+
+    def run(url):
+        print(f"🔥 Load testing {url} with {clients} clients...")
+        test = LoadTest(url, script=steps, clients=clients, events=events,
+                        duration=duration, timeout=timeout, think=think / 1000)
+        return test.run()
+
+    try:
+        steps = load_script(script) if script else None
+        if target:
+            report = run(target)
+        else:
+            with local_server(app) as url:
+                report = run(url)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"❌ Load test failed: {e}")
+        sys.exit(1)
+
+    print(report.format())
+
+    if json_output:
+        with open(json_output, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"📝 Results written to {json_output}")
+
+    if max_p95 is not None and report.p95 * 1000 > max_p95:
+        print(f"❌ p95 latency {report.p95 * 1000:.1f} ms exceeds the {max_p95:g} ms budget")
+        sys.exit(1)
+
+def run_bench(nodes: int, depth: int, handler_density: float, seed: int, repeat: int,
+              suites: list, output: str, baseline: str, max_import_ms: float = None):
+    """Benchmark rendering, dispatch and builds on a synthetic app"""
+    from dreamweb.bench import Benchmark, compare, format_results, import_failures, load_results, write_results
+
+    try:
+        bench = Benchmark(nodes=nodes, depth=depth, handler_density=handler_density,
+                          seed=seed, repeat=repeat, suites=suites)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"⏱️  Benchmarking {nodes} nodes, depth {depth}, handler density {handler_density:g} "
+          f"({repeat} runs each)...")
+    data = bench.run(progress=lambda name: print(f"   … {name}"))
+    print(format_results(data))
+
+    if baseline:
+        print(f"⚖️  Compared with {baseline}:")
+        print('\n'.join(compare(load_results(baseline), data)))
+
+    if output:
+        write_results(data, output)
+        print(f"📝 Results written to {output}")
+
+    failures = import_failures(data, max_import_ms)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+
+def run_profile(app: str, events: str, output: str, top: int):
+    """Profile an app's build, serialization and event handling"""
+    from dreamweb.cli.loader import load_app
+    from dreamweb.loadtest import load_script
+    from dreamweb.profiling import ProfileSession
+
+    try:
+        steps = load_script(events) if events else None
+        instance = load_app(app)
+    except (OSError, LookupError, ValueError) as e:
+        print(f"❌ Profile failed: {e}")
+        sys.exit(1)
+
+    print(f"🔬 Profiling {app}...")
+    session = ProfileSession(instance, steps, project_dir=str(Path(app).resolve().parent)).run()
+    print(session.format(top))
+
+    pstats_file, collapsed_file = f"{output}.pstats", f"{output}.collapsed"
+    session.tracer.write_pstats(pstats_file)
+    session.tracer.write_collapsed(collapsed_file)
+    print(f"📝 pstats written to {pstats_file} (python -m pstats {pstats_file})")
+    print(f"🔥 Collapsed stacks written to {collapsed_file} (flamegraph.pl or speedscope)")
 
 def main():
     """Main CLI entry point"""
@@ -145,19 +261,77 @@ def main():
     dev_parser = subparsers.add_parser('dev', help='Start dev server')
     dev_parser.add_argument('--port', type=int, default=8000, help='Port number')
     dev_parser.add_argument('--host', default='localhost', help='Host address')
+    dev_parser.add_argument('--no-reload', dest='reload', action='store_false',
+                            help="Don't restart the server when source files change")
     
     # Build command
     build_parser = subparsers.add_parser('build', help='Build for production')
     build_parser.add_argument('--output', default='build', help='Output directory')
+    build_parser.add_argument('--profile', action='store_true',
+                              help='Report build phase timings and output size breakdown')
+    build_parser.add_argument('--watch', action='store_true', help='Rebuild when source files change')
+    
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Serve a production build')
+    serve_parser.add_argument('directory', nargs='?', default='build', help='Build directory (default: build)')
+    serve_parser.add_argument('--port', type=int, default=8080, help='Port number')
+    serve_parser.add_argument('--host', default='localhost', help='Host address')
+    
+    # Load test command
+    loadtest_parser = subparsers.add_parser('loadtest', help='Load test the app over WebSocket')
+    loadtest_parser.add_argument('app', nargs='?', default='main.py', help='App file (default: main.py)')
+    loadtest_parser.add_argument('--clients', type=int, default=10, help='Simulated clients')
+    loadtest_parser.add_argument('--events', type=int, default=100, help='Events per client')
+    loadtest_parser.add_argument('--duration', type=float, help='Run for this many seconds instead of a fixed event count')
+    loadtest_parser.add_argument('--script', help='JSON event script to replay')
+    loadtest_parser.add_argument('--target', help='URL of an already running server (default: start one)')
+    loadtest_parser.add_argument('--timeout', type=float, default=5.0, help='Seconds to wait for each update')
+    loadtest_parser.add_argument('--think', type=float, default=0.0, help='Pause between events in ms')
+    loadtest_parser.add_argument('--json', dest='json_output', help='Write results as JSON to this file')
+    loadtest_parser.add_argument('--max-p95', type=float, help='Fail if p95 latency exceeds this many ms')
+    
+    # Benchmark command
+    bench_parser = subparsers.add_parser('bench', help='Run the benchmark suite')
+    bench_parser.add_argument('--nodes', type=int, default=1000, help='Widgets in the synthetic tree')
+    bench_parser.add_argument('--depth', type=int, default=8, help='Maximum nesting depth')
+    bench_parser.add_argument('--handler-density', type=float, default=0.2,
+                              help='Fraction of leaves with event handlers')
+    bench_parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic tree')
+    bench_parser.add_argument('--repeat', type=int, default=10, help='Timed runs per benchmark')
+    bench_parser.add_argument('--suite', dest='suites', action='append', choices=['micro', 'macro', 'imports'],
+                              help='Suite to run; repeat for several (default: all)')
+    bench_parser.add_argument('--output', help='Write results as JSON to this file')
+    bench_parser.add_argument('--compare', dest='baseline', help='Compare with an earlier JSON results file')
+    bench_parser.add_argument('--max-import-ms', type=float,
+                              help='Fail if build-only imports take longer than this many ms')
+    
+    # Profile command
+    profile_parser = subparsers.add_parser('profile', help='Profile build, serialization and event handling')
+    profile_parser.add_argument('app', nargs='?', default='main.py', help='App file (default: main.py)')
+    profile_parser.add_argument('--events', help='JSON event script to replay (default: click every button once)')
+    profile_parser.add_argument('--output', default='dreamweb-profile',
+                                help='Output path prefix for the .pstats and .collapsed files')
+    profile_parser.add_argument('--top', type=int, default=10, help='Rows to show per table')
     
     args = parser.parse_args()
     
     if args.command == 'create':
         create_project(args.name)
     elif args.command == 'dev':
-        run_dev(args.port, args.host)
+        run_dev(args.port, args.host, args.reload)
     elif args.command == 'build':
-        run_build(args.output)
+        run_build(args.output, args.profile, args.watch)
+    elif args.command == 'serve':
+        run_serve(args.directory, args.port, args.host)
+    elif args.command == 'loadtest':
+        run_loadtest(args.app, args.clients, args.events, args.duration, args.script,
+                     args.target, args.timeout, args.think, args.json_output, args.max_p95)
+    elif args.command == 'bench':
+        run_bench(args.nodes, args.depth, args.handler_density, args.seed, args.repeat,
+                  args.suites or ['micro', 'macro', 'imports'], args.output, args.baseline,
+                  args.max_import_ms)
+    elif args.command == 'profile':
+        run_profile(args.app, args.events, args.output, args.top)
     else:
         parser.print_help()
 
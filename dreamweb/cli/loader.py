@@ -0,0 +1,48 @@
+"""
+Load a user's DreamWeb app module in-process
+"""
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from dreamweb.core import App
+
+
+def load_module(path: str) -> ModuleType:
+    """Import an app file (e.g. main.py) as a module"""
+    file_path = Path(path).resolve()
+    if not file_path.exists():
+        raise FileNotFoundError(f"{path} not found! Are you in a DreamWeb project directory?")
+
+    # Sibling imports (components/, pages/) resolve like `python main.py`
+    project_dir = str(file_path.parent)
+    if project_dir not in sys.path:
+        sys.path.insert(0, project_dir)
+
+    name = file_path.stem
+    spec = importlib.util.spec_from_file_location(name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_app_class(module: ModuleType) -> Type['App']:
+    """Find the App subclass defined in a module"""
+    from dreamweb.core import App
+
+    # Module dicts keep definition order, so the first app defined wins
+    for obj in vars(module).values():
+        if inspect.isclass(obj) and issubclass(obj, App) and obj is not App and obj.__module__ == module.__name__:
+            return obj
+    raise LookupError(f"No App subclass found in {module.__file__}")
+
+
+def load_app(path: str) -> 'App':
+    """Import an app file and instantiate its App subclass"""
+    return find_app_class(load_module(path))()
@@ -3,46 +3,64 @@ Common widgets and utilities for DreamWeb.
 
 Import all widgets with:
     from dreamweb.common import *
+
+Widgets are imported on first use, so `from dreamweb.common import Text`
+only loads the text widgets.
 """
 
+from typing import TYPE_CHECKING
+
 from dreamweb.core import State
-from dreamweb.widgets import (
-    # Layout
-    Container,
-    Row,
-    Column,
-    Stack,
-    Center,
-    Spacer,
-    
-    # Text
-    Text,
-    Heading,
-    
-    # Input
-    Button,
-    TextField,
-    Checkbox,
-    Radio,
-    Select,
-    Slider,
-    
-    # Media
-    Image,
-    Video,
-    Icon,
-    
-    # Navigation
-    Link,
-    
-    # Raw HTML/CSS (advanced)
-    Html,
-    Css,
-    
-    # API
-    ApiRequest,
-    FetchData,
-)
+
+if TYPE_CHECKING:
+    from dreamweb.widgets import (
+        # Layout
+        Container,
+        Row,
+        Column,
+        Stack,
+        Center,
+        Spacer,
+        
+        # Text
+        Text,
+        Heading,
+        
+        # Input
+        Button,
+        TextField,
+        Checkbox,
+        Radio,
+        Select,
+        Slider,
+        
+        # Media
+        Image,
+        Video,
+        Icon,
+        
+        # Navigation
+        Link,
+        
+        # Raw HTML/CSS (advanced)
+        Html,
+        Css,
+        
+        # API
+        ApiRequest,
+        FetchData,
+    )
+
+
+def __getattr__(name: str):
+    # Widgets load on first use; dreamweb.widgets imports their modules lazily
+    if name in __all__:
+        import dreamweb.widgets
+        value = getattr(dreamweb.widgets, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "State",
@@ -3,22 +3,29 @@ App class for DreamWeb
 """
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from abc import ABC, abstractmethod
 
 from dreamweb.core.state import State
+from dreamweb.core.styles import StyleTable
 from dreamweb.core.widget import Widget
 
 
 class App:
     """Main application class"""
     
-    def __init__(self, title: str = "DreamWeb App", description: str = "Built with DreamWeb", head_tags: List[str] = None):
+    def __init__(self, title: str = "DreamWeb App", description: str = "Built with DreamWeb", head_tags: List[str] = None,
+                 resolve_styles: bool = False):
         self.title = title
         self.description = description
         self.head_tags = head_tags or []
+        # Send final CSS instead of style props, so clients skip the style helpers
+        self.resolve_styles = resolve_styles
+        self._style_table: Optional[StyleTable] = None
         self._states: List[State] = []
         self._event_handlers: Dict[str, Any] = {}
+        # Bound States by the ID their inputs carry (TextField(bind=...))
+        self._bindings: Dict[str, State] = {}
         self._setup_state_tracking()
     
     def _setup_state_tracking(self):
@@ -38,6 +45,16 @@ class App:
     def build(self) -> Widget:
         """Build the UI tree - must be implemented by subclass"""
         pass
+
+    def static_pages(self) -> Dict[str, Dict[str, Any]]:
+        """Pages to pre-render in production builds
+
+        Maps each page name to the State values to set before building it,
+        e.g. {"index": {"current_page": "home"}, "widgets": {"current_page": "widgets"}}.
+        Each page is written to <name>.html, so names can't contain "/".
+        Return {} to build only the initial state into index.html.
+        """
+        return {}
     
     def _handle_event(self, handler_id: str, value: Any) -> bool:
         """Handle event from client"""
@@ -62,15 +79,34 @@ class App:
                     return False
         return False
 
+    def _handle_bind(self, bind_id: str, value: Any) -> bool:
+        """Set a bound State to the value its input holds on the client"""
+        state = self._bindings.get(bind_id)
+        if state is None:
+            return False
+        state.set(value)
+        return True
+
     def _serialize(self) -> str:
         """Serialize the app to JSON for compilation"""
-        # Clear handlers before rebuild
+        # Clear handlers and bindings before rebuild
         self._event_handlers = {}
+        self._bindings = {}
         tree = self.build()
         return json.dumps(self._widget_to_dict(tree), indent=2)
     
     def _widget_to_dict(self, widget: Widget) -> Dict[str, Any]:
         """Recursively convert widget tree to dictionary"""
+        if self.resolve_styles and self._style_table is None:
+            # The outermost call collects the tree's styles into its root
+            self._style_table = StyleTable()
+            try:
+                data = self._widget_to_dict(widget)
+                data['styles'] = self._style_table.styles
+            finally:
+                self._style_table = None
+            return data
+
         # Convert widget to dict but keep callables for now
         data = widget.to_dict()
         
@@ -89,6 +125,12 @@ class App:
                     # Map event name (e.g. on_click -> click)
                     event_name = key.replace('on_', '')
                     data['events'][event_name] = handler_id
+                elif key == 'bind' and isinstance(value, State):
+                    # States outlive builds, so their IDs stay the same between renders;
+                    # whoever renders a whole tree clears _bindings first
+                    bind_id = f"bind_{id(value)}"
+                    self._bindings[bind_id] = value
+                    data['bind'] = bind_id
         
         # Process children
         if 'children' in data and data['children']:
@@ -102,6 +144,9 @@ class App:
                 elif isinstance(child, (int, float)):
                     processed_children.append({'type': 'TextNode', 'text': str(child)})
             data['children'] = processed_children
+
+        if self._style_table is not None:
+            self._style_table.resolve_node(data)
         
         return data
     
@@ -118,7 +163,12 @@ class App:
             server = DevServer(self, port=port, host=host)
             server.start()
         else:
-            from dreamweb.builder_module import Builder
-            builder = Builder(self)
-            builder.build()
-            print(f"✅ Build complete! Check the 'build' directory.")
+            from dreamweb.builder_module import BudgetExceededError, Builder
+            output_dir = os.environ.get('DREAMWEB_OUTPUT', 'build')
+            builder = Builder(self, output_dir=output_dir)
+            try:
+                builder.build()
+            except BudgetExceededError as e:
+                print(f"❌ {e}")
+                raise SystemExit(1)
+            print(f"✅ Build complete! Check the '{output_dir}' directory.")
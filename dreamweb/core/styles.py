@@ -0,0 +1,375 @@
+"""
+Server-side style resolution for DreamWeb
+Turns widget style props into the final styles the runtime would compute
+
+With App(resolve_styles=True), a serialized node's style props are replaced
+by a ``css`` index into the ``styles`` table of the tree's root. Each entry
+maps a selector suffix ('' for the element itself, ':hover' for states) to
+final style values:
+
+    {'type': 'Column', 'props': {},
+     'css': 0,
+     'children': [{'type': 'Text', 'props': {'text': 'Hi'}, 'css': 1}],
+     'styles': [{'': {'display': 'flex', 'flexDirection': 'column', ...}},
+                {'': {'fontSize': '1.5rem', 'fontWeight': '700', ...}}]}
+
+The runtime applies the values as they are, without its style helpers.
+Each unique combination of style props is resolved once per process.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Same tables as the runtime's style helpers
+COLORS = {
+    'primary': '#3b82f6',
+    'secondary': '#6b7280',
+    'success': '#10b981',
+    'danger': '#ef4444',
+    'warning': '#f59e0b',
+    'info': '#06b6d4',
+    'black': '#000000',
+    'white': '#ffffff',
+    'gray': '#6b7280',
+    'red': '#ef4444',
+    'blue': '#3b82f6',
+    'green': '#10b981',
+    'yellow': '#f59e0b',
+    'purple': '#8b5cf6',
+    'pink': '#ec4899',
+}
+
+FONT_SIZES = {
+    'xs': '0.75rem',
+    'sm': '0.875rem',
+    'md': '1rem',
+    'lg': '1.125rem',
+    'xl': '1.25rem',
+    '2xl': '1.5rem',
+    '3xl': '1.875rem',
+    '4xl': '2.25rem',
+}
+
+FONT_WEIGHTS = {'normal': '400', 'medium': '500', 'semibold': '600', 'bold': '700'}
+
+SHADOWS = {
+    'sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
+    'md': '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
+    'lg': '0 10px 15px -3px rgba(0, 0, 0, 0.1)',
+    'xl': '0 20px 25px -5px rgba(0, 0, 0, 0.1)',
+    '2xl': '0 25px 50px -12px rgba(0, 0, 0, 0.25)',
+    'none': 'none',
+}
+
+BUTTON_PADDINGS = {'sm': '0.5rem 1rem', 'md': '0.625rem 1.25rem', 'lg': '0.75rem 1.5rem', 'xl': '1rem 2rem'}
+
+BUTTON_FONT_SIZES = {'sm': '0.875rem', 'md': '1rem', 'lg': '1.125rem', 'xl': '1.25rem'}
+
+ALIGN = {'start': 'flex-start', 'center': 'center', 'end': 'flex-end', 'stretch': 'stretch'}
+
+JUSTIFY = {
+    'start': 'flex-start',
+    'center': 'center',
+    'end': 'flex-end',
+    'between': 'space-between',
+    'around': 'space-around',
+}
+
+# Selector suffix -> style property (camelCase, as in element.style) -> value
+Css = Dict[str, Dict[str, str]]
+
+_cache: Dict[Tuple[Any, ...], Optional[Css]] = {}
+_CACHE_SIZE = 4096
+
+
+class _Unresolvable(Exception):
+    """A prop value only the runtime knows how to handle"""
+
+
+# JavaScript semantics, since the runtime defines what each prop means
+
+def _truthy(value: Any) -> bool:
+    return value not in (None, False, '', 0)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _js(value: Any) -> str:
+    """String(value) as the runtime would see it after a JSON round trip"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if value is None:
+        return 'null'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    raise _Unresolvable
+
+
+def _lookup(table: Dict[str, str], key: Any) -> Optional[str]:
+    return table.get(key) if isinstance(key, str) else None
+
+
+def _size(size: Any) -> str:
+    if _is_number(size):
+        return f"{_js(size)}px"
+    if size == 'full':
+        return '100%'
+    return _js(size)
+
+
+def _spacing(spacing: Any) -> str:
+    if _is_number(spacing):
+        return f"{_js(spacing)}px"
+    if isinstance(spacing, dict):
+        return ' '.join(f"{_js(spacing.get(side, 0))}px" for side in ('top', 'right', 'bottom', 'left'))
+    return _js(spacing)
+
+
+def _color(color: Any) -> str:
+    if not isinstance(color, str):
+        # The runtime's parseColor only handles strings
+        raise _Unresolvable
+    if color.startswith('gradient-'):
+        parts = color.replace('gradient-', '').split('-')
+        if len(parts) == 2:
+            start, end = (COLORS.get(part) or part for part in parts)
+            return f"linear-gradient(135deg, {start}, {end})"
+    return COLORS.get(color) or color
+
+
+def _rounded(rounded: Any) -> str:
+    if isinstance(rounded, bool):
+        return '0.375rem' if rounded else '0'
+    if _is_number(rounded):
+        return f"{_js(rounded)}px"
+    return _js(rounded)
+
+
+def _border(border: Any) -> Optional[str]:
+    if _is_number(border):
+        return f"{_js(border)}px solid #d1d5db"
+    if isinstance(border, list):
+        raise _Unresolvable
+    if isinstance(border, dict):
+        width = border.get('width') if _truthy(border.get('width')) else 1
+        color = border.get('color') if _truthy(border.get('color')) else '#d1d5db'
+        style = border.get('style') if _truthy(border.get('style')) else 'solid'
+        return f"{_js(width)}px {_js(style)} {_js(color)}"
+    return None
+
+
+def _flex(props: Dict[str, Any], direction: str) -> Dict[str, str]:
+    return {
+        'display': 'flex',
+        'flexDirection': direction,
+        'alignItems': _lookup(ALIGN, props.get('align')) or 'stretch',
+        'justifyContent': _lookup(JUSTIFY, props.get('justify')) or 'flex-start',
+    }
+
+
+def _container(props: Dict[str, Any]) -> Css:
+    direction = props.get('direction')
+    styles = _flex(props, _js(direction) if _truthy(direction) else 'column')
+    if _truthy(props.get('width')):
+        styles['width'] = _size(props['width'])
+    if _truthy(props.get('height')):
+        styles['height'] = _size(props['height'])
+    if _truthy(props.get('padding')):
+        styles['padding'] = _spacing(props['padding'])
+    if _truthy(props.get('margin')):
+        styles['margin'] = _spacing(props['margin'])
+    if _truthy(props.get('background')):
+        styles['background'] = _color(props['background'])
+    if _truthy(props.get('border')):
+        border = _border(props['border'])
+        if border is not None:
+            styles['border'] = border
+    if _truthy(props.get('rounded')):
+        styles['borderRadius'] = _rounded(props['rounded'])
+    if _truthy(props.get('shadow')):
+        styles['boxShadow'] = _lookup(SHADOWS, props['shadow']) or _js(props['shadow'])
+    return {'': styles}
+
+
+def _row(props: Dict[str, Any]) -> Css:
+    styles = _flex(props, 'row')
+    spacing = props.get('spacing')
+    styles['gap'] = f"{_js(spacing) if _truthy(spacing) else 0}px"
+    styles['flexWrap'] = 'wrap' if _truthy(props.get('wrap')) else 'nowrap'
+    return {'': styles}
+
+
+def _column(props: Dict[str, Any]) -> Css:
+    styles = _flex(props, 'column')
+    spacing = props.get('spacing')
+    styles['gap'] = f"{_js(spacing) if _truthy(spacing) else 0}px"
+    return {'': styles}
+
+
+def _text(props: Dict[str, Any]) -> Css:
+    styles = {}
+    size = props.get('size')
+    if _truthy(size):
+        styles['fontSize'] = _lookup(FONT_SIZES, size) or (f"{_js(size)}px" if _is_number(size) else _js(size))
+    if _truthy(props.get('weight')):
+        styles['fontWeight'] = _lookup(FONT_WEIGHTS, props['weight']) or _js(props['weight'])
+    if _truthy(props.get('color')):
+        styles['color'] = _color(props['color'])
+    if _truthy(props.get('align')):
+        styles['textAlign'] = _js(props['align'])
+    if _truthy(props.get('italic')):
+        styles['fontStyle'] = 'italic'
+    if _truthy(props.get('underline')):
+        styles['textDecoration'] = 'underline'
+    if _truthy(props.get('font')):
+        styles['fontFamily'] = _js(props['font'])
+    return {'': styles}
+
+
+def _button(props: Dict[str, Any]) -> Css:
+    size, disabled = props.get('size'), _truthy(props.get('disabled'))
+    color, variant = _color(props.get('color')), props.get('variant')
+    styles = {
+        'padding': _lookup(BUTTON_PADDINGS, size) or BUTTON_PADDINGS['md'],
+        'fontSize': _lookup(BUTTON_FONT_SIZES, size) or BUTTON_FONT_SIZES['md'],
+        'borderRadius': '0.375rem' if _truthy(props.get('rounded')) else '0',
+        'border': 'none',
+        'cursor': 'not-allowed' if disabled else 'pointer',
+        'opacity': '0.5' if disabled else '1',
+        'fontWeight': '500',
+        'transition': 'all 0.2s',
+    }
+    if variant == 'outline':
+        styles.update({'background': 'transparent', 'color': color, 'border': f"2px solid {color}"})
+    elif variant in ('ghost', 'link'):
+        styles.update({'background': 'transparent', 'color': color, 'border': 'none'})
+        if variant == 'link':
+            styles['textDecoration'] = 'underline'
+    else:
+        styles.update({'background': color, 'color': '#ffffff', 'border': 'none'})
+
+    rules = {'': styles}
+    if not disabled:
+        rules[':hover'] = {'transform': 'translateY(-1px)', 'boxShadow': '0 4px 6px rgba(0,0,0,0.1)'}
+    return rules
+
+
+def _image(props: Dict[str, Any]) -> Css:
+    styles = {}
+    if _truthy(props.get('width')):
+        styles['width'] = _size(props['width'])
+    if _truthy(props.get('height')):
+        styles['height'] = _size(props['height'])
+    if _truthy(props.get('fit')):
+        styles['objectFit'] = _js(props['fit'])
+    if _truthy(props.get('rounded')):
+        styles['borderRadius'] = _rounded(props['rounded'])
+    return {'': styles}
+
+
+def _link(props: Dict[str, Any]) -> Css:
+    return {'': {
+        'color': _color(props.get('color')),
+        'textDecoration': 'underline' if _truthy(props.get('underline')) else 'none',
+    }}
+
+
+def _spacer(props: Dict[str, Any]) -> Css:
+    size = props.get('size')
+    return {'': {'flex': f"0 0 {_js(size)}px" if _truthy(size) else '1'}}
+
+
+# Widget type -> (props that only affect styling, resolver)
+RESOLVERS: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Css]]] = {
+    'Container': (('direction', 'align', 'justify', 'width', 'height', 'padding', 'margin',
+                   'background', 'border', 'rounded', 'shadow'), _container),
+    'Row': (('align', 'justify', 'spacing', 'wrap'), _row),
+    'Column': (('align', 'justify', 'spacing'), _column),
+    'Text': (('size', 'weight', 'color', 'align', 'italic', 'underline', 'font'), _text),
+    'Heading': (('size', 'weight', 'color', 'align', 'italic', 'underline', 'font'), _text),
+    'Button': (('size', 'rounded', 'disabled', 'color', 'variant'), _button),
+    'Image': (('width', 'height', 'fit', 'rounded'), _image),
+    'Link': (('color', 'underline'), _link),
+    'Spacer': (('size',), _spacer),
+}
+
+_STYLE_PROPS = {widget_type: frozenset(names) for widget_type, (names, _) in RESOLVERS.items()}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a prop value, keeping its type"""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def resolve_css(widget_type: str, props: Dict[str, Any]) -> Optional[Css]:
+    """Final CSS for a node's style props, or None if the runtime should resolve them"""
+    entry = RESOLVERS.get(widget_type)
+    if entry is None:
+        return None
+    names, resolver = entry
+    values = tuple(map(props.get, names))
+    try:
+        # Types too: True == 1, but rounded=True and rounded=1 resolve differently
+        key = (widget_type, values, tuple(map(type, values)))
+        return _cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Dicts such as padding={'top': 4}
+        try:
+            key = (widget_type, tuple(map(_freeze, values)))
+            if key in _cache:
+                return _cache[key]
+        except TypeError:
+            # Unhashable or unsortable values, e.g. a set; let the runtime deal with them
+            return None
+
+    try:
+        css = resolver(props)
+    except _Unresolvable:
+        css = None
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.clear()
+    _cache[key] = css
+    return css
+
+
+class StyleTable:
+    """The unique resolved styles of one serialized tree
+
+    Nodes refer to their entry by index, so each distinct style is sent
+    once per tree however many nodes share it.
+    """
+
+    def __init__(self):
+        self.styles: List[Css] = []
+        # Resolved styles are cached, so identical ones are the same object
+        self._indexes: Dict[int, int] = {}
+
+    def add(self, css: Css) -> int:
+        index = self._indexes.get(id(css))
+        if index is None:
+            index = self._indexes[id(css)] = len(self.styles)
+            self.styles.append(css)
+        return index
+
+    def resolve_node(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a serialized node's style props with its entry's index"""
+        props = data.get('props')
+        if props is None:
+            return data
+        css = resolve_css(data.get('type'), props)
+        if css is not None:
+            names = _STYLE_PROPS[data['type']]
+            # Widgets may share their props dict with the node; never mutate it
+            data['props'] = {key: value for key, value in props.items() if key not in names}
+            data['css'] = self.add(css)
+        return data
@@ -0,0 +1,6 @@
+"""Load testing module for DreamWeb"""
+
+from dreamweb.loadtest.runner import LoadTest, LoadTestReport, local_server
+from dreamweb.loadtest.script import load_script
+
+__all__ = ["LoadTest", "LoadTestReport", "local_server", "load_script"]
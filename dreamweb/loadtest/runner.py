@@ -0,0 +1,289 @@
+"""
+WebSocket load generator for DreamWeb servers
+
+Each simulated client connects to the server's WebSocket endpoint, replays
+an event script and times how long the server takes to push the update
+each event caused. Everything runs on localhost.
+"""
+
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import re
+import socket
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from dreamweb.loadtest.script import default_script, resolve_step
+
+
+# The dev server inlines the initial tree into the page it serves
+_TREE_PATTERN = re.compile(r'const componentTree = (.*?);\s*const runtime', re.S)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def fetch_tree(url: str, timeout: float = 5.0) -> Dict[str, Any]:
+    """Fetch the component tree embedded in the page a server returns"""
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        html = response.read().decode('utf-8')
+    match = _TREE_PATTERN.search(html)
+    if not match:
+        raise ValueError(f"No component tree found in the page served at {url}")
+    return json.loads(match.group(1))
+
+
+class _ClientStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.timeouts = 0
+        self.unresolved = 0
+        self.messages = 0
+        self.updates = 0
+        self.update_bytes = 0
+
+
+class LoadTestReport:
+    """Aggregated results of a load test run"""
+
+    def __init__(self, clients: int, elapsed: float, stats: List[_ClientStats]):
+        self.clients = clients
+        self.elapsed = elapsed
+        self.latencies = [latency for s in stats for latency in s.latencies]
+        self.timeouts = sum(s.timeouts for s in stats)
+        self.unresolved = sum(s.unresolved for s in stats)
+        self.messages = sum(s.messages for s in stats)
+        self.updates = sum(s.updates for s in stats)
+        self.update_bytes = sum(s.update_bytes for s in stats)
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.latencies, 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.latencies, 95)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.latencies, 99)
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed or 1e-9
+        return {
+            'clients': self.clients,
+            'elapsed_s': round(self.elapsed, 4),
+            'events': len(self.latencies),
+            'timeouts': self.timeouts,
+            'unresolved': self.unresolved,
+            'latency_ms': {
+                'p50': round(self.p50 * 1000, 3),
+                'p95': round(self.p95 * 1000, 3),
+                'p99': round(self.p99 * 1000, 3),
+                'max': round(max(self.latencies, default=0.0) * 1000, 3),
+            },
+            'events_per_s': round(len(self.latencies) / elapsed, 2),
+            'messages_per_s': round(self.messages / elapsed, 2),
+            'bytes_per_update': round(self.update_bytes / self.updates) if self.updates else 0,
+        }
+
+    def format(self) -> str:
+        data = self.to_dict()
+        latency = data['latency_ms']
+        return (
+            f"📊 Load test: {self.clients} clients, {data['events']} events in {self.elapsed:.2f}s\n"
+            f"   Latency     p50 {latency['p50']:.1f} ms   p95 {latency['p95']:.1f} ms   "
+            f"p99 {latency['p99']:.1f} ms   (max {latency['max']:.1f} ms)\n"
+            f"   Throughput  {data['events_per_s']:.1f} events/s   {data['messages_per_s']:.1f} messages/s\n"
+            f"   Payload     {data['bytes_per_update'] / 1024:.1f} KB per update\n"
+            f"   Timeouts    {self.timeouts}   Unresolved steps {self.unresolved}"
+        )
+
+
+class LoadTest:
+    """Drive simulated WebSocket clients against a running DreamWeb server"""
+
+    def __init__(
+        self,
+        target: str,
+        script: Optional[List[Dict[str, Any]]] = None,
+        clients: int = 10,
+        events: int = 100,
+        duration: Optional[float] = None,
+        timeout: float = 5.0,
+        think: float = 0.0,
+    ):
+        self.target = target
+        self.script = script
+        self.clients = clients
+        self.events = events
+        self.duration = duration
+        self.timeout = timeout
+        self.think = think
+
+        # The WebSocket server listens on the HTTP port + 1
+        parts = urlsplit(target)
+        self.ws_url = f"ws://{parts.hostname}:{(parts.port or 80) + 1}"
+
+    def run(self) -> LoadTestReport:
+        """Run the load test and return its report"""
+        tree = fetch_tree(self.target, self.timeout)
+        script = self.script or default_script(tree)
+        if not script:
+            raise ValueError("No click handlers found in the served tree; pass an event script")
+        return asyncio.run(self._run(tree, script))
+
+    async def _run(self, tree: Dict[str, Any], script: List[Dict[str, Any]]) -> LoadTestReport:
+        stats = [_ClientStats() for _ in range(self.clients)]
+        started = time.perf_counter()
+        deadline = started + self.duration if self.duration else None
+        await asyncio.gather(*(
+            self._client(index, tree, script, stats[index], deadline)
+            for index in range(self.clients)
+        ))
+        return LoadTestReport(self.clients, time.perf_counter() - started, stats)
+
+    async def _client(self, index: int, tree: Dict[str, Any], script: List[Dict[str, Any]],
+                      stats: _ClientStats, deadline: Optional[float]):
+        import websockets
+
+        loop = asyncio.get_running_loop()
+        pending: Dict[str, asyncio.Future] = {}
+        current = {'tree': tree}
+
+        async with websockets.connect(self.ws_url, max_size=None) as ws:
+
+            async def reader():
+                # Drain every broadcast, like a browser would, so the server
+                # never blocks on a slow simulated client
+                async for raw in ws:
+                    stats.messages += 1
+                    message = json.loads(raw)
+                    if message.get('type') != 'reload':
+                        continue
+                    stats.updates += 1
+                    stats.update_bytes += len(raw)
+                    current['tree'] = message['tree']
+                    if 'event' in message:
+                        future = pending.pop(message['event'], None)
+                    else:
+                        # Server doesn't tag updates; credit the oldest event
+                        future = pending.pop(next(iter(pending)), None) if pending else None
+                    if future and not future.done():
+                        future.set_result(None)
+
+            reader_task = asyncio.ensure_future(reader())
+            try:
+                n = 0
+                misses = 0
+                while True:
+                    if deadline is None and n >= self.events:
+                        break
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+
+                    step = script[n % len(script)]
+                    n += 1
+                    resolved = resolve_step(current['tree'], step)
+                    if resolved is None:
+                        stats.unresolved += 1
+                        misses += 1
+                        if misses >= len(script):
+                            # A whole pass of the script matched nothing in the tree
+                            break
+                        # Let the reader refresh the tree before the next step
+                        await asyncio.sleep(self.think or 0)
+                        continue
+                    misses = 0
+
+                    handler_id, value = resolved
+                    event_id = f"{index}-{n}"
+                    future = loop.create_future()
+                    pending[event_id] = future
+
+                    sent_at = time.perf_counter()
+                    await ws.send(json.dumps({
+                        'type': 'event',
+                        'event': step.get('event', 'click'),
+                        'handler': handler_id,
+                        'value': value,
+                        'id': event_id,
+                    }))
+                    try:
+                        await asyncio.wait_for(future, self.timeout)
+                        stats.latencies.append(time.perf_counter() - sent_at)
+                    except asyncio.TimeoutError:
+                        pending.pop(event_id, None)
+                        stats.timeouts += 1
+
+                    if self.think:
+                        await asyncio.sleep(self.think)
+            finally:
+                reader_task.cancel()
+
+
+def _free_port_pair(host: str) -> int:
+    """Find a port whose successor (the WebSocket port) is also free"""
+    for _ in range(50):
+        with socket.socket() as s:
+            s.bind((host, 0))
+            port = s.getsockname()[1]
+        try:
+            with socket.socket() as s:
+                s.bind((host, port + 1))
+        except OSError:
+            continue
+        return port
+    raise OSError("Could not find a free pair of ports")
+
+
+def _serve_app(app_path: str, host: str, port: int):
+    # Keep the server's banner and request log out of the report
+    sys.stdout = open(os.devnull, 'w')
+
+    from dreamweb.cli.loader import load_app
+    from dreamweb.server import DevServer
+
+    DevServer(load_app(app_path), port=port, host=host, watch=False).start()
+
+
+@contextmanager
+def local_server(app_path: str, host: str = "127.0.0.1", startup_timeout: float = 15.0):
+    """Run an app's dev server in a child process; yields its HTTP URL"""
+    port = _free_port_pair(host)
+    process = multiprocessing.Process(target=_serve_app, args=(app_path, host, port), daemon=True)
+    process.start()
+
+    url = f"http://{host}:{port}/"
+    deadline = time.monotonic() + startup_timeout
+    try:
+        while True:
+            if not process.is_alive():
+                raise RuntimeError(f"Server for {app_path} exited during startup")
+            try:
+                with urllib.request.urlopen(url, timeout=1):
+                    pass
+                with socket.create_connection((host, port + 1), timeout=1):
+                    break
+            except (urllib.error.URLError, OSError):
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Server for {app_path} didn't start within {startup_timeout}s")
+                time.sleep(0.1)
+        yield url
+    finally:
+        process.terminate()
+        process.join(5)
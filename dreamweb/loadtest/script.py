@@ -0,0 +1,85 @@
+"""
+Event scripts for replaying user interactions against a DreamWeb tree
+
+A script is a JSON list of steps. Each step names an event and the node
+to send it to, matched by widget type and props, since handler IDs
+change between builds:
+
+    [
+        {"event": "click", "match": {"type": "Button", "text": "Increment"}},
+        {"event": "change", "match": {"type": "TextField"}, "value": "hello"}
+    ]
+
+A step may also give a literal handler ID with {"handler": "on_click_..."}.
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Events a user can trigger directly; API callbacks are fired by the runtime
+USER_EVENTS = ('click', 'change')
+
+
+def iter_handlers(tree: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], str, str]]:
+    """Yield (node, event, handler_id) for every event handler in a tree"""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        for event, handler_id in (node.get('events') or {}).items():
+            yield node, event, handler_id
+        # Reversed so handlers come out in document order
+        stack.extend(reversed(node.get('children') or []))
+
+
+def _matches(node: Dict[str, Any], match: Dict[str, Any]) -> bool:
+    props = node.get('props') or {}
+    for key, expected in match.items():
+        actual = node.get('type') if key == 'type' else props.get(key)
+        if actual != expected:
+            return False
+    return True
+
+
+def resolve_step(tree: Dict[str, Any], step: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+    """Find the (handler_id, value) a step targets in the current tree"""
+    if 'handler' in step:
+        return step['handler'], step.get('value')
+
+    event = step.get('event', 'click')
+    match = step.get('match') or {}
+    for node, node_event, handler_id in iter_handlers(tree):
+        if node_event == event and _matches(node, match):
+            return handler_id, step.get('value')
+    return None
+
+
+def default_script(tree: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build a script that clicks every clickable node in the tree once"""
+    steps = []
+    for node, event, handler_id in iter_handlers(tree):
+        if event != 'click':
+            continue
+        match = {'type': node.get('type')}
+        text = (node.get('props') or {}).get('text')
+        if text is not None:
+            match['text'] = text
+        steps.append({'event': event, 'match': match})
+    return steps
+
+
+def load_script(path: str) -> List[Dict[str, Any]]:
+    """Load and validate an event script file"""
+    with open(path, 'r') as f:
+        steps = json.load(f)
+
+    if not isinstance(steps, list):
+        raise ValueError(f"{path}: an event script must be a JSON list of steps")
+    for i, step in enumerate(steps):
+        if not isinstance(step, dict):
+            raise ValueError(f"{path}: step {i} must be an object")
+        if 'handler' not in step and step.get('event', 'click') not in USER_EVENTS:
+            raise ValueError(f"{path}: step {i} has unsupported event {step.get('event')!r}")
+    return steps
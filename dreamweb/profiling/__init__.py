@@ -0,0 +1,6 @@
+"""Profiling module for DreamWeb"""
+
+from dreamweb.profiling.session import ProfileSession
+from dreamweb.profiling.tracer import CallTracer
+
+__all__ = ["CallTracer", "ProfileSession"]
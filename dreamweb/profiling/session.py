@@ -0,0 +1,138 @@
+"""
+Profile a DreamWeb app's build, serialization and event handling
+
+One traced run builds the app, serializes its tree, then replays an
+event script, re-rendering after each event the way the dev server
+does. Costs are aggregated by widget class, by the project's own
+functions (build helpers) and by event handler.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+from dreamweb.loadtest.script import default_script, resolve_step
+from dreamweb.profiling.tracer import CallTracer
+
+if TYPE_CHECKING:
+    from dreamweb.core import App
+
+
+class HandlerCost(NamedTuple):
+    name: str
+    events: int
+    handler_ns: int
+    render_ns: int
+
+
+def _handler_name(handler: Any, tracer: CallTracer) -> str:
+    """`increment (main.py:12)` for a function, lambda or bound method"""
+    function = getattr(handler, '__func__', handler)
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return repr(handler)
+    name = getattr(function, '__qualname__', code.co_name)
+    return f"{name} ({tracer.short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfileSession:
+    """Trace one app through build, serialize and a replayed event script"""
+
+    def __init__(self, app: 'App', script: Optional[List[Dict[str, Any]]] = None,
+                 project_dir: Optional[str] = None):
+        self.app = app
+        self.script = script
+        self.tracer = CallTracer(Path(project_dir or os.getcwd()))
+        self.phases: Dict[str, int] = {}
+        self.handlers: Dict[str, HandlerCost] = {}
+        self.unresolved = 0
+
+    def _timed(self, phase: str, fn, *args):
+        started = time.perf_counter_ns()
+        result = self.tracer.run(phase, fn, *args)
+        self.phases[phase] = self.phases.get(phase, 0) + time.perf_counter_ns() - started
+        return result
+
+    def _serialize(self, phase: str, widget):
+        self.app._event_handlers = {}
+        tree = self._timed(phase, self.app._widget_to_dict, widget)
+        # The dev server sends every tree as JSON
+        self._timed(phase, json.dumps, tree)
+        return tree
+
+    def run(self) -> 'ProfileSession':
+        widget = self._timed('build', self.app.build)
+        tree = self._serialize('serialize', widget)
+
+        steps = self.script if self.script is not None else default_script(tree)
+        for step in steps:
+            resolved = resolve_step(tree, step)
+            if resolved is None:
+                self.unresolved += 1
+                continue
+            handler_id, value = resolved
+            handler = self.app._event_handlers.get(handler_id)
+            name = _handler_name(handler, self.tracer) if handler else handler_id
+
+            before = dict(self.phases)
+            self._timed('events', self.app._handle_event, handler_id, value)
+            widget = self._timed('re-render', self.app.build)
+            tree = self._serialize('re-render', widget)
+
+            cost = self.handlers.get(name) or HandlerCost(name, 0, 0, 0)
+            self.handlers[name] = cost._replace(
+                events=cost.events + 1,
+                handler_ns=cost.handler_ns + self.phases['events'] - before.get('events', 0),
+                render_ns=cost.render_ns + self.phases['re-render'] - before.get('re-render', 0),
+            )
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        ms = 1e6
+        tracer = self.tracer
+        return {
+            'phases_ms': {phase: ns / ms for phase, ns in self.phases.items()},
+            'widgets': [
+                {'type': name, 'instances': count, 'ms': ns / ms}
+                for name, (count, ns) in sorted(tracer.widgets.items(), key=lambda item: -item[1][1])
+            ],
+            'helpers': [
+                {'function': tracer.label(key), 'calls': entry[1], 'cumulative_ms': entry[3] / ms,
+                 'self_ms': entry[2] / ms}
+                for key, entry in sorted(tracer.user_functions(), key=lambda item: -item[1][3])
+            ],
+            'handlers': [
+                {'handler': cost.name, 'events': cost.events, 'handler_ms': cost.handler_ns / ms,
+                 'render_ms': cost.render_ns / ms}
+                for cost in sorted(self.handlers.values(), key=lambda c: -(c.handler_ns + c.render_ns))
+            ],
+            'unresolved_steps': self.unresolved,
+        }
+
+    def format(self, top: int = 10) -> str:
+        data = self.to_dict()
+        lines = ["🔬 Profile (times include tracing overhead; compare them with each other)"]
+        lines.append("   Phases")
+        for phase, value in data['phases_ms'].items():
+            lines.append(f"      {value:10.2f} ms  {phase}")
+
+        lines.append("   Widget classes (self time in their methods)")
+        for row in data['widgets'][:top]:
+            lines.append(f"      {row['ms']:10.2f} ms  {row['type']} (x{row['instances']})")
+
+        if data['helpers']:
+            lines.append("   Project functions (cumulative)")
+            for row in data['helpers'][:top]:
+                lines.append(f"      {row['cumulative_ms']:10.2f} ms  {row['function']} "
+                             f"({row['calls']} call{'s' if row['calls'] != 1 else ''})")
+
+        if data['handlers']:
+            lines.append("   Event handlers (handler + re-render)")
+            for row in data['handlers'][:top]:
+                lines.append(f"      {row['handler_ms']:10.2f} ms + {row['render_ms']:8.2f} ms  "
+                             f"{row['handler']} (x{row['events']})")
+        if self.unresolved:
+            lines.append(f"   ⚠️  {self.unresolved} script steps matched no handler")
+        return '\n'.join(lines)
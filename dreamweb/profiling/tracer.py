@@ -0,0 +1,203 @@
+"""
+Deterministic call tracer for profiling DreamWeb apps
+
+cProfile only keeps caller/callee pairs, which can't tell which widget a
+Widget.__init__ call was building or produce full stacks for a
+flamegraph. The tracer records every call with its whole stack instead,
+and writes the same statistics cProfile does, so pstats and tools like
+snakeviz can read its output.
+"""
+
+import marshal
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from dreamweb.core.widget import Widget
+
+
+# (filename, first line, function name), the key pstats uses
+FunctionKey = Tuple[str, int, str]
+
+_DREAMWEB_DIR = Path(__file__).resolve().parent.parent
+
+
+def _builtin_key(fn: Any) -> FunctionKey:
+    """Key for a C function, named the way cProfile names them"""
+    name = getattr(fn, '__name__', repr(fn))
+    owner = getattr(fn, '__objclass__', None)
+    bound = getattr(fn, '__self__', None)
+    if owner is None and bound is not None and not isinstance(bound, type(sys)):
+        owner = type(bound)
+    if owner is not None:
+        return ('~', 0, f"<method '{name}' of '{owner.__name__}' objects>")
+    module = getattr(fn, '__module__', None)
+    return ('~', 0, f"<built-in method {module + '.' if module else ''}{name}>")
+
+
+class _Call:
+    __slots__ = ('key', 'label', 'frame', 'start', 'children', 'widget', 'instance')
+
+    def __init__(self, key, label, frame, start, widget, instance):
+        self.key = key
+        self.label = label
+        self.frame = frame
+        self.start = start
+        self.children = 0
+        self.widget = widget
+        self.instance = instance
+
+
+class CallTracer:
+    """Record calls, self/cumulative times and full stacks via sys.setprofile
+
+    Times are in nanoseconds and include the tracer's own overhead, which
+    is roughly the same for every call.
+    """
+
+    def __init__(self, project_dir: Optional[Path] = None):
+        self.project_dir = project_dir.resolve() if project_dir else None
+        # key -> [primitive calls, calls, self time, cumulative time, callers]
+        self.stats: Dict[FunctionKey, List[Any]] = {}
+        # Stack of labels -> self time, for collapsed-stack flamegraphs
+        self.stacks: Dict[Tuple[str, ...], int] = defaultdict(int)
+        # Widget class -> [instances, self time spent in its methods]
+        self.widgets: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self._stack: List[_Call] = []
+        self._labels: List[str] = []
+        self._active: Dict[FunctionKey, int] = defaultdict(int)
+        self._label_cache: Dict[Any, str] = {}
+
+    def run(self, phase: str, fn: Callable[..., Any], *args) -> Any:
+        """Call fn(*args), tracing everything it calls under a root named phase"""
+        self._labels = [phase]
+        self._stack = []
+        sys.setprofile(self._event)
+        try:
+            return fn(*args)
+        finally:
+            sys.setprofile(None)
+            # Only the call to sys.setprofile itself is still open
+            self._stack = []
+            self._active.clear()
+
+    def _label(self, key: FunctionKey, code=None) -> str:
+        label = self._label_cache.get(key)
+        if label is None:
+            if code is None:
+                label = key[2]
+            else:
+                name = getattr(code, 'co_qualname', code.co_name)
+                label = f"{name} ({self.short_path(key[0])}:{key[1]})"
+            self._label_cache[key] = label
+        return label
+
+    def short_path(self, filename: str) -> str:
+        path = Path(filename)
+        for root, prefix in ((self.project_dir, ''), (_DREAMWEB_DIR, 'dreamweb/')):
+            if root and root in path.parents:
+                return prefix + path.relative_to(root).as_posix()
+        return path.name
+
+    def _event(self, frame: FrameType, event: str, arg: Any):
+        now = time.perf_counter_ns()
+        if event == 'call':
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            parent = self._stack[-1] if self._stack else None
+            widget = parent.widget if parent else None
+            instance = parent.instance if parent else None
+            if code.co_argcount and code.co_varnames[0] == 'self':
+                target = frame.f_locals.get('self')
+                if isinstance(target, Widget):
+                    if code.co_name == '__init__' and id(target) != instance:
+                        # Counted once, not again for each super().__init__
+                        self.widgets[type(target).__name__][0] += 1
+                    widget, instance = type(target).__name__, id(target)
+            self._push(_Call(key, self._label(key, code), frame, now, widget, instance))
+        elif event == 'c_call':
+            key = _builtin_key(arg)
+            parent = self._stack[-1] if self._stack else None
+            self._push(_Call(key, self._label(key), None, now,
+                             parent.widget if parent else None, parent.instance if parent else None))
+        elif event == 'return':
+            # Usually the top entry; frames entered before tracing started have none
+            for i in range(len(self._stack) - 1, -1, -1):
+                if self._stack[i].frame is frame:
+                    while len(self._stack) > i:
+                        self._finish(self._stack[-1], now)
+                    break
+        elif self._stack and self._stack[-1].frame is None:
+            # c_return / c_exception
+            self._finish(self._stack[-1], now)
+
+    def _push(self, call: _Call):
+        self._stack.append(call)
+        self._labels.append(call.label)
+        self._active[call.key] += 1
+
+    def _finish(self, call: _Call, now: int):
+        elapsed = now - call.start
+        own = elapsed - call.children
+        self.stacks[tuple(self._labels)] += own
+        self._stack.pop()
+        self._labels.pop()
+
+        self._active[call.key] -= 1
+        primitive = not self._active[call.key]
+        caller = self._stack[-1] if self._stack else None
+        if caller:
+            caller.children += elapsed
+        if call.widget:
+            self.widgets[call.widget][1] += own
+
+        entry = self.stats.get(call.key)
+        if entry is None:
+            entry = self.stats[call.key] = [0, 0, 0, 0, {}]
+        entry[0] += primitive
+        entry[1] += 1
+        entry[2] += own
+        if primitive:
+            entry[3] += elapsed
+        if caller:
+            edge = entry[4].setdefault(caller.key, [0, 0, 0, 0])
+            edge[0] += 1
+            edge[1] += primitive
+            edge[2] += own
+            if primitive:
+                edge[3] += elapsed
+
+    def user_functions(self) -> Iterator[Tuple[FunctionKey, List[Any]]]:
+        """Stats of functions defined in the project directory"""
+        if not self.project_dir:
+            return
+        for key, entry in self.stats.items():
+            # Skip C functions and <frozen ...> or <string> code
+            if not key[0].startswith(('~', '<')) and self.project_dir in Path(key[0]).resolve().parents:
+                yield key, entry
+
+    def label(self, key: FunctionKey) -> str:
+        return self._label_cache.get(key, key[2])
+
+    def write_pstats(self, path: str):
+        """Write statistics in the marshal format pstats.Stats loads"""
+        seconds = 1e9
+        stats = {}
+        for key, (cc, nc, tt, ct, callers) in self.stats.items():
+            stats[key] = (cc, nc, tt / seconds, ct / seconds, {
+                caller: (edge_nc, edge_cc, edge_tt / seconds, edge_ct / seconds)
+                for caller, (edge_nc, edge_cc, edge_tt, edge_ct) in callers.items()
+            })
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+
+    def write_collapsed(self, path: str):
+        """Write `frame;frame;frame microseconds` lines for flamegraph.pl or speedscope"""
+        with open(path, 'w') as f:
+            for stack, nanoseconds in sorted(self.stacks.items()):
+                micros = nanoseconds // 1000
+                if micros:
+                    f.write(';'.join(label.replace(';', ',') for label in stack) + f" {micros}\n")
@@ -8,23 +8,47 @@ class DreamWebRuntime {
     constructor(rootElement) {
         this.root = rootElement;
         this.componentTree = null;
+        this.delegatedEvents = new Set();
         this.eventHandlers = new Map();
         this.stateValues = new Map();
         this.ws = null;
+        // Newest tree from the server, waiting for the next animation frame
+        this.pendingTree = null;
+        // Inputs bound to a State (bind=...): the browser owns their values
+        this.bindings = new Map();
+        this.boundElements = new Map();
+        this.bindSeq = 0;
+        this.clientId = Math.random().toString(36).slice(2);
+        // Keys of the API requests in the current and the previous render
+        this.apiKeys = new Set();
+        this.previousApiKeys = new Set();
     }
 
     // Initialize the runtime
     init(componentTree) {
         this.componentTree = componentTree;
         this.render();
+        // @feature hot-reload
         this.setupHotReload();
+        // @end
     }
 
     // Render the component tree
     render() {
+        // Classes of the current tree's resolved styles, by table index
+        this.cssClasses = [];
+        // @feature TextField Slider
+        const focused = this.focusedBinding();
+        this.boundElements.clear();
+        // @end
+        this.previousApiKeys = this.apiKeys;
+        this.apiKeys = new Set();
         this.root.innerHTML = '';
         const element = this.createElement(this.componentTree);
         this.root.appendChild(element);
+        // @feature TextField Slider
+        if (focused) this.restoreFocus(focused);
+        // @end
     }
 
     // Create DOM element from component
@@ -40,95 +64,156 @@ class DreamWebRuntime {
 
         // Create element based on type
         switch (component.type) {
+            // @feature Container
             case 'Container':
+                element = document.createElement('div');
+                if (component.css === undefined) this.applyContainerStyles(element, component.props);
+                break;
+            // @end
+
+            // @feature Row
             case 'Row':
+                element = document.createElement('div');
+                if (component.css === undefined) this.applyRowStyles(element, component.props);
+                break;
+            // @end
+
+            // @feature Column
             case 'Column':
+                element = document.createElement('div');
+                if (component.css === undefined) this.applyColumnStyles(element, component.props);
+                break;
+            // @end
+
+            // @feature Center
             case 'Center':
+                element = document.createElement('div');
+                this.styleClass(element, ['Center'], () => ({
+                    display: 'flex',
+                    alignItems: 'center',
+                    justifyContent: 'center',
+                    width: '100%',
+                    height: '100%'
+                }));
+                break;
+            // @end
+
+            // @feature Stack
             case 'Stack':
+                element = document.createElement('div');
+                this.styleClass(element, ['Stack'], () => ({
+                    position: 'relative',
+                    width: '100%',
+                    height: '100%'
+                }));
+                break;
+            // @end
+
+            // @feature Spacer
             case 'Spacer':
                 element = document.createElement('div');
-                if (component.type === 'Container') this.applyContainerStyles(element, component.props);
-                else if (component.type === 'Row') this.applyRowStyles(element, component.props);
-                else if (component.type === 'Column') this.applyColumnStyles(element, component.props);
-                else if (component.type === 'Center') {
-                    element.style.display = 'flex';
-                    element.style.alignItems = 'center';
-                    element.style.justifyContent = 'center';
-                    element.style.width = '100%';
-                    element.style.height = '100%';
-                }
-                else if (component.type === 'Stack') {
-                    element.style.position = 'relative';
-                    element.style.width = '100%';
-                    element.style.height = '100%';
-                }
-                else if (component.type === 'Spacer') {
-                    element.style.flex = component.props.size ? `0 0 ${component.props.size}px` : '1';
+                if (component.css === undefined) {
+                    this.styleClass(element, ['Spacer', component.props.size], () => ({
+                        flex: component.props.size ? `0 0 ${component.props.size}px` : '1'
+                    }));
                 }
                 break;
+            // @end
 
+            // @feature Text
             case 'Text':
                 element = document.createElement('span');
-                this.applyTextStyles(element, component.props);
+                if (component.css === undefined) this.applyTextStyles(element, component.props);
                 element.textContent = component.props.text;
                 break;
+            // @end
 
+            // @feature Heading
             case 'Heading':
                 element = document.createElement(`h${component.props.level || 1}`);
-                this.applyTextStyles(element, component.props);
+                if (component.css === undefined) this.applyTextStyles(element, component.props);
                 element.textContent = component.props.text;
                 break;
+            // @end
 
+            // @feature Button
             case 'Button':
                 element = this.createButton(component);
                 break;
+            // @end
 
+            // @feature TextField
             case 'TextField':
                 element = this.createTextField(component);
                 break;
+            // @end
+
+            // @feature Slider
+            case 'Slider':
+                element = this.createSlider(component);
+                break;
+            // @end
 
+            // @feature Checkbox
             case 'Checkbox':
                 element = this.createCheckbox(component);
                 break;
+            // @end
 
+            // @feature Image
             case 'Image':
                 element = this.createImage(component);
                 break;
+            // @end
 
+            // @feature Link
             case 'Link':
                 element = this.createLink(component);
                 break;
+            // @end
 
+            // @feature Html
             case 'Html':
                 element = document.createElement('div');
                 element.innerHTML = component.props.html;
                 break;
+            // @end
 
+            // @feature Css
             case 'Css':
                 element = document.createElement('style');
                 element.textContent = component.props.css;
                 break;
+            // @end
 
+            // @feature ApiRequest FetchData
             case 'ApiRequest':
             case 'FetchData':
                 // API widgets don't render visible elements
                 element = document.createElement('div');
-                element.style.display = 'none';
+                this.styleClass(element, ['hidden'], () => ({ display: 'none' }));
                 // Trigger the API request
                 this.handleApiRequest(component);
                 break;
+            // @end
 
             default:
                 console.warn(`Unknown component type: ${component.type}`);
                 element = document.createElement('div');
         }
 
+        // Styles the server resolved (App(resolve_styles=True)) stand in for
+        // the style props it left out; renderers skip their own
+        if (component.css !== undefined) {
+            this.applyCss(element, component.css);
+        }
+
         // Render children
         if (component.children && component.children.length > 0) {
             // Some components might handle children internally or not support them
             // For now, we append children to all container-like elements
             // Button, Input etc usually don't have children in this model
-            if (!['Button', 'TextField', 'Checkbox', 'Image', 'Css'].includes(component.type)) {
+            if (!['Button', 'TextField', 'Slider', 'Checkbox', 'Image', 'Css'].includes(component.type)) {
                 component.children.forEach(child => {
                     const childElement = this.createElement(child);
                     element.appendChild(childElement);
@@ -144,100 +229,163 @@ class DreamWebRuntime {
         return element;
     }
 
+    // Style classes
+    // Each distinct combination of style props is resolved once, into a
+    // generated class in a shared stylesheet; every later node with the same
+    // props only gets the class name assigned
+    styleClass(element, key, resolve, extraRules) {
+        const classes = DreamWebRuntime.styleClasses;
+        const id = JSON.stringify(key);
+        let name = classes.get(id);
+        if (name === undefined) {
+            name = `dw-${classes.size.toString(36)}`;
+            this.addStyleRule(`.${name}`, resolve());
+            if (extraRules) {
+                for (const [pseudo, styles] of Object.entries(extraRules)) {
+                    this.addStyleRule(`.${name}${pseudo}`, styles);
+                }
+            }
+            classes.set(id, name);
+        }
+        element.className = name;
+        return name;
+    }
+
+    // css indexes the tree's table of resolved styles
+    applyCss(element, css) {
+        let name = this.cssClasses[css];
+        if (name === undefined) {
+            const entry = this.componentTree.styles[css];
+            const { '': styles, ...states } = entry;
+            name = this.cssClasses[css] = this.styleClass(element, ['css', entry], () => styles, states);
+        }
+        element.className = name;
+    }
+
+    addStyleRule(selector, styles) {
+        const sheet = this.styleSheet();
+        // Declarations go through the CSSOM like inline styles, so prop values
+        // can't break out of the rule
+        const index = sheet.insertRule(`${selector}{}`, sheet.cssRules.length);
+        Object.assign(sheet.cssRules[index].style, styles);
+    }
+
+    styleSheet() {
+        if (!DreamWebRuntime.sheet) {
+            if (typeof CSSStyleSheet !== 'undefined' && 'adoptedStyleSheets' in document) {
+                const sheet = new CSSStyleSheet();
+                document.adoptedStyleSheets = [...document.adoptedStyleSheets, sheet];
+                DreamWebRuntime.sheet = sheet;
+            } else {
+                const style = document.createElement('style');
+                document.head.appendChild(style);
+                DreamWebRuntime.sheet = style.sheet;
+            }
+        }
+        return DreamWebRuntime.sheet;
+    }
+
+    // @feature Container
     // Style application methods
     applyContainerStyles(element, props) {
-        const styles = {
-            display: 'flex',
-            flexDirection: props.direction || 'column',
-            alignItems: this.mapAlign(props.align),
-            justifyContent: this.mapJustify(props.justify),
-        };
-
-        if (props.width) styles.width = this.parseSize(props.width);
-        if (props.height) styles.height = this.parseSize(props.height);
-        if (props.padding) styles.padding = this.parseSpacing(props.padding);
-        if (props.margin) styles.margin = this.parseSpacing(props.margin);
-        if (props.background) styles.background = this.parseColor(props.background);
-        if (props.border) this.applyBorder(element, props.border);
-        if (props.rounded) styles.borderRadius = this.parseRounded(props.rounded);
-        if (props.shadow) styles.boxShadow = this.parseShadow(props.shadow);
+        const key = ['Container', props.direction, props.align, props.justify, props.width, props.height,
+            props.padding, props.margin, props.background, props.border, props.rounded, props.shadow];
+        this.styleClass(element, key, () => {
+            const styles = {
+                display: 'flex',
+                flexDirection: props.direction || 'column',
+                alignItems: this.mapAlign(props.align),
+                justifyContent: this.mapJustify(props.justify),
+            };
 
-        Object.assign(element.style, styles);
+            if (props.width) styles.width = this.parseSize(props.width);
+            if (props.height) styles.height = this.parseSize(props.height);
+            if (props.padding) styles.padding = this.parseSpacing(props.padding);
+            if (props.margin) styles.margin = this.parseSpacing(props.margin);
+            if (props.background) styles.background = this.parseColor(props.background);
+            if (props.border) styles.border = this.parseBorder(props.border);
+            if (props.rounded) styles.borderRadius = this.parseRounded(props.rounded);
+            if (props.shadow) styles.boxShadow = this.parseShadow(props.shadow);
+            return styles;
+        });
     }
+    // @end
 
+    // @feature Row
     applyRowStyles(element, props) {
-        const styles = {
+        this.styleClass(element, ['Row', props.align, props.justify, props.spacing, props.wrap], () => ({
             display: 'flex',
             flexDirection: 'row',
             alignItems: this.mapAlign(props.align),
             justifyContent: this.mapJustify(props.justify),
             gap: `${props.spacing || 0}px`,
             flexWrap: props.wrap ? 'wrap' : 'nowrap'
-        };
-        Object.assign(element.style, styles);
+        }));
     }
+    // @end
 
+    // @feature Column
     applyColumnStyles(element, props) {
-        const styles = {
+        this.styleClass(element, ['Column', props.align, props.justify, props.spacing], () => ({
             display: 'flex',
             flexDirection: 'column',
             alignItems: this.mapAlign(props.align),
             justifyContent: this.mapJustify(props.justify),
             gap: `${props.spacing || 0}px`
-        };
-        Object.assign(element.style, styles);
+        }));
     }
+    // @end
 
+    // @feature Text Heading
     applyTextStyles(element, props) {
-        const styles = {};
-
-        if (props.size) styles.fontSize = this.parseFontSize(props.size);
-        if (props.weight) styles.fontWeight = this.parseFontWeight(props.weight);
-        if (props.color) styles.color = this.parseColor(props.color);
-        if (props.align) styles.textAlign = props.align;
-        if (props.italic) styles.fontStyle = 'italic';
-        if (props.underline) styles.textDecoration = 'underline';
-        if (props.font) styles.fontFamily = props.font;
-
-        Object.assign(element.style, styles);
+        const key = ['Text', props.size, props.weight, props.color, props.align, props.italic,
+            props.underline, props.font];
+        this.styleClass(element, key, () => {
+            const styles = {};
+
+            if (props.size) styles.fontSize = this.parseFontSize(props.size);
+            if (props.weight) styles.fontWeight = this.parseFontWeight(props.weight);
+            if (props.color) styles.color = this.parseColor(props.color);
+            if (props.align) styles.textAlign = props.align;
+            if (props.italic) styles.fontStyle = 'italic';
+            if (props.underline) styles.textDecoration = 'underline';
+            if (props.font) styles.fontFamily = props.font;
+            return styles;
+        });
     }
+    // @end
 
+    // @feature Button
     // Widget creation methods
     createButton(component) {
         const button = document.createElement('button');
         button.textContent = component.props.text;
 
-        const styles = {
-            padding: this.parseButtonSize(component.props.size),
-            fontSize: this.parseButtonFontSize(component.props.size),
-            borderRadius: component.props.rounded ? '0.375rem' : '0',
+        if (component.css !== undefined) return button;
+
+        const { size, rounded, disabled, color, variant } = component.props;
+        // Hover effect, as a rule of the button's class rather than listeners
+        const hover = disabled ? null : {
+            ':hover': { transform: 'translateY(-1px)', boxShadow: '0 4px 6px rgba(0,0,0,0.1)' }
+        };
+        this.styleClass(button, ['Button', size, rounded, disabled, color, variant], () => ({
+            padding: this.parseButtonSize(size),
+            fontSize: this.parseButtonFontSize(size),
+            borderRadius: rounded ? '0.375rem' : '0',
             border: 'none',
-            cursor: component.props.disabled ? 'not-allowed' : 'pointer',
-            opacity: component.props.disabled ? '0.5' : '1',
+            cursor: disabled ? 'not-allowed' : 'pointer',
+            opacity: disabled ? '0.5' : '1',
             fontWeight: '500',
-            transition: 'all 0.2s'
-        };
-
-        // Apply variant styles
-        const colors = this.getButtonColors(component.props.color, component.props.variant);
-        Object.assign(styles, colors);
-        Object.assign(button.style, styles);
-
-        // Hover effect
-        if (!component.props.disabled) {
-            button.addEventListener('mouseenter', () => {
-                button.style.transform = 'translateY(-1px)';
-                button.style.boxShadow = '0 4px 6px rgba(0,0,0,0.1)';
-            });
-            button.addEventListener('mouseleave', () => {
-                button.style.transform = 'translateY(0)';
-                button.style.boxShadow = 'none';
-            });
-        }
+            transition: 'all 0.2s',
+            // Apply variant styles
+            ...this.getButtonColors(color, variant)
+        }), hover);
 
         return button;
     }
+    // @end
 
+    // @feature TextField
     createTextField(component) {
         const input = document.createElement('input');
         input.type = component.props.type || 'text';
@@ -245,34 +393,134 @@ class DreamWebRuntime {
         input.value = component.props.value || '';
         input.disabled = component.props.disabled || false;
 
-        const styles = {
+        this.styleClass(input, ['TextField'], () => ({
             padding: '0.5rem 0.75rem',
             fontSize: '1rem',
             border: '1px solid #d1d5db',
             borderRadius: '0.375rem',
             outline: 'none',
             transition: 'all 0.2s'
-        };
-        Object.assign(input.style, styles);
-
-        input.addEventListener('focus', () => {
-            input.style.borderColor = '#3b82f6';
-            input.style.boxShadow = '0 0 0 3px rgba(59, 130, 246, 0.1)';
-        });
-        input.addEventListener('blur', () => {
-            input.style.borderColor = '#d1d5db';
-            input.style.boxShadow = 'none';
+        }), {
+            ':focus': { borderColor: '#3b82f6', boxShadow: '0 0 0 3px rgba(59, 130, 246, 0.1)' }
         });
 
+        if (component.bind) {
+            this.bindInput(input, component.bind, component.props.value);
+        }
+
+        return input;
+    }
+    // @end
+
+    // @feature Slider
+    createSlider(component) {
+        const input = document.createElement('input');
+        input.type = 'range';
+        input.min = component.props.min;
+        input.max = component.props.max;
+        input.step = component.props.step;
+        input.value = component.props.value;
+        input.disabled = component.props.disabled || false;
+
+        if (component.bind) {
+            this.bindInput(input, component.bind, component.props.value);
+        }
+
         return input;
     }
+    // @end
+
+    // @feature TextField Slider
+    // Two-way binding
+    // A bound input's live value belongs to the browser. Edits reach the
+    // server after a pause in typing, or at once when the input commits
+    // (blur, slider release). Trees from the server only replace the value
+    // when the app changed the State itself: while this client has an edit
+    // pending or unacknowledged, their value is an echo of an older one.
+    bindInput(element, bindId, serverValue) {
+        let binding = this.bindings.get(bindId);
+        if (!binding) {
+            binding = { value: serverValue, sent: serverValue, timer: null, pending: null };
+            this.bindings.set(bindId, binding);
+        } else if (binding.timer === null && binding.pending === null) {
+            binding.value = binding.sent = serverValue;
+        }
+        element.value = binding.value;
+        element.setAttribute('data-dw-bind', bindId);
+        this.boundElements.set(bindId, element);
+
+        if (this.delegatedEvents.has('bind')) return;
+        this.delegatedEvents.add('bind');
+        this.root.addEventListener('input', (e) => this.bindingChanged(e.target, false));
+        this.root.addEventListener('change', (e) => this.bindingChanged(e.target, true));
+    }
+
+    bindingChanged(element, commit) {
+        const bindId = element.nodeType === 1 ? element.getAttribute('data-dw-bind') : null;
+        const binding = bindId && this.bindings.get(bindId);
+        if (!binding) return;
+
+        binding.value = this.inputValue(element);
+        clearTimeout(binding.timer);
+        binding.timer = null;
+        if (commit) {
+            this.sendBinding(bindId, binding);
+        } else {
+            binding.timer = setTimeout(() => {
+                binding.timer = null;
+                this.sendBinding(bindId, binding);
+            }, DreamWebRuntime.BIND_DELAY);
+        }
+    }
 
+    sendBinding(bindId, binding) {
+        if (binding.value === binding.sent) return;
+        binding.sent = binding.value;
+        if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+            // Every client receives the resulting update; the ID tells this
+            // one which update answers it
+            binding.pending = `${this.clientId}-${++this.bindSeq}`;
+            this.ws.send(JSON.stringify({ type: 'bind', bind: bindId, value: binding.value, id: binding.pending }));
+        }
+    }
+
+    // Re-rendering replaces the focused input; give focus and caret to its successor
+    focusedBinding() {
+        const element = document.activeElement;
+        const bindId = element && element.nodeType === 1 ? element.getAttribute('data-dw-bind') : null;
+        if (!bindId) return null;
+        let start = null, end = null;
+        try {
+            start = element.selectionStart;
+            end = element.selectionEnd;
+        } catch (e) {
+            // Input types without a caret
+        }
+        return { bindId, start, end };
+    }
+
+    restoreFocus({ bindId, start, end }) {
+        const element = this.boundElements.get(bindId);
+        if (!element) return;
+        element.focus();
+        if (start === null) return;
+        try {
+            element.setSelectionRange(start, end);
+        } catch (e) {
+            // Input types without a caret
+        }
+    }
+    // @end
+
+    // @feature Checkbox
     createCheckbox(component) {
         const label = document.createElement('label');
-        label.style.display = 'flex';
-        label.style.alignItems = 'center';
-        label.style.gap = '0.5rem';
-        label.style.cursor = 'pointer';
+        this.styleClass(label, ['Checkbox'], () => ({
+            display: 'flex',
+            alignItems: 'center',
+            gap: '0.5rem',
+            cursor: 'pointer'
+        }));
 
         const input = document.createElement('input');
         input.type = 'checkbox';
@@ -287,50 +535,85 @@ class DreamWebRuntime {
 
         return label;
     }
+    // @end
 
+    // @feature Image
     createImage(component) {
         const img = document.createElement('img');
         img.src = component.props.src;
         img.alt = component.props.alt || '';
 
-        const styles = {};
-        if (component.props.width) styles.width = this.parseSize(component.props.width);
-        if (component.props.height) styles.height = this.parseSize(component.props.height);
-        if (component.props.fit) styles.objectFit = component.props.fit;
-        if (component.props.rounded) styles.borderRadius = this.parseRounded(component.props.rounded);
+        if (component.css !== undefined) return img;
 
-        Object.assign(img.style, styles);
+        const { width, height, fit, rounded } = component.props;
+        this.styleClass(img, ['Image', width, height, fit, rounded], () => {
+            const styles = {};
+            if (width) styles.width = this.parseSize(width);
+            if (height) styles.height = this.parseSize(height);
+            if (fit) styles.objectFit = fit;
+            if (rounded) styles.borderRadius = this.parseRounded(rounded);
+            return styles;
+        });
         return img;
     }
+    // @end
 
+    // @feature Link
     createLink(component) {
         const a = document.createElement('a');
         a.href = component.props.to;
         a.textContent = component.props.text;
 
-        const styles = {
-            color: this.parseColor(component.props.color),
-            textDecoration: component.props.underline ? 'underline' : 'none'
-        };
-        Object.assign(a.style, styles);
+        if (component.css !== undefined) return a;
+
+        const { color, underline } = component.props;
+        this.styleClass(a, ['Link', color, underline], () => ({
+            color: this.parseColor(color),
+            textDecoration: underline ? 'underline' : 'none'
+        }));
 
         return a;
     }
+    // @end
 
     // Event handling
+    // Elements only carry their handler IDs in data-dw-<event> attributes;
+    // one listener per event type on the root dispatches for all of them,
+    // so rendering never adds listeners
     attachEvents(element, events) {
-        if (events.click) {
-            element.addEventListener('click', () => {
-                this.handleEvent('click', events.click);
-            });
-        }
-        if (events.change) {
-            element.addEventListener('change', (e) => {
-                this.handleEvent('change', events.change, e.target.value);
-            });
+        for (const eventType of DreamWebRuntime.DOM_EVENTS) {
+            if (events[eventType]) {
+                element.setAttribute(`data-dw-${eventType}`, events[eventType]);
+                this.delegate(eventType);
+            }
         }
     }
 
+    delegate(eventType) {
+        if (this.delegatedEvents.has(eventType)) return;
+        this.delegatedEvents.add(eventType);
+
+        const attribute = `data-dw-${eventType}`;
+        this.root.addEventListener(eventType, (e) => {
+            // Every element on the way up handles the event, as if it had
+            // its own listener and the event bubbled through it
+            for (let node = e.target; node && node !== this.root; node = node.parentNode) {
+                const handlerId = node.nodeType === 1 ? node.getAttribute(attribute) : null;
+                if (!handlerId) continue;
+                if (eventType === 'change') {
+                    this.handleEvent('change', handlerId, this.inputValue(e.target));
+                } else {
+                    this.handleEvent(eventType, handlerId);
+                }
+            }
+        });
+    }
+
+    // Sliders report numbers, like the values Python gave them
+    inputValue(element) {
+        return element.type === 'range' ? Number(element.value) : element.value;
+    }
+
     handleEvent(eventType, handlerId, value) {
         // Send event to Python backend
         if (this.ws && this.ws.readyState === WebSocket.OPEN) {
@@ -343,79 +626,94 @@ class DreamWebRuntime {
         }
     }
 
+    // @feature ApiRequest FetchData
     // Handle API requests
+    // Every render recreates the API nodes, so a request is only made when
+    // no node with the same parameters was in the previous render. Identical
+    // requests in flight are sent once; with cache_ttl (and
+    // stale_while_revalidate) a response also answers later ones.
     async handleApiRequest(component) {
-        const { url, method, headers, body, auto_fetch, credentials, callbacks } = component.props;
+        const { url, method, headers, body, auto_fetch, credentials } = component.props;
+        const events = component.events || {};
 
         // Only fetch if auto_fetch is true (default)
         if (auto_fetch === false) {
             return;
         }
 
-        try {
-            // Notify loading started
-            if (callbacks && callbacks.on_loading) {
-                this.handleEvent('api_loading', callbacks.on_loading, true);
-            }
-
-            // Prepare fetch options
-            const fetchOptions = {
-                method: (method || 'GET').toUpperCase(),
-                headers: {
-                    'Content-Type': 'application/json',
-                    ...(headers || {})
-                },
-                credentials: credentials || 'same-origin'
-            };
+        // Prepare fetch options
+        const fetchOptions = {
+            method: (method || 'GET').toUpperCase(),
+            headers: {
+                'Content-Type': 'application/json',
+                ...(headers || {})
+            },
+            credentials: credentials || 'same-origin'
+        };
 
-            // Add body if present (and not GET/HEAD)
-            if (body && !['GET', 'HEAD'].includes(fetchOptions.method)) {
-                if (typeof body === 'object') {
-                    fetchOptions.body = JSON.stringify(body);
-                } else {
-                    fetchOptions.body = body;
-                }
+        // Add body if present (and not GET/HEAD)
+        if (body && !['GET', 'HEAD'].includes(fetchOptions.method)) {
+            if (typeof body === 'object') {
+                fetchOptions.body = JSON.stringify(body);
+            } else {
+                fetchOptions.body = body;
             }
+        }
 
-            // Make the request
-            const response = await fetch(url, fetchOptions);
+        const key = JSON.stringify([url, fetchOptions.method, fetchOptions.headers, fetchOptions.body || null,
+            fetchOptions.credentials]);
+        this.apiKeys.add(key);
+        if (this.previousApiKeys.has(key)) {
+            // Already requested for this widget; Python has its response
+            return;
+        }
 
-            // Check if response is ok
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        const ttl = (component.props.cache_ttl || 0) * 1000;
+        const stale = ttl + (component.props.stale_while_revalidate || 0) * 1000;
+        const cached = DreamWebRuntime.apiCache.get(key);
+        const age = cached ? Date.now() - cached.time : Infinity;
+        if (age < stale) {
+            if (events.success) {
+                this.handleEvent('api_success', events.success, cached.data);
             }
+            if (age >= ttl) {
+                // Stale: answered from the cache, refreshed in the background
+                this.sharedApiRequest(key, url, fetchOptions, stale > 0)
+                    .then((data) => {
+                        if (events.success) this.handleEvent('api_success', events.success, data);
+                    })
+                    .catch((error) => console.error('DreamWeb API Request Error:', error));
+            }
+            return;
+        }
 
-            // Parse response
-            const contentType = response.headers.get('content-type');
-            let data;
-
-            if (contentType && contentType.includes('application/json')) {
-                data = await response.json();
-            } else if (contentType && contentType.includes('text/')) {
-                data = await response.text();
-            } else {
-                data = await response.blob();
+        try {
+            // Notify loading started
+            if (events.loading) {
+                this.handleEvent('api_loading', events.loading, true);
             }
 
+            const data = await this.sharedApiRequest(key, url, fetchOptions, stale > 0);
+
             // Notify loading finished
-            if (callbacks && callbacks.on_loading) {
-                this.handleEvent('api_loading', callbacks.on_loading, false);
+            if (events.loading) {
+                this.handleEvent('api_loading', events.loading, false);
             }
 
             // Call success callback
-            if (callbacks && callbacks.on_success) {
-                this.handleEvent('api_success', callbacks.on_success, data);
+            if (events.success) {
+                this.handleEvent('api_success', events.success, data);
             }
 
         } catch (error) {
             // Notify loading finished
-            if (callbacks && callbacks.on_loading) {
-                this.handleEvent('api_loading', callbacks.on_loading, false);
+            if (events.loading) {
+                this.handleEvent('api_loading', events.loading, false);
             }
 
             // Call error callback
-            if (callbacks && callbacks.on_error) {
-                this.handleEvent('api_error', callbacks.on_error, {
+            if (events.error) {
+                this.handleEvent('api_error', events.error, {
                     message: error.message,
                     name: error.name
                 });
@@ -425,6 +723,42 @@ class DreamWebRuntime {
         }
     }
 
+    // The response data for key, joining the request already in flight if any
+    sharedApiRequest(key, url, fetchOptions, cache) {
+        let request = DreamWebRuntime.apiRequests.get(key);
+        if (!request) {
+            request = this.fetchApiData(url, fetchOptions)
+                .then((data) => {
+                    if (cache) DreamWebRuntime.apiCache.set(key, { data, time: Date.now() });
+                    return data;
+                })
+                .finally(() => DreamWebRuntime.apiRequests.delete(key));
+            DreamWebRuntime.apiRequests.set(key, request);
+        }
+        return request;
+    }
+
+    async fetchApiData(url, fetchOptions) {
+        // Make the request
+        const response = await fetch(url, fetchOptions);
+
+        // Check if response is ok
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        // Parse response
+        const contentType = response.headers.get('content-type');
+        if (contentType && contentType.includes('application/json')) {
+            return response.json();
+        } else if (contentType && contentType.includes('text/')) {
+            return response.text();
+        }
+        return response.blob();
+    }
+    // @end
+
+    // @feature Container Image
     // Utility methods for parsing styles
     parseSize(size) {
         if (typeof size === 'number') return `${size}px`;
@@ -432,7 +766,9 @@ class DreamWebRuntime {
         if (size === 'auto') return 'auto';
         return size;
     }
+    // @end
 
+    // @feature Container
     parseSpacing(spacing) {
         if (typeof spacing === 'number') return `${spacing}px`;
         if (typeof spacing === 'object') {
@@ -441,26 +777,11 @@ class DreamWebRuntime {
         }
         return spacing;
     }
+    // @end
 
+    // @feature Container Text Heading Button Link
     parseColor(color) {
-        // Named colors
-        const colorMap = {
-            'primary': '#3b82f6',
-            'secondary': '#6b7280',
-            'success': '#10b981',
-            'danger': '#ef4444',
-            'warning': '#f59e0b',
-            'info': '#06b6d4',
-            'black': '#000000',
-            'white': '#ffffff',
-            'gray': '#6b7280',
-            'red': '#ef4444',
-            'blue': '#3b82f6',
-            'green': '#10b981',
-            'yellow': '#f59e0b',
-            'purple': '#8b5cf6',
-            'pink': '#ec4899',
-        };
+        const colorMap = DreamWebRuntime.COLORS;
 
         // Gradients
         if (color && color.startsWith('gradient-')) {
@@ -474,69 +795,49 @@ class DreamWebRuntime {
 
         return colorMap[color] || color;
     }
+    // @end
 
+    // @feature Text Heading
     parseFontSize(size) {
-        const sizeMap = {
-            'xs': '0.75rem',
-            'sm': '0.875rem',
-            'md': '1rem',
-            'lg': '1.125rem',
-            'xl': '1.25rem',
-            '2xl': '1.5rem',
-            '3xl': '1.875rem',
-            '4xl': '2.25rem',
-        };
-        return sizeMap[size] || (typeof size === 'number' ? `${size}px` : size);
+        return DreamWebRuntime.FONT_SIZES[size] || (typeof size === 'number' ? `${size}px` : size);
     }
+    // @end
 
+    // @feature Text Heading
     parseFontWeight(weight) {
-        const weightMap = {
-            'normal': '400',
-            'medium': '500',
-            'semibold': '600',
-            'bold': '700',
-        };
-        return weightMap[weight] || weight;
+        return DreamWebRuntime.FONT_WEIGHTS[weight] || weight;
     }
+    // @end
 
+    // @feature Container Image
     parseRounded(rounded) {
         if (typeof rounded === 'boolean') return rounded ? '0.375rem' : '0';
         if (typeof rounded === 'number') return `${rounded}px`;
         return rounded;
     }
+    // @end
 
+    // @feature Container
     parseShadow(shadow) {
-        const shadowMap = {
-            'sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
-            'md': '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
-            'lg': '0 10px 15px -3px rgba(0, 0, 0, 0.1)',
-            'xl': '0 20px 25px -5px rgba(0, 0, 0, 0.1)',
-            '2xl': '0 25px 50px -12px rgba(0, 0, 0, 0.25)',
-            'none': 'none'
-        };
-        return shadowMap[shadow] || shadow;
+        return DreamWebRuntime.SHADOWS[shadow] || shadow;
     }
+    // @end
 
+    // @feature Button
     parseButtonSize(size) {
-        const sizeMap = {
-            'sm': '0.5rem 1rem',
-            'md': '0.625rem 1.25rem',
-            'lg': '0.75rem 1.5rem',
-            'xl': '1rem 2rem',
-        };
+        const sizeMap = DreamWebRuntime.BUTTON_PADDINGS;
         return sizeMap[size] || sizeMap['md'];
     }
+    // @end
 
+    // @feature Button
     parseButtonFontSize(size) {
-        const sizeMap = {
-            'sm': '0.875rem',
-            'md': '1rem',
-            'lg': '1.125rem',
-            'xl': '1.25rem',
-        };
+        const sizeMap = DreamWebRuntime.BUTTON_FONT_SIZES;
         return sizeMap[size] || sizeMap['md'];
     }
+    // @end
 
+    // @feature Button
     getButtonColors(color, variant) {
         const baseColor = this.parseColor(color);
 
@@ -568,39 +869,35 @@ class DreamWebRuntime {
             };
         }
     }
+    // @end
 
-    applyBorder(element, border) {
+    // @feature Container
+    parseBorder(border) {
         if (typeof border === 'number') {
-            element.style.border = `${border}px solid #d1d5db`;
+            return `${border}px solid #d1d5db`;
         } else if (typeof border === 'object') {
             const width = border.width || 1;
             const color = border.color || '#d1d5db';
             const style = border.style || 'solid';
-            element.style.border = `${width}px ${style} ${color}`;
+            return `${width}px ${style} ${color}`;
         }
+        return '';
     }
+    // @end
 
+    // @feature Container Row Column
     mapAlign(align) {
-        const map = {
-            'start': 'flex-start',
-            'center': 'center',
-            'end': 'flex-end',
-            'stretch': 'stretch'
-        };
-        return map[align] || 'stretch';
+        return DreamWebRuntime.ALIGN[align] || 'stretch';
     }
+    // @end
 
+    // @feature Container Row Column
     mapJustify(justify) {
-        const map = {
-            'start': 'flex-start',
-            'center': 'center',
-            'end': 'flex-end',
-            'between': 'space-between',
-            'around': 'space-around'
-        };
-        return map[justify] || 'flex-start';
+        return DreamWebRuntime.JUSTIFY[justify] || 'flex-start';
     }
+    // @end
 
+    // @feature hot-reload
     // Hot reload support
     setupHotReload() {
         if (window.location.hostname === 'localhost' || window.location.hostname === '127.0.0.1') {
@@ -611,20 +908,152 @@ class DreamWebRuntime {
             this.ws.onmessage = (event) => {
                 const data = JSON.parse(event.data);
                 if (data.type === 'reload') {
-                    this.componentTree = data.tree;
-                    this.render();
-                    console.log('🔄 Hot reload applied');
+                    if (data.event !== undefined) this.acknowledgeBinding(data.event);
+                    this.scheduleRender(data.tree);
+                }
+            };
+
+            this.ws.onopen = () => {
+                // The dev server restarted, possibly with new code; load the fresh page
+                if (this.devServerLost) {
+                    window.location.reload();
                 }
             };
 
             this.ws.onclose = () => {
+                this.devServerLost = true;
                 console.log('🔌 Dev server disconnected');
                 setTimeout(() => this.setupHotReload(), 1000);
             };
         }
     }
+
+    // An update answering a bound input's edit: the server has its value now
+    acknowledgeBinding(id) {
+        for (const binding of this.bindings.values()) {
+            if (binding.pending === id) binding.pending = null;
+        }
+    }
+
+    // Render at most once per frame: trees that arrive before the frame
+    // are replaced by the newest one, which is the only one rendered
+    scheduleRender(tree) {
+        const queued = this.pendingTree !== null;
+        this.pendingTree = tree;
+        if (queued) return;
+        requestAnimationFrame(() => {
+            this.componentTree = this.pendingTree;
+            this.pendingTree = null;
+            this.render();
+            console.log('🔄 Hot reload applied');
+        });
+    }
+    // @end
 }
 
+// Events users trigger on elements; other handler IDs (API callbacks) are fired by the runtime
+DreamWebRuntime.DOM_EVENTS = ['click', 'change'];
+
+// @feature TextField Slider
+// Pause in typing, in ms, after which a bound input's value is sent
+DreamWebRuntime.BIND_DELAY = 250;
+// @end
+
+// @feature ApiRequest FetchData
+// API responses by request key, and the requests in flight; shared by every runtime on the page
+DreamWebRuntime.apiCache = new Map();
+DreamWebRuntime.apiRequests = new Map();
+// @end
+
+// Generated style classes by style key, shared by every runtime on the page
+DreamWebRuntime.styleClasses = new Map();
+DreamWebRuntime.sheet = null;
+
+// Lookup tables for the style helpers, built once instead of on every call
+// @feature Container Text Heading Button Link
+DreamWebRuntime.COLORS = {
+    'primary': '#3b82f6',
+    'secondary': '#6b7280',
+    'success': '#10b981',
+    'danger': '#ef4444',
+    'warning': '#f59e0b',
+    'info': '#06b6d4',
+    'black': '#000000',
+    'white': '#ffffff',
+    'gray': '#6b7280',
+    'red': '#ef4444',
+    'blue': '#3b82f6',
+    'green': '#10b981',
+    'yellow': '#f59e0b',
+    'purple': '#8b5cf6',
+    'pink': '#ec4899',
+};
+// @end
+
+// @feature Text Heading
+DreamWebRuntime.FONT_SIZES = {
+    'xs': '0.75rem',
+    'sm': '0.875rem',
+    'md': '1rem',
+    'lg': '1.125rem',
+    'xl': '1.25rem',
+    '2xl': '1.5rem',
+    '3xl': '1.875rem',
+    '4xl': '2.25rem',
+};
+
+DreamWebRuntime.FONT_WEIGHTS = {
+    'normal': '400',
+    'medium': '500',
+    'semibold': '600',
+    'bold': '700',
+};
+// @end
+
+// @feature Container
+DreamWebRuntime.SHADOWS = {
+    'sm': '0 1px 2px 0 rgba(0, 0, 0, 0.05)',
+    'md': '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
+    'lg': '0 10px 15px -3px rgba(0, 0, 0, 0.1)',
+    'xl': '0 20px 25px -5px rgba(0, 0, 0, 0.1)',
+    '2xl': '0 25px 50px -12px rgba(0, 0, 0, 0.25)',
+    'none': 'none'
+};
+// @end
+
+// @feature Button
+DreamWebRuntime.BUTTON_PADDINGS = {
+    'sm': '0.5rem 1rem',
+    'md': '0.625rem 1.25rem',
+    'lg': '0.75rem 1.5rem',
+    'xl': '1rem 2rem',
+};
+
+DreamWebRuntime.BUTTON_FONT_SIZES = {
+    'sm': '0.875rem',
+    'md': '1rem',
+    'lg': '1.125rem',
+    'xl': '1.25rem',
+};
+// @end
+
+// @feature Container Row Column
+DreamWebRuntime.ALIGN = {
+    'start': 'flex-start',
+    'center': 'center',
+    'end': 'flex-end',
+    'stretch': 'stretch'
+};
+
+DreamWebRuntime.JUSTIFY = {
+    'start': 'flex-start',
+    'center': 'center',
+    'end': 'flex-end',
+    'between': 'space-between',
+    'around': 'space-around'
+};
+// @end
+
 // Initialize when DOM is ready
 if (typeof window !== 'undefined') {
     window.DreamWebRuntime = DreamWebRuntime;
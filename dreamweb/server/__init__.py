@@ -1,5 +1,32 @@
-"""Server module for DreamWeb"""
+"""Server module for DreamWeb
 
-from dreamweb.server.dev_server import DevServer
+The dev server needs asyncio, websockets and watchdog, so server modules
+are only imported when one of their names is first used.
+"""
 
-__all__ = ["DevServer"]
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dreamweb.server.dev_server import DevServer
+    from dreamweb.server.production import BuildHandler, serve
+    from dreamweb.server.reloader import Reloader
+
+_MODULES = {
+    'DevServer': 'dreamweb.server.dev_server',
+    'BuildHandler': 'dreamweb.server.production',
+    'serve': 'dreamweb.server.production',
+    'Reloader': 'dreamweb.server.reloader',
+}
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["BuildHandler", "DevServer", "Reloader", "serve"]
@@ -6,16 +6,18 @@ import os
 import json
 import threading
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from typing import TYPE_CHECKING
 
+from dreamweb.server.static import StaticFileHandler
+
 if TYPE_CHECKING:
     from dreamweb.core import App
 
 
-class DreamWebHandler(SimpleHTTPRequestHandler):
+class DreamWebHandler(StaticFileHandler):
     """Custom HTTP handler for dev server"""
     
     app_instance = None
@@ -42,13 +44,15 @@ class DreamWebHandler(SimpleHTTPRequestHandler):
             with open(runtime_path, 'r') as f:
                 self.wfile.write(f.read().encode())
         else:
-            super().do_GET()
+            # Project assets (images, video, ...) with ranges and validators
+            self.serve_static()
     
     def generate_html(self):
         """Generate HTML with embedded app tree"""
         if not self.app_instance:
             return "<html><body>No app instance</body></html>"
         
+        self.app_instance._bindings = {}
         tree = self.app_instance._widget_to_dict(self.app_instance.build())
         
         return f"""<!DOCTYPE html>
@@ -109,17 +113,21 @@ from threading import Thread
 class DevServer:
     """Development server with hot reload"""
     
-    def __init__(self, app: 'App', port: int = 8000, host: str = "localhost"):
+    def __init__(self, app: 'App', port: int = 8000, host: str = "localhost", watch: bool = True,
+                 banner: bool = True):
         self.app = app
         self.port = port
         self.host = host
+        self.watch = watch
+        self.banner = banner
         self.observer = None
         self.ws_clients = set()
         self.loop = None
     
     def start(self):
         """Start the dev server"""
-        print(f"""
+        if self.banner:
+            print(f"""
 ╔══════════════════════════════════════════════════════════╗
 ║                                                          ║
 ║   🚀 DreamWeb Dev Server                                ║
@@ -135,7 +143,8 @@ class DevServer:
         DreamWebHandler.app_instance = self.app
         
         # Start file watcher
-        self.start_file_watcher()
+        if self.watch:
+            self.start_file_watcher()
         
         # Start HTTP server in a separate thread
         http_thread = Thread(target=self._run_http_server)
@@ -147,7 +156,8 @@ class DevServer:
     
     def _run_http_server(self):
         """Run HTTP server"""
-        server = HTTPServer((self.host, self.port), DreamWebHandler)
+        # Threaded so a long media download doesn't stall page loads
+        server = ThreadingHTTPServer((self.host, self.port), DreamWebHandler)
         server.serve_forever()
     
     def _run_ws_server(self):
@@ -174,6 +184,8 @@ class DevServer:
                 if data['type'] == 'event':
                     # Handle event
                     await self._handle_event(data)
+                elif data['type'] == 'bind':
+                    await self._handle_bind(data)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
@@ -187,23 +199,38 @@ class DevServer:
         # Dispatch event to app
         if self.app._handle_event(handler_id, value):
             # If state changed, broadcast update
-            await self._broadcast_update()
+            await self._broadcast_update(event_id=data.get('id'))
+    
+    async def _handle_bind(self, data):
+        """Sync a bound State with the input that owns its value"""
+        # Unknown IDs (e.g. from a tree rendered before a reload) set nothing
+        self.app._handle_bind(data.get('bind'), data.get('value'))
+        # Always answered, even if nothing changed: the sender waits for
+        # its update to come back before trusting the server's value again
+        await self._broadcast_update(event_id=data.get('id'))
     
-    async def _broadcast_update(self):
+    async def _broadcast_update(self, event_id=None):
         """Broadcast app update to all clients"""
         if not self.ws_clients:
             return
             
+        # Bindings follow the latest tree
+        self.app._bindings = {}
         tree = self.app._widget_to_dict(self.app.build())
-        message = json.dumps({
+        update = {
             'type': 'reload',
             'tree': tree
-        })
+        }
+        if event_id is not None:
+            # Lets a client match the update to the event that caused it
+            update['event'] = event_id
+        message = json.dumps(update)
         
-        # Create tasks for sending to all clients
-        tasks = [asyncio.create_task(client.send(message)) for client in self.ws_clients]
-        if tasks:
-            await asyncio.wait(tasks)
+        # Send to all clients; ones that disconnected mid-send are dropped
+        # by _handle_ws, so their errors are collected rather than raised
+        sends = [client.send(message) for client in list(self.ws_clients)]
+        if sends:
+            await asyncio.gather(*sends, return_exceptions=True)
     
     def start_file_watcher(self):
         """Start watching for file changes"""
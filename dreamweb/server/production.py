@@ -0,0 +1,128 @@
+"""
+Production server for DreamWeb build output
+Serves a Builder output directory with the caching and compression a CDN would apply
+"""
+
+import json
+import os
+import threading
+from functools import partial
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import unquote
+
+from dreamweb.builder_module.builder import ASSET_MANIFEST
+from dreamweb.builder_module.compress import compressible
+from dreamweb.server.static import StaticFileHandler
+
+
+# Hashed filenames change whenever their content does
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# Pages, the manifest and the service worker must pick up new deploys
+REVALIDATE = 'no-cache'
+
+
+def accepts_gzip(header: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows a gzip response"""
+    if not header:
+        return False
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        if coding.strip().lower() not in ('gzip', '*'):
+            continue
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class BuildHandler(StaticFileHandler):
+    """Serve build output: immutable hashed assets, precompressed .gz siblings
+
+    Files named in the build's manifest.json are cached for a year; every
+    other file revalidates with its ETag. When the client accepts gzip and
+    the build wrote a .gz sibling, the sibling is sent instead.
+    """
+
+    # Keep-alive, like a production host; every response has a Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Builds can be served while `dreamweb build --watch` rewrites them
+    meta_ttl = 0.5
+
+    _manifests: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+    _manifest_lock = threading.Lock()
+
+    def serve_static(self, head: bool = False):
+        # Dotfiles (e.g. a stray .env or an old build's .dreamweb-cache.json) aren't part of the site
+        segments = unquote(self.path.split('?', 1)[0].split('#', 1)[0]).split('/')
+        if any(segment.startswith('.') and segment != '.well-known' for segment in segments):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split('?', 1)[0].endswith('/'):
+                # Let the stdlib redirect /docs to /docs/
+                super().serve_static(head)
+                return
+            path = os.path.join(path, 'index.html')
+
+        # Ranges address the identity encoding, so they always get the original
+        gzipped = path + '.gz'
+        if ('Range' not in self.headers and compressible(path)
+                and accepts_gzip(self.headers.get('Accept-Encoding'))
+                and self.file_meta(gzipped) is not None):
+            self.send_static(path, head, source=gzipped, encoding='gzip')
+        else:
+            self.send_static(path, head)
+
+    def hashed_files(self) -> FrozenSet[str]:
+        """Content-hashed files of the build, relative to its directory"""
+        manifest = os.path.join(self.directory, ASSET_MANIFEST)
+        meta = self.file_meta(manifest)
+        if meta is None:
+            return frozenset()
+        cached = self._manifests.get(manifest)
+        if cached and cached[0] == meta.mtime_ns:
+            return cached[1]
+        try:
+            with open(manifest, 'r') as f:
+                files = frozenset(json.load(f).values())
+        except (OSError, ValueError):
+            return frozenset()
+        with self._manifest_lock:
+            self._manifests[manifest] = (meta.mtime_ns, files)
+        return files
+
+    def cache_headers(self, path: str) -> Dict[str, str]:
+        name = os.path.relpath(path, self.directory).replace(os.sep, '/')
+        headers = {'Cache-Control': IMMUTABLE if name in self.hashed_files() else REVALIDATE}
+        if compressible(path):
+            headers['Vary'] = 'Accept-Encoding'
+        return headers
+
+    def log_message(self, format, *args):
+        print(f"[serve] {format % args}")
+
+
+def serve(directory: str = "build", port: int = 8080, host: str = "localhost"):
+    """Serve a build directory until interrupted"""
+    directory = os.path.abspath(directory)
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"{directory} not found! Run `dreamweb build` first.")
+
+    handler = partial(BuildHandler, directory=directory)
+    # Threaded so a slow client can't stall other requests
+    with ThreadingHTTPServer((host, port), handler) as server:
+        print(f"🌐 Serving {directory} at http://{host}:{port}")
+        if not os.path.exists(os.path.join(directory, ASSET_MANIFEST)):
+            print("⚠️  No manifest.json; build with hash_filenames=True to cache assets as immutable")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
@@ -0,0 +1,200 @@
+"""
+Pre-forked reloader for the DreamWeb dev server
+
+The supervisor imports DreamWeb and the server's dependencies once, then
+forks a single-threaded template process before it starts any threads.
+On every change the template forks a fresh server child, which only has
+to import the project's own modules. Reloads skip interpreter startup
+and framework imports entirely.
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Optional, Set
+
+
+RESTART = b'r'
+
+
+class _ChangeCollector:
+    """Watchdog handler that records changed .py files for the reloader"""
+
+    WRITE_EVENTS = ('created', 'modified', 'moved')
+    IGNORED_DIRS = {'__pycache__', '.git', '.venv', 'venv', 'node_modules'}
+
+    def __init__(self, reloader: 'Reloader'):
+        self.reloader = reloader
+
+    def dispatch(self, event):
+        # Importing the app opens its sources too; only writes count as changes
+        if event.is_directory or event.event_type not in self.WRITE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if path and path.endswith('.py') and not self.IGNORED_DIRS.intersection(Path(path).parts):
+                self.reloader.notify(Path(path))
+
+
+class Reloader:
+    """Serve an app in a forked child and restart the child when code changes
+
+    Requires os.fork, so it's only available on POSIX systems.
+    """
+
+    def __init__(self, app_path: str = "main.py", port: int = 8000, host: str = "localhost",
+                 debounce: float = 0.1):
+        self.app_path = Path(app_path).resolve()
+        self.project_dir = self.app_path.parent
+        self.port = port
+        self.host = host
+        self.debounce = debounce
+        self._pipe: Optional[int] = None
+        self._template: Optional[int] = None
+        self._changed: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def notify(self, path: Path):
+        with self._lock:
+            self._changed.add(path)
+        self._wake.set()
+
+    def run(self):
+        """Serve the app, restarting it on every change until interrupted"""
+        # Everything a server child needs is imported here, once, and shared
+        # with every child through fork
+        import importlib
+        import dreamweb.cli.loader  # noqa: F401
+        import dreamweb.server.dev_server  # noqa: F401
+        import dreamweb.widgets
+        from watchdog.observers import Observer
+
+        # dreamweb.widgets loads its modules on first use; load them all now
+        for module in sorted(set(dreamweb.widgets._MODULES.values())):
+            importlib.import_module(f"dreamweb.widgets.{module}")
+
+        # The template must be forked before the observer starts its threads
+        self._fork_template()
+
+        observer = Observer()
+        observer.schedule(_ChangeCollector(self), str(self.project_dir), recursive=True)
+        observer.start()
+        print(f"👀 Watching for changes in: {self.project_dir}")
+
+        try:
+            while True:
+                self._wake.wait()
+                # Editors often write a file several times; wait for them to settle
+                while self._wake.wait(self.debounce):
+                    self._wake.clear()
+                with self._lock:
+                    changed, self._changed = self._changed, set()
+                if changed:
+                    names = ', '.join(sorted(path.name for path in changed))
+                    print(f"🔄 Changed: {names}")
+                    self.restart()
+        except KeyboardInterrupt:
+            print("\n👋 Dev server stopped")
+        finally:
+            observer.stop()
+            observer.join()
+            self._stop_template()
+
+    def restart(self):
+        """Replace the running server child with one running the current code"""
+        try:
+            os.write(self._pipe, RESTART)
+        except BrokenPipeError:
+            # The template died (e.g. killed from outside); start over
+            self._stop_template()
+            self._fork_template()
+
+    def _fork_template(self):
+        read, write = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(write)
+            try:
+                self._template_loop(read)
+            finally:
+                os._exit(0)
+        os.close(read)
+        self._pipe = write
+        self._template = pid
+        # Start the first server child
+        os.write(write, RESTART)
+
+    def _stop_template(self):
+        if self._pipe is not None:
+            # EOF tells the template to stop its child and exit
+            os.close(self._pipe)
+            self._pipe = None
+        if self._template is not None:
+            try:
+                os.waitpid(self._template, 0)
+            except ChildProcessError:
+                pass
+            self._template = None
+
+    def _template_loop(self, commands: int):
+        # Ctrl+C reaches the whole process group; the supervisor decides when to stop
+        interrupt = signal.signal(signal.SIGINT, signal.SIG_IGN)
+        child = None
+        generation = 0
+        while True:
+            command = os.read(commands, 1)
+            if child:
+                _stop(child)
+                child = None
+            if command != RESTART:
+                return
+            generation += 1
+            child = os.fork()
+            if child == 0:
+                os.close(commands)
+                signal.signal(signal.SIGINT, interrupt)
+                code = self._serve(reloaded=generation > 1)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+
+    def _serve(self, reloaded: bool) -> int:
+        """Body of a server child; returns its exit code"""
+        from dreamweb.cli.loader import load_app
+        from dreamweb.server.dev_server import DevServer
+
+        started = time.perf_counter()
+        try:
+            app = load_app(str(self.app_path))
+        except Exception:
+            traceback.print_exc()
+            print("❌ Reload failed; waiting for changes...")
+            return 1
+
+        server = DevServer(app, port=self.port, host=self.host, watch=False, banner=not reloaded)
+        if reloaded:
+            print(f"⚡ Reloaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+        try:
+            server.start()
+        except OSError as e:
+            print(f"❌ Could not start the dev server: {e}")
+            return 1
+        return 0
+
+
+def _stop(pid: int):
+    """Terminate a server child and wait for it, so its ports are free again"""
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    try:
+        os.waitpid(pid, 0)
+    except ChildProcessError:
+        pass
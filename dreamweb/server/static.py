@@ -0,0 +1,268 @@
+"""
+Static file serving for DreamWeb
+Serves project assets zero-copy with byte ranges and conditional requests
+"""
+
+import email.utils
+import errno
+import mmap
+import os
+import stat
+import sys
+import threading
+import time
+from datetime import timezone
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+# errno values meaning "sendfile can't be used here", not "the copy failed"
+_SENDFILE_UNSUPPORTED = {
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+}
+
+
+class FileMeta(NamedTuple):
+    """Cached metadata for a static file"""
+    size: int
+    mtime: float
+    mtime_ns: int
+    etag: str
+    last_modified: str
+    content_type: str
+
+
+class _UnsatisfiableRange(Exception):
+    """Raised when a Range header can't be served for the file"""
+
+
+class StaticFileHandler(SimpleHTTPRequestHandler):
+    """HTTP handler serving files with sendfile, ranges and validators"""
+
+    # Seconds a cached stat result is trusted before the file is checked again
+    meta_ttl = 1.0
+    meta_cache_size = 4096
+
+    _meta_cache: Dict[str, Tuple[float, FileMeta]] = {}
+    _meta_lock = threading.Lock()
+
+    def do_GET(self):
+        self.serve_static()
+
+    def do_HEAD(self):
+        self.serve_static(head=True)
+
+    def serve_static(self, head: bool = False):
+        """Serve the file the request path maps to"""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            # Directory listings and index.html lookup stay with the stdlib handler
+            if head:
+                super().do_HEAD()
+            else:
+                super().do_GET()
+            return
+        self.send_static(path, head)
+
+    def send_static(self, path: str, head: bool = False, source: Optional[str] = None,
+                    encoding: Optional[str] = None):
+        """Send a file, or an encoded copy of it from source (e.g. path + '.gz')"""
+        source = source or path
+        meta = self.file_meta(source) if not source.endswith('/') else None
+        if meta is None:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        if self.not_modified(meta):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_validators(path, meta)
+            self.end_headers()
+            return
+
+        try:
+            f = open(source, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return
+
+        with f:
+            # The cached entry may be up to meta_ttl old; trust the open file
+            st = os.fstat(f.fileno())
+            if st.st_size != meta.size or st.st_mtime_ns != meta.mtime_ns:
+                meta = self._remember(source, st)
+
+            try:
+                byte_range = self.parse_range(meta)
+            except _UnsatisfiableRange:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header('Content-Range', f'bytes */{meta.size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            if byte_range:
+                start, end = byte_range
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header('Content-Range', f'bytes {start}-{end}/{meta.size}')
+            else:
+                start, end = 0, meta.size - 1
+                self.send_response(HTTPStatus.OK)
+
+            length = end - start + 1
+            self.send_header('Content-Type', meta.content_type if source == path else self.guess_type(path))
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(length))
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_validators(path, meta)
+            self.end_headers()
+
+            if not head and length > 0:
+                self.send_file(f, start, length)
+
+    def file_meta(self, path: str) -> Optional[FileMeta]:
+        """Return cached metadata for a regular file, or None if missing"""
+        cached = self._meta_cache.get(path)
+        if cached and time.monotonic() - cached[0] < self.meta_ttl:
+            return cached[1]
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._meta_lock:
+                self._meta_cache.pop(path, None)
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return self._remember(path, st)
+
+    def _remember(self, path: str, st: os.stat_result) -> FileMeta:
+        cached = self._meta_cache.get(path)
+        if cached and cached[1].size == st.st_size and cached[1].mtime_ns == st.st_mtime_ns:
+            meta = cached[1]
+        else:
+            meta = FileMeta(
+                size=st.st_size,
+                mtime=st.st_mtime,
+                mtime_ns=st.st_mtime_ns,
+                etag=f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+                last_modified=email.utils.formatdate(st.st_mtime, usegmt=True),
+                content_type=self.guess_type(path),
+            )
+
+        with self._meta_lock:
+            if len(self._meta_cache) >= self.meta_cache_size:
+                self._meta_cache.clear()
+            self._meta_cache[path] = (time.monotonic(), meta)
+        return meta
+
+    def not_modified(self, meta: FileMeta) -> bool:
+        """Evaluate If-None-Match / If-Modified-Since against the file"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+            return self._etag_matches(if_none_match, meta.etag)
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return int(meta.mtime) <= since.timestamp()
+
+        return False
+
+    @staticmethod
+    def _etag_matches(header: str, etag: str) -> bool:
+        if header.strip() == '*':
+            return True
+        # Weak comparison: W/"x" matches "x"
+        candidates = (tag.strip() for tag in header.split(','))
+        return any(tag[2:] == etag if tag.startswith('W/') else tag == etag for tag in candidates)
+
+    def parse_range(self, meta: FileMeta) -> Optional[Tuple[int, int]]:
+        """Parse a single byte range into inclusive (start, end) offsets"""
+        header = self.headers.get('Range')
+        if not header or not header.startswith('bytes='):
+            return None
+
+        # A stale If-Range means the client wants the whole, current file
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range.strip() not in (meta.etag, meta.last_modified):
+            return None
+
+        spec = header[len('bytes='):].strip()
+        if ',' in spec:
+            # Multipart ranges aren't supported; the full entity is a valid reply
+            return None
+
+        first, sep, last = spec.partition('-')
+        if not sep:
+            return None
+
+        try:
+            if first == '':
+                suffix = int(last)
+                if suffix <= 0:
+                    raise _UnsatisfiableRange()
+                start, end = max(meta.size - suffix, 0), meta.size - 1
+            else:
+                start = int(first)
+                end = int(last) if last else None
+        except ValueError:
+            return None
+
+        # An invalid range (e.g. bytes=5-3) is ignored, not refused (RFC 9110 14.1.1)
+        if start < 0 or (end is not None and end < start):
+            return None
+        if start >= meta.size:
+            raise _UnsatisfiableRange()
+        return start, meta.size - 1 if end is None else min(end, meta.size - 1)
+
+    def send_validators(self, path: str, meta: FileMeta):
+        """Send ETag, Last-Modified and caching headers for a file"""
+        self.send_header('ETag', meta.etag)
+        self.send_header('Last-Modified', meta.last_modified)
+        for name, value in self.cache_headers(path).items():
+            self.send_header(name, value)
+
+    def cache_headers(self, path: str) -> Dict[str, str]:
+        """Caching headers for a file; dev assets always revalidate"""
+        return {'Cache-Control': 'no-cache'}
+
+    def send_file(self, f, offset: int, count: int):
+        """Copy count bytes of f starting at offset to the client"""
+        ssl = sys.modules.get('ssl')
+        encrypted = ssl is not None and isinstance(self.connection, ssl.SSLSocket)
+
+        if hasattr(os, 'sendfile') and not encrypted:
+            sock_fd = self.connection.fileno()
+            try:
+                while count > 0:
+                    sent = os.sendfile(sock_fd, f.fileno(), offset, count)
+                    if sent == 0:
+                        # File was truncated underneath us
+                        return
+                    offset += sent
+                    count -= sent
+                return
+            except OSError as e:
+                if e.errno not in _SENDFILE_UNSUPPORTED:
+                    raise
+
+        self._send_mapped(f, offset, count)
+
+    def _send_mapped(self, f, offset: int, count: int):
+        # mmap offsets must be a multiple of the allocation granularity
+        aligned = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(f.fileno(), count + offset - aligned, offset=aligned, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view, view[offset - aligned:] as chunk:
+                self.wfile.write(chunk)
@@ -1,54 +1,56 @@
 """
 Widgets for DreamWeb
+
+Widget modules are imported on first use, so `from dreamweb.widgets import
+Text` only loads the text widgets.
 """
 
-# Layout widgets
-from dreamweb.widgets.layout import (
-    Container,
-    Row,
-    Column,
-    Stack,
-    Center,
-    Spacer
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dreamweb.widgets.layout import Container, Row, Column, Stack, Center, Spacer
+    from dreamweb.widgets.text import Text, Heading
+    from dreamweb.widgets.input import Button, TextField, Checkbox, Radio, Select, Slider
+    from dreamweb.widgets.media import Image, Video, Icon
+    from dreamweb.widgets.navigation import Link
+    from dreamweb.widgets.advanced import Html, Css
+    from dreamweb.widgets.api import ApiRequest, FetchData
 
-# Text widgets
-from dreamweb.widgets.text import (
-    Text,
-    Heading
-)
+# Maps each widget to the module that defines it
+_MODULES = {
+    # Layout widgets
+    'Container': 'layout', 'Row': 'layout', 'Column': 'layout',
+    'Stack': 'layout', 'Center': 'layout', 'Spacer': 'layout',
+    # Text widgets
+    'Text': 'text', 'Heading': 'text',
+    # Input widgets
+    'Button': 'input', 'TextField': 'input', 'Checkbox': 'input',
+    'Radio': 'input', 'Select': 'input', 'Slider': 'input',
+    # Media widgets
+    'Image': 'media', 'Video': 'media', 'Icon': 'media',
+    # Navigation widgets
+    'Link': 'navigation',
+    # Advanced widgets
+    'Html': 'advanced', 'Css': 'advanced',
+    # API widgets
+    'ApiRequest': 'api', 'FetchData': 'api',
+}
 
-# Input widgets
-from dreamweb.widgets.input import (
-    Button,
-    TextField,
-    Checkbox,
-    Radio,
-    Select,
-    Slider
-)
 
-# Media widgets
-from dreamweb.widgets.media import (
-    Image,
-    Video,
-    Icon
-)
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    # Later lookups find the widget directly, without coming back here
+    globals()[name] = value
+    return value
 
-# Navigation widgets
-from dreamweb.widgets.navigation import Link
 
-# Advanced widgets
-from dreamweb.widgets.advanced import (
-    Html,
-    Css
-)
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
 
-# API widgets
-from dreamweb.widgets.api import (
-    ApiRequest,
-    FetchData
-)
 
 __all__ = [
     # Layout
@@ -20,6 +20,12 @@ class ApiRequest(Widget):
         on_loading: Callback function when loading state changes (receives boolean)
         auto_fetch: Whether to automatically fetch on mount (default: True)
         credentials: Include credentials (cookies) - "omit", "same-origin", or "include"
+        cache_ttl: Seconds a response answers identical requests without refetching (default: 0)
+        stale_while_revalidate: Seconds after cache_ttl that the cached response is still used
+            while a fresh one is fetched in the background (default: 0)
+
+    The request is sent when the widget first renders, and again only when
+    its url, method, headers, body or credentials change.
     
     Example:
         ```python
@@ -54,6 +60,8 @@ class ApiRequest(Widget):
         on_loading: Optional[Callable] = None,
         auto_fetch: bool = True,
         credentials: str = "same-origin",
+        cache_ttl: float = 0,
+        stale_while_revalidate: float = 0,
         **kwargs
     ):
         super().__init__(
@@ -66,27 +74,19 @@ class ApiRequest(Widget):
             on_loading=on_loading,
             auto_fetch=auto_fetch,
             credentials=credentials,
+            cache_ttl=cache_ttl,
+            stale_while_revalidate=stale_while_revalidate,
             **kwargs
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        # Filter out callback functions for serialization
+        # Callbacks reach the runtime as handler IDs in the node's events
         props = {k: v for k, v in self.props.items() 
                 if not callable(v)}
         
-        # Store callback references
-        callbacks = {}
-        if self.props.get('on_success'):
-            callbacks['on_success'] = id(self.props['on_success'])
-        if self.props.get('on_error'):
-            callbacks['on_error'] = id(self.props['on_error'])
-        if self.props.get('on_loading'):
-            callbacks['on_loading'] = id(self.props['on_loading'])
-        
         return {
             'type': 'ApiRequest',
             'props': props,
-            'callbacks': callbacks,
             'js_module': self.js_module
         }
 
@@ -101,6 +101,9 @@ class FetchData(Widget):
         on_success: Callback function when request succeeds
         on_error: Callback function when request fails
         auto_fetch: Whether to automatically fetch on mount (default: True)
+        cache_ttl: Seconds a response answers identical requests without refetching (default: 0)
+        stale_while_revalidate: Seconds after cache_ttl that the cached response is still used
+            while a fresh one is fetched in the background (default: 0)
     
     Example:
         ```python
@@ -123,6 +126,8 @@ class FetchData(Widget):
         on_success: Optional[Callable] = None,
         on_error: Optional[Callable] = None,
         auto_fetch: bool = True,
+        cache_ttl: float = 0,
+        stale_while_revalidate: float = 0,
         **kwargs
     ):
         super().__init__(
@@ -132,24 +137,18 @@ class FetchData(Widget):
             on_success=on_success,
             on_error=on_error,
             auto_fetch=auto_fetch,
+            cache_ttl=cache_ttl,
+            stale_while_revalidate=stale_while_revalidate,
             **kwargs
         )
     
     def to_dict(self) -> Dict[str, Any]:
-        # Filter out callback functions for serialization
+        # Callbacks reach the runtime as handler IDs in the node's events
         props = {k: v for k, v in self.props.items() 
                 if not callable(v)}
         
-        # Store callback references
-        callbacks = {}
-        if self.props.get('on_success'):
-            callbacks['on_success'] = id(self.props['on_success'])
-        if self.props.get('on_error'):
-            callbacks['on_error'] = id(self.props['on_error'])
-        
         return {
             'type': 'FetchData',
             'props': props,
-            'callbacks': callbacks,
             'js_module': self.js_module
         }
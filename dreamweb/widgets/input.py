@@ -3,6 +3,7 @@ Input widgets for DreamWeb
 """
 
 from typing import Any, Callable, Dict, List, Optional, Union
+from dreamweb.core.state import State
 from dreamweb.core.widget import Widget
 
 
@@ -53,7 +54,12 @@ class Button(Widget):
 
 
 class TextField(Widget):
-    """Text input field"""
+    """
+    Text input field
+
+    With bind=State, the browser owns the live value and keeps the State
+    in sync; value is then taken from the State.
+    """
     
     def __init__(
         self,
@@ -62,21 +68,23 @@ class TextField(Widget):
         type: str = "text",
         disabled: bool = False,
         on_change: Optional[Callable] = None,
+        bind: Optional[State] = None,
         **kwargs
     ):
         super().__init__(
             placeholder=placeholder,
-            value=value,
+            value=bind.value if bind is not None else value,
             type=type,
             disabled=disabled,
             on_change=on_change,
+            bind=bind,
             **kwargs
         )
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'type': 'TextField',
-            'props': {k: v for k, v in self.props.items() if k != 'on_change'}
+            'props': {k: v for k, v in self.props.items() if k not in ('on_change', 'bind')}
         }
 
 
@@ -161,7 +169,12 @@ class Select(Widget):
 
 
 class Slider(Widget):
-    """Slider widget"""
+    """
+    Slider widget
+
+    With bind=State, the browser owns the live value and keeps the State
+    in sync; value is then taken from the State.
+    """
     
     def __init__(
         self,
@@ -170,19 +183,21 @@ class Slider(Widget):
         max: float = 100,
         step: float = 1,
         on_change: Optional[Callable] = None,
+        bind: Optional[State] = None,
         **kwargs
     ):
         super().__init__(
-            value=value,
+            value=bind.value if bind is not None else value,
             min=min,
             max=max,
             step=step,
             on_change=on_change,
+            bind=bind,
             **kwargs
         )
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'type': 'Slider',
-            'props': {k: v for k, v in self.props.items() if k != 'on_change'}
+            'props': {k: v for k, v in self.props.items() if k not in ('on_change', 'bind')}
         }
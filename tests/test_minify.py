@@ -0,0 +1,46 @@
+"""Regression checks for the production JavaScript minifier"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from dreamweb.builder_module.minify import minify_js
+
+
+# Each snippet shadows an outer `counter` inside a function and prints
+# the outer one, which renaming must leave pointing at the global
+SHADOWING = {
+    'block': "var counter=5; function f(){ { let counter=1; } return counter; } console.log(f());",
+    'arrow parameter': "var counter=5; function f(){ [1].map(counter => counter); return counter; } console.log(f());",
+    'arrow parameter list': "var counter=5; function f(){ [1].map((counter) => { return counter; }); return counter; } console.log(f());",
+    'for let': "var counter=5; function f(){ for (let counter=0; counter<2; counter++) {} return counter; } console.log(f());",
+    'for let without braces': "var counter=5; function f(){ for (let counter=0; counter<2; counter++) counter; return counter; } console.log(f());",
+    'catch': "var counter=5; function f(){ try { throw 1 } catch (counter) { counter++ } return counter; } console.log(f());",
+    'function expression': "var counter=5; function f(){ const g = function counter(){}; return counter; } console.log(f());",
+}
+
+
+@pytest.mark.parametrize('source', SHADOWING.values(), ids=list(SHADOWING))
+def test_shadowed_names_keep_their_binding(source):
+    minified = minify_js(source)
+    assert 'return counter;' in minified
+
+
+def test_sibling_declarations_get_distinct_names():
+    source = "function f(){ let total=1; { let total=2; total++; } return total; }"
+    assert minify_js(source) == "function f(){let a=1;{let b=2;b++;}return a;}"
+
+
+def test_closure_sees_outer_binding():
+    source = "function f(){ let total=1; const g = () => total; { let total=10; return g() + total; } }"
+    assert minify_js(source) == "function f(){let a=1;const g=()=>a;{let c=10;return g()+c;}}"
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node is not installed")
+@pytest.mark.parametrize('source', SHADOWING.values(), ids=list(SHADOWING))
+def test_shadowing_runs_unchanged(source):
+    def run(code):
+        return subprocess.run(['node', '-e', code], capture_output=True, text=True, check=True).stdout
+
+    assert run(minify_js(source)) == run(source) == '5\n'